@@ -2,250 +2,85 @@
 
 from __future__ import annotations
 
-import logging
 import os
 import sys
 
 # Application version
 VERSION = "2.21.1"
 
-# Changelog - latest release notes (shown on welcome screen)
-CHANGELOG = [
-    {
-        "version": "2.21.1",
-        "date": "February 2026",
-        "highlights": [
-            "BT Locate map first-load fix with render stabilization retries during initial mode open",
-            "BT Locate trail restore optimization for faster startup when historical GPS points exist",
-            "BT Locate mode-switch map invalidation timing fix to prevent delayed/blank map render",
-        ]
-    },
-    {
-        "version": "2.21.0",
-        "date": "February 2026",
-        "highlights": [
-            "Global map theme refresh with improved contrast and cross-dashboard consistency",
-            "Cross-app UX updates for accessibility, mode consistency, and render performance",
-            "Weather satellite reliability fixes for auto-scheduler and Mercator pass tracking",
-            "Bluetooth/WiFi runtime health fixes with BT Locate continuity and confidence improvements",
-            "ADS-B/VDL2 streaming reliability upgrades for multi-client SSE fanout and remote decoding",
-            "Analytics enhancements with operational insights and temporal pattern panels",
-        ]
-    },
-    {
-        "version": "2.20.0",
-        "date": "February 2026",
-        "highlights": [
-            "Space Weather mode: real-time solar and geomagnetic monitoring from NOAA SWPC, NASA SDO, and HamQSL",
-            "Kp index, solar wind, X-ray flux charts with Chart.js visualization",
-            "HF band conditions, D-RAP absorption maps, aurora forecast, and solar imagery",
-            "NOAA Space Weather Scales (G/S/R), flare probability, and active solar regions",
-            "No SDR hardware required — all data from public APIs with server-side caching",
-        ]
-    },
-    {
-        "version": "2.19.0",
-        "date": "February 2026",
-        "highlights": [
-            "VDL2 mode with modal message viewer, consolidated into ADS-B dashboard",
-            "ADS-B: trails enabled by default, radar modes removed, CSV export added",
-            "Bundled Roboto Condensed font for offline mode with SVG icon overhaul",
-            "Help modal updated with all modes and correct SVG icons",
-            "Setup script overhauled for reliability and macOS compatibility",
-            "GPS fix for preserving satellites across DOP-only SKY messages",
-            "Fix gpsd deadlock causing GPS connect to hang",
-        ]
-    },
-    {
-        "version": "2.18.0",
-        "date": "February 2026",
-        "highlights": [
-            "Bluetooth: service data inspector, appearance codes, MAC cluster tracking, and behavioral flags",
-            "Bluetooth: IRK badge display, distance estimation with confidence, and signal stability metrics",
-            "ACARS: SoapySDR device support for SDRplay, LimeSDR, Airspy, and other non-RTL backends",
-            "ADS-B: stale dump1090 process cleanup via PID file tracking",
-            "GPS: error state indicator and UI refinements",
-            "Proximity radar and signal card UI improvements",
-        ]
-    },
-    {
-        "version": "2.17.0",
-        "date": "February 2026",
-        "highlights": [
-            "BT Locate: SAR Bluetooth device location with GPS-tagged signal trail and proximity alerts",
-            "IRK auto-detection: extract Identity Resolving Keys from paired devices (macOS/Linux)",
-            "GPS mode: real-time position tracking with live map, speed, altitude, and satellite info",
-            "Bluetooth scanner lifecycle fix for bleak scan timeout tracking",
-        ]
-    },
-    {
-        "version": "2.16.0",
-        "date": "February 2026",
-        "highlights": [
-            "Sub-GHz analyzer with real-time RF capture and protocol decoding",
-            "Weather satellite auto-scheduler with polar plot and ground track map",
-            "SatDump support for local (non-Docker) installs via setup.sh",
-            "Shared waterfall UI across SDR modes",
-            "Listening post audio stuttering fix and SDR race condition fixes",
-            "Multi-arch Docker build support (amd64 + arm64)",
-        ]
-    },
-    {
-        "version": "2.15.0",
-        "date": "February 2026",
-        "highlights": [
-            "Real-time WebSocket waterfall with I/Q capture and server-side FFT",
-            "Cross-module frequency routing from Listening Post to decoders",
-            "Pure Python SSTV decoder replacing broken slowrx dependency",
-            "Real-time signal scope for pager, sensor, and SSTV modes",
-            "USB-level device probe to prevent cryptic rtl_fm crashes",
-            "DMR dsd-fme protocol fixes, tuning controls, and state sync",
-            "SDR device lock-up fix from unreleased device registry on crash",
-        ]
-    },
-    {
-        "version": "2.14.0",
-        "date": "February 2026",
-        "highlights": [
-            "DMR/P25/NXDN/D-STAR digital voice decoder with dsd-fme",
-            "DMR visual synthesizer with event-driven spring-physics bars",
-            "HF SSTV general mode with predefined shortwave frequencies",
-            "WebSDR integration for remote HF/shortwave listening",
-            "Listening Post signal scanner and audio pipeline improvements",
-            "TSCM sweep resilience, WiFi detection, and correlation fixes",
-            "APRS rtl_fm startup and SDR device conflict fixes",
-        ]
-    },
-    {
-        "version": "2.13.1",
-        "date": "February 2026",
-        "highlights": [
-            "UI overhaul with slate/cyan theme and JetBrains Mono font",
-            "Signal scanner rewritten with rtl_power sweep and SNR filtering",
-            "Listening Post audio streaming via WAV with retry/fallback",
-            "WiFi connected clients panel now filters to selected AP",
-            "Global navigation bar across all dashboards",
-            "Fixed USB device contention when starting audio pipeline",
-        ]
-    },
-    {
-        "version": "2.13.0",
-        "date": "February 2026",
-        "highlights": [
-            "WiFi client display in AP detail drawer with real-time SSE updates",
-            "Help modal system with keyboard shortcuts reference",
-            "Global navbar and settings modal accessible from all dashboards",
-            "Probed SSID badges for connected clients",
-        ]
-    },
-    {
-        "version": "2.12.1",
-        "date": "February 2026",
-        "highlights": [
-            "SDR device registry to prevent decoder conflicts",
-            "SDR device status panel and ADS-B Bias-T toggle",
-            "Real-time Doppler tracking for ISS SSTV reception",
-            "TCP connection support for Meshtastic",
-            "Shared observer location with auto-start options",
-        ]
-    },
-    {
-        "version": "2.12.0",
-        "date": "January 2026",
-        "highlights": [
-            "ISS SSTV decoder with real-time ISS tracking globe",
-            "GitHub update notifications for new releases",
-            "Meshtastic QR code support and telemetry display",
-            "New Space category with reorganized UI",
-        ]
-    },
-    {
-        "version": "2.11.0",
-        "date": "January 2026",
-        "highlights": [
-            "Meshtastic LoRa mesh network integration",
-            "Ubertooth One BLE scanning support",
-            "Offline mode with bundled assets",
-            "Settings modal with tile provider configuration",
-        ]
-    },
-    {
-        "version": "2.10.0",
-        "date": "January 2026",
-        "highlights": [
-            "AIS vessel tracking with VHF DSC distress monitoring",
-            "Spy Stations database (number stations & diplomatic HF)",
-            "MMSI country identification and distress alert overlays",
-            "SDR device conflict detection for AIS/DSC",
-        ]
-    },
-    {
-        "version": "2.9.5",
-        "date": "January 2026",
-        "highlights": [
-            "Enhanced TSCM with MAC-randomization resistant detection",
-            "Clickable score cards and device detail expansion",
-            "RF scanning improvements with status feedback",
-            "Root privilege check and warning display",
-        ]
-    },
-    {
-        "version": "2.9.0",
-        "date": "January 2026",
-        "highlights": [
-            "New dropdown navigation menus for cleaner UI",
-            "TSCM baseline recording now captures device data",
-            "Device identity engine integration for threat detection",
-            "Welcome screen with mode selection",
-        ]
-    },
-    {
-        "version": "2.8.0",
-        "date": "December 2025",
-        "highlights": [
-            "Added TSCM counter-surveillance mode",
-            "WiFi/Bluetooth device correlation engine",
-            "Tracker detection (AirTag, Tile, SmartTag)",
-            "Risk scoring and threat classification",
-        ]
-    },
-]
+# Changelog lives in data/changelog.py and is exposed as config.CHANGELOG
+# on first access (see __getattr__ below)
+
+# Snapshot of INTERCEPT_* variables keyed without the prefix, taken once so
+# the settings below do plain dict lookups on a small mapping
+_ENV_PREFIX = 'INTERCEPT_'
+_ENV = {k[len(_ENV_PREFIX):]: v for k, v in os.environ.items() if k.startswith(_ENV_PREFIX)}
 
 
 def _get_env(key: str, default: str) -> str:
     """Get environment variable with default."""
-    return os.environ.get(f'INTERCEPT_{key}', default)
+    return _ENV.get(key, default)
 
 
 def _get_env_int(key: str, default: int) -> int:
     """Get environment variable as integer with default."""
+    val = _ENV.get(key)
+    if val is None:
+        return default
     try:
-        return int(os.environ.get(f'INTERCEPT_{key}', str(default)))
+        return int(val)
     except ValueError:
         return default
 
 
 def _get_env_float(key: str, default: float) -> float:
     """Get environment variable as float with default."""
+    val = _ENV.get(key)
+    if val is None:
+        return default
     try:
-        return float(os.environ.get(f'INTERCEPT_{key}', str(default)))
+        return float(val)
     except ValueError:
         return default
 
 
+# Accepted boolean spellings, including common casings so most values
+# match without lower-casing first
+_TRUE_VALUES = frozenset(('true', '1', 'yes', 'on', 'True', 'TRUE', 'Yes', 'YES', 'On', 'ON'))
+_FALSE_VALUES = frozenset(('false', '0', 'no', 'off', 'False', 'FALSE', 'No', 'NO', 'Off', 'OFF'))
+
+
 def _get_env_bool(key: str, default: bool) -> bool:
     """Get environment variable as boolean with default."""
-    val = os.environ.get(f'INTERCEPT_{key}', '').lower()
-    if val in ('true', '1', 'yes', 'on'):
+    val = _ENV.get(key)
+    if val is None:
+        return default
+    if val in _TRUE_VALUES:
         return True
-    if val in ('false', '0', 'no', 'off'):
+    if val in _FALSE_VALUES:
+        return False
+    val = val.lower()
+    if val in _TRUE_VALUES:
+        return True
+    if val in _FALSE_VALUES:
         return False
     return default
 
 
-# Logging configuration
+# Numeric values of the standard logging levels, so resolving LOG_LEVEL does
+# not need the logging module
+_LOG_LEVELS = {
+    'CRITICAL': 50,
+    'FATAL': 50,
+    'ERROR': 40,
+    'WARNING': 30,
+    'WARN': 30,
+    'INFO': 20,
+    'DEBUG': 10,
+    'NOTSET': 0,
+}
 _log_level_str = _get_env('LOG_LEVEL', 'WARNING').upper()
-LOG_LEVEL = getattr(logging, _log_level_str, logging.WARNING)
+LOG_LEVEL = _LOG_LEVELS.get(_log_level_str, _LOG_LEVELS['WARNING'])
 LOG_FORMAT = _get_env('LOG_FORMAT', '%(asctime)s - %(levelname)s - %(message)s')
 
 # Server settings
@@ -331,8 +166,20 @@ ADMIN_USERNAME = _get_env('ADMIN_USERNAME', 'admin')
 ADMIN_PASSWORD = _get_env('ADMIN_PASSWORD', 'admin')
 
 
+def __getattr__(name: str):
+    # The changelog is only needed by the welcome screen, so it is loaded on
+    # first access instead of on every import of config
+    if name == 'CHANGELOG':
+        from data.changelog import CHANGELOG
+        globals()['CHANGELOG'] = CHANGELOG
+        return CHANGELOG
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def configure_logging() -> None:
     """Configure application logging."""
+    import logging
+
     logging.basicConfig(
         level=LOG_LEVEL,
         format=LOG_FORMAT,
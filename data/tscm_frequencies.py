@@ -7,6 +7,8 @@ for counter-surveillance operations.
 
 from __future__ import annotations
 
+from bisect import bisect_left
+
 # =============================================================================
 # Known Surveillance Frequencies (MHz)
 # =============================================================================
@@ -333,6 +335,33 @@ WIFI_CAMERA_PATTERNS = {
 # Utility Functions
 # =============================================================================
 
+def _build_frequency_risk_table() -> tuple[list[float], list[tuple[str, str]], list[tuple[str, str]]]:
+    """
+    Flatten SURVEILLANCE_FREQUENCIES into sorted boundaries for bisect lookup.
+
+    Ranges overlap, so each elementary segment stores the answer of the first
+    matching range in declaration order. ``points[i]`` covers the boundary
+    ``bounds[i]`` itself and ``gaps[i]`` the open interval between
+    ``bounds[i]`` and ``bounds[i + 1]``.
+    """
+    ranges = [r for category_ranges in SURVEILLANCE_FREQUENCIES.values() for r in category_ranges]
+    bounds = sorted({b for r in ranges for b in (r['start'], r['end'])})
+    unknown = ('low', 'Unknown Band')
+
+    def first_match(lo: float, hi: float) -> tuple[str, str]:
+        for r in ranges:
+            if r['start'] <= lo and hi <= r['end']:
+                return r['risk'], r['name']
+        return unknown
+
+    points = [first_match(b, b) for b in bounds]
+    gaps = [first_match(lo, hi) for lo, hi in zip(bounds, bounds[1:])]
+    return bounds, points, gaps
+
+
+_RISK_BOUNDS, _RISK_AT_BOUND, _RISK_BETWEEN = _build_frequency_risk_table()
+
+
 def get_frequency_risk(frequency_mhz: float) -> tuple[str, str]:
     """
     Determine the risk level for a given frequency.
@@ -340,11 +369,11 @@ def get_frequency_risk(frequency_mhz: float) -> tuple[str, str]:
     Returns:
         Tuple of (risk_level, category_name)
     """
-    for category, ranges in SURVEILLANCE_FREQUENCIES.items():
-        for freq_range in ranges:
-            if freq_range['start'] <= frequency_mhz <= freq_range['end']:
-                return freq_range['risk'], freq_range['name']
-
+    idx = bisect_left(_RISK_BOUNDS, frequency_mhz)
+    if idx < len(_RISK_BOUNDS) and _RISK_BOUNDS[idx] == frequency_mhz:
+        return _RISK_AT_BOUND[idx]
+    if 0 < idx < len(_RISK_BOUNDS):
+        return _RISK_BETWEEN[idx - 1]
     return 'low', 'Unknown Band'
 
 
@@ -353,16 +382,20 @@ def get_sweep_preset(preset_name: str) -> dict | None:
     return SWEEP_PRESETS.get(preset_name)
 
 
-def get_all_sweep_presets() -> dict:
-    """Get all available sweep presets."""
-    return {
-        name: {
-            'name': preset['name'],
-            'description': preset['description'],
-            'duration_seconds': preset['duration_seconds'],
-        }
-        for name, preset in SWEEP_PRESETS.items()
+# Listing summaries never change, so build them once at import
+_SWEEP_PRESET_SUMMARIES = {
+    name: {
+        'name': preset['name'],
+        'description': preset['description'],
+        'duration_seconds': preset['duration_seconds'],
     }
+    for name, preset in SWEEP_PRESETS.items()
+}
+
+
+def get_all_sweep_presets() -> dict:
+    """Get all available sweep presets (shared summary dict, do not mutate)."""
+    return _SWEEP_PRESET_SUMMARIES
 
 
 def is_known_tracker(device_name: str | None, manufacturer_data: bytes | str | None = None) -> dict | None:
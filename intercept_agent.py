@@ -12,12 +12,15 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import configparser
+import collections
+import importlib
+import itertools
 import json
 import logging
 import os
-import queue
+import platform
 import re
+import selectors
 import shutil
 import signal
 import socket
@@ -28,37 +31,163 @@ import time
 from datetime import datetime, timezone
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from socketserver import ThreadingMixIn
+from types import MappingProxyType
 from typing import Any
 from urllib.parse import urlparse, parse_qs
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import dependency checking from Intercept utils
+# orjson is optional - faster JSON encoding for pushes and responses
 try:
-    from utils.dependencies import check_all_dependencies, check_tool, TOOL_DEPENDENCIES
-    HAS_DEPENDENCIES_MODULE = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_DEPENDENCIES_MODULE = False
+    orjson = None  # type: ignore
+    HAS_ORJSON = False
 
-# Import TSCM modules for consistent analysis (same as local mode)
-try:
-    from utils.tscm.detector import ThreatDetector
-    from utils.tscm.correlation import CorrelationEngine
-    HAS_TSCM_MODULES = True
-except ImportError:
-    HAS_TSCM_MODULES = False
-    ThreatDetector = None
-    CorrelationEngine = None
 
-# Import database functions for baseline support (same as local mode)
-try:
-    from utils.database import get_tscm_baseline, get_active_tscm_baseline
-    HAS_BASELINE_DB = True
-except ImportError:
-    HAS_BASELINE_DB = False
-    get_tscm_baseline = None
-    get_active_tscm_baseline = None
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it can handle the object."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits - let json handle it
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data: bytes | str) -> Any:
+    """Parse JSON, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Last generated (monotonic tick, ISO timestamp) pair; see _utc_now_iso()
+_iso_cache: tuple[float, str] = (0.0, '')
+_ISO_CACHE_TTL = 0.01
+# (epoch second, 'YYYY-MM-DDTHH:MM:SS') for the last second formatted
+_iso_second: tuple[int, str] = (-1, '')
+
+
+def _format_utc_iso(time_ns: int) -> str:
+    """
+    Format an epoch time in nanoseconds like datetime.isoformat() in UTC.
+
+    The date and time-of-day part is formatted once per second and reused;
+    only the microseconds are added per call. Microseconds are always
+    included, even when zero.
+    """
+    global _iso_second
+    second, remainder = divmod(time_ns, 1_000_000_000)
+    cached_second, prefix = _iso_second
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+        _iso_second = (second, prefix)
+    return f'{prefix}.{remainder // 1000:06d}+00:00'
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time as an ISO 8601 string.
+
+    The string is reused for up to 10 ms, so bursts of scan events share
+    one timestamp instead of each formatting its own.
+    """
+    global _iso_cache
+    tick, stamp = _iso_cache
+    now = time.monotonic()
+    if now - tick > _ISO_CACHE_TTL or not stamp:
+        stamp = _format_utc_iso(time.time_ns())
+        _iso_cache = (now, stamp)
+    return stamp
+
+
+def _iter_lines(stream, chunk_size: int = 65536, stop_event: threading.Event | None = None,
+                poll_interval: float = 0.5):
+    """
+    Yield complete lines from a subprocess pipe as bytes, without line endings.
+
+    Reads whatever the pipe has ready (up to chunk_size) straight from the
+    file descriptor and splits on newlines in bulk, rather than paying for a
+    buffered readline() call per line. A final unterminated line is yielded
+    at EOF.
+
+    With a stop_event, the pipe is waited on for at most poll_interval
+    seconds at a time so the caller stops promptly even when the process
+    goes quiet; iteration ends once the event is set.
+    """
+    fd = stream.fileno()
+    buffer = bytearray()
+    selector = None
+    if stop_event is not None:
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ)
+    try:
+        while True:
+            if selector is not None:
+                if stop_event.is_set():
+                    return
+                if not selector.select(poll_interval):
+                    continue
+            chunk = os.read(fd, chunk_size)
+            if not chunk:
+                break
+            buffer += chunk
+            start = 0
+            while True:
+                end = buffer.find(b'\n', start)
+                if end == -1:
+                    break
+                line_end = end - 1 if end > start and buffer[end - 1] == 0x0D else end  # drop \r of \r\n
+                yield bytes(buffer[start:line_end])
+                start = end + 1
+            if start:
+                del buffer[:start]
+        if buffer:
+            yield bytes(buffer)
+    finally:
+        if selector is not None:
+            selector.close()
+
+
+# TSCM analysis and baseline database support (same as local mode) are
+# imported on first use: together they dominate agent start-up time and only
+# the TSCM mode needs them.
+_LAZY_IMPORTS = {
+    'ThreatDetector': ('utils.tscm.detector', 'ThreatDetector'),
+    'CorrelationEngine': ('utils.tscm.correlation', 'CorrelationEngine'),
+    'get_tscm_baseline': ('utils.database', 'get_tscm_baseline'),
+    'get_active_tscm_baseline': ('utils.database', 'get_active_tscm_baseline'),
+}
+_LAZY_FLAGS = {
+    'HAS_TSCM_MODULES': ('ThreatDetector', 'CorrelationEngine'),
+    'HAS_BASELINE_DB': ('get_tscm_baseline', 'get_active_tscm_baseline'),
+}
+
+
+def _lazy_import(name: str) -> Any:
+    """Resolve a lazily imported name (or HAS_* flag) and cache it in module globals."""
+    if name in globals():
+        return globals()[name]
+    if name in _LAZY_FLAGS:
+        value = all(_lazy_import(dep) is not None for dep in _LAZY_FLAGS[name])
+    else:
+        module_name, attr = _LAZY_IMPORTS[name]
+        try:
+            value = getattr(importlib.import_module(module_name), attr)
+        except ImportError:
+            value = None
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS or name in _LAZY_FLAGS:
+        return _lazy_import(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Setup logging
 logging.basicConfig(
@@ -74,9 +203,90 @@ AGENT_VERSION = '1.0.0'
 # Configuration
 # =============================================================================
 
+_BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False,
+}
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse an INI boolean the way ConfigParser.getboolean() does."""
+    try:
+        return _BOOLEAN_STATES[value.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}") from None
+
+
+def _parse_ini(filepath: str) -> dict[str, dict[str, str]]:
+    """
+    Minimal INI reader for the agent config file.
+
+    Handles ``[section]`` headers, ``key = value`` (or ``key: value``) pairs and
+    full-line ``#``/``;`` comments. Keys are lower-cased like ConfigParser.
+    Avoids importing configparser on agent start-up.
+    """
+    sections: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+    with open(filepath, encoding='utf-8') as f:
+        for lineno, raw in enumerate(f, 1):
+            line = raw.strip()
+            if not line or line[0] in '#;':
+                continue
+            if line[0] == '[' and line[-1] == ']':
+                current = sections.setdefault(line[1:-1].strip(), {})
+                continue
+            # Split at whichever delimiter comes first, as ConfigParser does
+            eq, colon = line.find('='), line.find(':')
+            sep = min((i for i in (eq, colon) if i != -1), default=-1)
+            if sep == -1 or current is None:
+                raise ValueError(f"{filepath}:{lineno}: invalid line {line!r}")
+            current[line[:sep].strip().lower()] = line[sep + 1:].strip()
+    return sections
+
+
+# Bit assigned to each agent mode in AgentConfig's enabled-modes mask
+MODE_BITS: dict[str, int] = {
+    mode: 1 << i
+    for i, mode in enumerate((
+        'pager',
+        'sensor',
+        'adsb',
+        'ais',
+        'acars',
+        'aprs',
+        'wifi',
+        'bluetooth',
+        'dsc',
+        'rtlamr',
+        'tscm',
+        'satellite',
+        'listening_post',
+    ))
+}
+_ALL_MODES_MASK = sum(MODE_BITS.values())
+
+# Canonical (interned) mode-name objects. Mode names parsed from request paths
+# are swapped for these so later dict lookups hit CPython's identity fast path;
+# unknown names are left alone rather than interning arbitrary client input.
+_MODE_NAMES: dict[str, str] = {sys.intern(mode): mode for mode in MODE_BITS}
+
+
 class AgentConfig:
     """Agent configuration loaded from INI file or defaults."""
 
+    __slots__ = (
+        'name',
+        'port',
+        'allowed_ips',
+        'allow_cors',
+        'controller_url',
+        'controller_api_key',
+        'push_enabled',
+        'push_interval',
+        'push_queue_size',
+        '_mode_flags',
+    )
+
     def __init__(self):
         # Agent settings
         self.name: str = socket.gethostname()
@@ -89,23 +299,29 @@ class AgentConfig:
         self.controller_api_key: str = ''
         self.push_enabled: bool = False
         self.push_interval: int = 5
+        self.push_queue_size: int = 8192
 
-        # Mode settings (all enabled by default)
-        self.modes_enabled: dict[str, bool] = {
-            'pager': True,
-            'sensor': True,
-            'adsb': True,
-            'ais': True,
-            'acars': True,
-            'aprs': True,
-            'wifi': True,
-            'bluetooth': True,
-            'dsc': True,
-            'rtlamr': True,
-            'tscm': True,
-            'satellite': True,
-            'listening_post': True,
-        }
+        # Mode settings as a MODE_BITS mask (all enabled by default)
+        self._mode_flags: int = _ALL_MODES_MASK
+
+    def is_mode_enabled(self, mode: str) -> bool:
+        """Check whether a mode is enabled. Modes without a MODE_BITS entry are always enabled."""
+        bit = MODE_BITS.get(mode)
+        return bit is None or bool(self._mode_flags & bit)
+
+    def set_mode_enabled(self, mode: str, enabled: bool) -> None:
+        """Enable or disable a known mode."""
+        bit = MODE_BITS[mode]
+        if enabled:
+            self._mode_flags |= bit
+        else:
+            self._mode_flags &= ~bit
+
+    @property
+    def modes_enabled(self) -> dict[str, bool]:
+        """Enabled state of every known mode (a fresh dict, for reporting)."""
+        flags = self._mode_flags
+        return {mode: bool(flags & bit) for mode, bit in MODE_BITS.items()}
 
     def load_from_file(self, filepath: str) -> bool:
         """Load configuration from INI file."""
@@ -113,39 +329,41 @@ class AgentConfig:
             logger.warning(f"Config file not found: {filepath}")
             return False
 
-        parser = configparser.ConfigParser()
         try:
-            parser.read(filepath)
+            data = _parse_ini(filepath)
 
             # Agent section
-            if parser.has_section('agent'):
-                if parser.has_option('agent', 'name'):
-                    self.name = parser.get('agent', 'name')
-                if parser.has_option('agent', 'port'):
-                    self.port = parser.getint('agent', 'port')
-                if parser.has_option('agent', 'allowed_ips'):
-                    ips = parser.get('agent', 'allowed_ips')
-                    if ips.strip():
-                        self.allowed_ips = [ip.strip() for ip in ips.split(',')]
-                if parser.has_option('agent', 'allow_cors'):
-                    self.allow_cors = parser.getboolean('agent', 'allow_cors')
+            agent = data.get('agent', {})
+            if (value := agent.get('name')) is not None:
+                self.name = value
+            if (value := agent.get('port')) is not None:
+                self.port = int(value)
+            if (value := agent.get('allowed_ips')) is not None and value.strip():
+                self.allowed_ips = [ip.strip() for ip in value.split(',')]
+            if (value := agent.get('allow_cors')) is not None:
+                self.allow_cors = _parse_bool(value)
 
             # Controller section
-            if parser.has_section('controller'):
-                if parser.has_option('controller', 'url'):
-                    self.controller_url = parser.get('controller', 'url').rstrip('/')
-                if parser.has_option('controller', 'api_key'):
-                    self.controller_api_key = parser.get('controller', 'api_key')
-                if parser.has_option('controller', 'push_enabled'):
-                    self.push_enabled = parser.getboolean('controller', 'push_enabled')
-                if parser.has_option('controller', 'push_interval'):
-                    self.push_interval = parser.getint('controller', 'push_interval')
-
-            # Modes section
-            if parser.has_section('modes'):
-                for mode in self.modes_enabled.keys():
-                    if parser.has_option('modes', mode):
-                        self.modes_enabled[mode] = parser.getboolean('modes', mode)
+            controller = data.get('controller', {})
+            if (value := controller.get('url')) is not None:
+                self.controller_url = value.rstrip('/')
+            if (value := controller.get('api_key')) is not None:
+                self.controller_api_key = value
+            if (value := controller.get('push_enabled')) is not None:
+                self.push_enabled = _parse_bool(value)
+            if (value := controller.get('push_interval')) is not None:
+                self.push_interval = int(value)
+            if (value := controller.get('push_queue_size')) is not None:
+                queue_size = int(value)
+                if queue_size < 1:
+                    logger.warning(f"Ignoring push_queue_size {queue_size}; keeping {self.push_queue_size}")
+                else:
+                    self.push_queue_size = queue_size
+
+            # Modes section (unknown keys are ignored)
+            for mode, value in data.get('modes', {}).items():
+                if mode in MODE_BITS:
+                    self.set_mode_enabled(mode, _parse_bool(value))
 
             logger.info(f"Loaded configuration from {filepath}")
             return True
@@ -164,6 +382,7 @@ class AgentConfig:
             'controller_url': self.controller_url,
             'push_enabled': self.push_enabled,
             'push_interval': self.push_interval,
+            'push_queue_size': self.push_queue_size,
             'modes_enabled': self.modes_enabled,
         }
 
@@ -181,34 +400,30 @@ class GPSManager:
 
     def __init__(self):
         self._client = None
-        self._position = None
-        self._lock = threading.Lock()
-        self._running = False
+        # Position dict rebuilt once per fix and published with a single
+        # attribute store, so readers never need a lock
+        self._position: dict | None = None
 
     @property
     def position(self) -> dict | None:
-        """Get current GPS position."""
-        with self._lock:
-            if self._position:
-                return {
-                    'lat': self._position.latitude,
-                    'lon': self._position.longitude,
-                    'altitude': self._position.altitude,
-                    'speed': self._position.speed,
-                    'heading': self._position.heading,
-                    'fix_quality': self._position.fix_quality,
-                }
-            return None
+        """
+        Get current GPS position.
+
+        Returns the snapshot shared by every caller until the next fix
+        replaces it, so treat it as read-only.
+        """
+        return self._position
 
     def start(self, host: str = 'localhost', port: int = 2947) -> bool:
         """Start GPS client connection to gpsd."""
         try:
             from utils.gps import GPSDClient
-            self._client = GPSDClient(host, port)
-            self._client.add_callback(self._on_position_update)
-            success = self._client.start()
+            client = GPSDClient(host, port)
+            client.add_callback(self._on_position_update)
+            success = client.start()
             if success:
-                self._running = True
+                # Only a started client is kept, so it doubles as the running flag
+                self._client = client
                 logger.info(f"GPS connected to gpsd at {host}:{port}")
             return success
         except ImportError:
@@ -223,16 +438,21 @@ class GPSManager:
         if self._client:
             self._client.stop()
             self._client = None
-        self._running = False
 
     def _on_position_update(self, position):
         """Callback for GPS position updates."""
-        with self._lock:
-            self._position = position
+        self._position = {
+            'lat': position.latitude,
+            'lon': position.longitude,
+            'altitude': position.altitude,
+            'speed': position.speed,
+            'heading': position.heading,
+            'fix_quality': position.fix_quality,
+        }
 
     @property
     def is_running(self) -> bool:
-        return self._running
+        return self._client is not None
 
 
 # Global GPS manager
@@ -243,88 +463,243 @@ gps_manager = GPSManager()
 # Controller Push Client
 # =============================================================================
 
+class _PushItem:
+    """One payload queued for the controller, already serialized."""
+
+    __slots__ = ('agent_name', 'scan_type', 'body')
+
+    def __init__(self):
+        self.clear()
+
+    def fill(self, agent_name: str, scan_type: str, body: bytes):
+        """Populate a fresh or recycled item."""
+        self.agent_name = agent_name
+        self.scan_type = scan_type
+        self.body = body
+
+    def clear(self):
+        """Drop references held by the item so a pooled item pins no payload."""
+        self.agent_name = None
+        self.scan_type = None
+        self.body = None
+
+
 class ControllerPushClient(threading.Thread):
     """Daemon thread that pushes scan data to the controller."""
 
+    # Queued payloads are drained into batches of up to BATCH_SIZE and sent in
+    # one request to the controller's batch ingest endpoint
+    BATCH_SIZE = 50
+
+    # Failed requests are retried inside the session's urllib3 adapter with
+    # exponential backoff, reusing the pooled connection
+    MAX_RETRIES = 3
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Sent items are recycled through a free list of this size, so steady
+    # pushing allocates no new item objects
+    POOL_SIZE = 256
+
+    # Minimum seconds between "queue full" warnings under sustained overload
+    DROP_WARNING_INTERVAL = 10.0
+
     def __init__(self, cfg: AgentConfig):
         super().__init__()
         self.daemon = True
         self.cfg = cfg
-        self.queue: queue.Queue = queue.Queue(maxsize=200)
-        self.running = False
+        # Bounded deque (oldest payload is evicted when full) plus a wake-up
+        # event: cheaper than queue.Queue's lock and condition variables.
+        # Sized by push_queue_size so short controller stalls don't lose data.
+        self.queue: collections.deque[_PushItem] = collections.deque(maxlen=cfg.push_queue_size)
+        self._wake = threading.Event()
+        self._pool: collections.deque[_PushItem] = collections.deque(_PushItem() for _ in range(self.POOL_SIZE))
         self.stop_event = threading.Event()
+        # Cleared if the controller predates /controller/api/ingest/batch
+        self._batch_supported = True
+        # Payloads evicted since the last "queue full" warning
+        self._dropped = 0
+        self._drop_warned_at = float('-inf')
+        self.reload()
+
+    def reload(self, cfg: AgentConfig | None = None):
+        """
+        Re-read push settings, optionally switching to a new config.
 
-    def enqueue(self, scan_type: str, payload: dict, interface: str = None):
-        """Add data to push queue."""
-        if not self.cfg.push_enabled or not self.cfg.controller_url:
-            return
+        enqueue() is bound to a no-op while pushing is disabled and reads the
+        agent name from a cached attribute, so scan threads never walk the
+        config per event; call this after changing push settings at runtime.
+        """
+        if cfg is not None:
+            self.cfg = cfg
+        self._agent_name = self.cfg.name
+        # The push thread remounts its retry adapter when this changes, see run()
+        self._controller_url = self.cfg.controller_url
+        # Request constants, built here rather than per push
+        base_url = f"{self.cfg.controller_url}/controller/api"
+        self._ingest_url = f"{base_url}/ingest"
+        self._batch_url = f"{base_url}/ingest/batch"
+        self._headers = {'Content-Type': 'application/json'}
+        if self.cfg.controller_api_key:
+            self._headers['X-API-Key'] = self.cfg.controller_api_key
+        if self.cfg.push_enabled and self.cfg.controller_url:
+            self.enqueue = self._enqueue
+        else:
+            self.enqueue = self._enqueue_disabled
 
-        item = {
-            'agent_name': self.cfg.name,
-            'scan_type': scan_type,
-            'interface': interface,
-            'payload': payload,
-            'received_at': datetime.now(timezone.utc).isoformat(),
-            'attempts': 0,
-        }
+    def _enqueue_disabled(self, scan_type: str, payload: dict, interface: str = None):
+        """enqueue() while pushing is disabled: drop the payload."""
 
+    def _enqueue(self, scan_type: str, payload: dict, interface: str = None):
+        """Serialize data on the calling scan thread and add it to the push queue."""
+        agent_name = self._agent_name
         try:
-            self.queue.put_nowait(item)
-        except queue.Full:
-            logger.warning("Push queue full, dropping payload")
-
-    def run(self):
-        """Main push loop."""
-        import requests
-
-        self.running = True
-        logger.info(f"Push client started, target: {self.cfg.controller_url}")
+            body = _json_dumps({
+                'agent_name': agent_name,
+                'scan_type': scan_type,
+                'interface': interface,
+                'payload': payload,
+                'received_at': _utc_now_iso(),
+            })
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Dropping {scan_type} payload that cannot be serialized: {e}")
+            return
 
-        while not self.stop_event.is_set():
+        try:
+            item = self._pool.pop()
+        except IndexError:
+            item = _PushItem()
+        item.fill(agent_name, scan_type, body)
+
+        if len(self.queue) == self.queue.maxlen:
+            self._note_drop()
+        self.queue.append(item)
+        self._wake.set()
+
+    def _note_drop(self):
+        """Count an evicted payload, warning at most once per DROP_WARNING_INTERVAL."""
+        self._dropped += 1
+        now = time.monotonic()
+        if now - self._drop_warned_at >= self.DROP_WARNING_INTERVAL:
+            logger.warning(
+                f"Push queue full ({self.queue.maxlen} payloads), dropped {self._dropped} oldest payload(s)"
+            )
+            self._dropped = 0
+            self._drop_warned_at = now
+
+    def _next_batch(self) -> list[_PushItem] | None:
+        """Wait for enqueue()/stop() if idle, then drain up to BATCH_SIZE queued items."""
+        if not self.queue:
+            self._wake.wait()
+            self._wake.clear()
+
+        batch = []
+        popleft = self.queue.popleft
+        while len(batch) < self.BATCH_SIZE:
             try:
-                item = self.queue.get(timeout=1.0)
-            except queue.Empty:
-                continue
-
-            if item is None:
-                continue
-
-            endpoint = f"{self.cfg.controller_url}/controller/api/ingest"
-            headers = {'Content-Type': 'application/json'}
-            if self.cfg.controller_api_key:
-                headers['X-API-Key'] = self.cfg.controller_api_key
-
-            body = {
-                'agent_name': item['agent_name'],
-                'scan_type': item['scan_type'],
-                'interface': item['interface'],
-                'payload': item['payload'],
-                'received_at': item['received_at'],
-            }
+                batch.append(popleft())
+            except IndexError:
+                break
+        return batch or None
+
+    def _release(self, items: list[_PushItem]):
+        """Return finished items to the free list."""
+        pool = self._pool
+        for item in items:
+            item.clear()
+            if len(pool) < self.POOL_SIZE:
+                pool.append(item)
+
+    def _make_session(self, controller_url: str | None = None):
+        """Build the keep-alive session used by the push thread, with retries for controller_url."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=['POST'],
+        )
+        # One session for the life of the thread, so pushes (and retries)
+        # reuse the controller connection instead of reconnecting per payload
+        session = requests.Session()
+        session.mount(
+            controller_url or self._controller_url,
+            HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry),
+        )
+        return session
 
-            try:
-                response = requests.post(endpoint, json=body, headers=headers, timeout=5)
+    def _send(self, session, batch: list[_PushItem]):
+        """Push a batch, logging (and dropping) it once retries are exhausted."""
+        try:
+            self._push(session, batch)
+        except Exception as e:
+            logger.warning(f"Failed to push {len(batch)} payload(s): {e}")
+        finally:
+            self._release(batch)
+
+    def _push(self, session, batch: list[_PushItem]):
+        """Send a batch, falling back to one request per item for older controllers."""
+        headers = self._headers
+
+        if self._batch_supported:
+            # Items are serialized at enqueue time; splice their bodies into the
+            # batch envelope rather than re-encoding them here
+            body = b''.join((
+                b'{"agent_name":', _json_dumps(batch[0].agent_name),
+                b',"items":[', b','.join([item.body for item in batch]), b']}',
+            ))
+            response = session.post(self._batch_url, data=body, headers=headers, timeout=5)
+            if response.status_code != 404:
                 if response.status_code >= 400:
                     raise RuntimeError(f"HTTP {response.status_code}")
-                logger.debug(f"Pushed {item['scan_type']} data to controller")
-            except Exception as e:
-                item['attempts'] += 1
-                if item['attempts'] < 3 and not self.stop_event.is_set():
-                    try:
-                        self.queue.put_nowait(item)
-                    except queue.Full:
-                        pass
-                else:
-                    logger.warning(f"Failed to push after {item['attempts']} attempts: {e}")
-            finally:
-                self.queue.task_done()
+                logger.debug("Pushed %d payload(s) to controller", len(batch))
+                return
+            logger.info("Controller has no batch ingest endpoint, pushing payloads individually")
+            self._batch_supported = False
 
-        self.running = False
+        for item in batch:
+            response = session.post(self._ingest_url, data=item.body, headers=headers, timeout=5)
+            if response.status_code >= 400:
+                raise RuntimeError(f"HTTP {response.status_code}")
+            logger.debug("Pushed %s data to controller", item.scan_type)
+
+    def run(self):
+        """Main push loop."""
+        session_url = self._controller_url
+        session = self._make_session(session_url)
+
+        logger.info(f"Push client started, target: {session_url}")
+
+        # Bound once: the loop runs for every batch for the life of the agent
+        stopped = self.stop_event.is_set
+        next_batch = self._next_batch
+        send = self._send
+
+        while not stopped():
+            batch = next_batch()
+            if batch:
+                if self._controller_url != session_url:
+                    # reload() switched controllers: the retry adapter is mounted per URL prefix
+                    session.close()
+                    session_url = self._controller_url
+                    session = self._make_session(session_url)
+                    logger.info(f"Push client target changed to {session_url}")
+                send(session, batch)
+
+        session.close()
         logger.info("Push client stopped")
 
+    @property
+    def running(self) -> bool:
+        """Whether the push thread is alive and has not been asked to stop."""
+        return self.is_alive() and not self.stop_event.is_set()
+
     def stop(self):
         """Stop the push client."""
         self.stop_event.set()
+        self._wake.set()
 
 
 # Global push client
@@ -335,6 +710,165 @@ push_client: ControllerPushClient | None = None
 # Mode Manager - Uses Intercept's existing utilities and tools
 # =============================================================================
 
+# Marks a lazily imported utility whose import failed, so it isn't retried
+_MISSING = object()
+
+
+class _VersionedDict(dict):
+    """
+    dict that caches list(values()) until entries are added, replaced or removed.
+
+    Tracked objects (aircraft, networks, devices) are updated in place by the
+    scan threads, so only membership changes invalidate the cached list. The
+    list is shared between callers and must be treated as read-only.
+    """
+
+    __slots__ = ('_version', '_values_cache')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._version = 0
+        self._values_cache: tuple[int, list] | None = None
+
+    def values_list(self) -> list:
+        """Values as a list, rebuilt only after the dict has changed."""
+        cached = self._values_cache
+        version = self._version
+        if cached is None or cached[0] != version:
+            # Version is read before copying, so a write racing the copy
+            # leaves the cache stale-marked rather than silently stale
+            cached = self._values_cache = (version, list(self.values()))
+        return cached[1]
+
+    def __setitem__(self, key, value):
+        # Parsers write the entry they just updated back under the same key;
+        # storing the same object again leaves the cached list valid
+        if dict.get(self, key) is value:
+            return
+        super().__setitem__(key, value)
+        self._version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._version += 1
+
+    def clear(self):
+        super().clear()
+        self._version += 1
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._version += 1
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._version += 1
+        return item
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return dict.__getitem__(self, key)
+        super().__setitem__(key, default)
+        self._version += 1
+        return default
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._version += 1
+
+
+# Interface probe parsers, run with finditer over the whole tool output.
+# networksetup: a Wi-Fi/AirPort "Hardware Port:" line with "Device:" within the next two lines
+_NETWORKSETUP_WIFI_RE = re.compile(
+    r'^Hardware Port:[ \t]*([^\n]*(?:Wi-Fi|AirPort)[^\n]*)\n(?:[^\n]*\n)?[^\n]*Device:[ \t]*(\S+)', re.M
+)
+# iw dev: each "Interface" line and the first "type" line before the next interface
+_IW_DEV_RE = re.compile(
+    r'^[ \t]*Interface[ \t]+(\S+)[^\n]*\n(?:(?![ \t]*Interface\s)[^\n]*\n)*?[ \t]*type[ \t]+(\S+)', re.M
+)
+# iwconfig: the first token of each wireless extension line
+_IWCONFIG_RE = re.compile(r'^(\S+)[^\n]*IEEE 802\.11', re.M)
+# airodump-ng .gps file: a complete <gps-point .../> element, and its attributes
+_GPS_POINT_RE = re.compile(rb'<gps-point\s[^>]*/>')
+_XML_ATTR_RE = re.compile(rb'(\w+)="([^"]*)"')
+# hciconfig: one match per adapter block, from its "hciN:" line up to the next
+_HCI_BLOCK_RE = re.compile(r'^(hci\d+):.*?(?=^hci\d+:|\Z)', re.M | re.S)
+
+# Per-line decoder output parsers
+# bluetoothctl: device address and signal strength
+_MAC_RE = re.compile(r'([0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5})')
+_RSSI_RE = re.compile(r'RSSI:\s*(-?\d+)')
+# multimon-ng: POCSAG message, POCSAG address-only (tone) and FLEX lines
+_POCSAG_MSG_RE = re.compile(r'(POCSAG\d+):\s*Address:\s*(\d+)\s+Function:\s*(\d+)\s+(Alpha|Numeric):\s*(.*)')
+_POCSAG_TONE_RE = re.compile(r'(POCSAG\d+):\s*Address:\s*(\d+)\s+Function:\s*(\d+)\s*$')
+_FLEX_RE = re.compile(r'FLEX[:\|]\s*(.+)')
+# direwolf/multimon-ng APRS: "SRC>PATH:data" header and an uncompressed position
+_APRS_PACKET_RE = re.compile(r'([A-Z0-9-]+)>([^:]+):(.+)')
+_APRS_POSITION_RE = re.compile(r'[!=/@](\d{4}\.\d{2})([NS])[/\\](\d{5}\.\d{2})([EW])')
+# AIS-catcher JSON static fields -> vessel keys
+_AIS_STATIC_FIELDS = (
+    ('name', 'name'), ('callsign', 'callsign'), ('destination', 'destination'),
+    ('shiptype', 'ship_type'), ('ship_type', 'ship_type'),
+)
+# acarsdec --help banner version (TLeconte builds)
+_ACARSDEC_VER_RE = re.compile(r'acarsdec[^\d]*v?(\d+)\.(\d+)', re.IGNORECASE)
+
+# dependencies.py mode name -> agent mode name
+_DEP_MODE_MAPPING = MappingProxyType({
+    'pager': 'pager',
+    'sensor': 'sensor',
+    'aircraft': 'adsb',
+    'ais': 'ais',
+    'acars': 'acars',
+    'aprs': 'aprs',
+    'wifi': 'wifi',
+    'bluetooth': 'bluetooth',
+    'tscm': 'tscm',
+    'satellite': 'satellite',
+})
+
+# Tools required by modes that dependencies.py does not know about
+_EXTRA_MODE_TOOLS = MappingProxyType({
+    'dsc': ('rtl_fm',),
+    'rtlamr': ('rtlamr',),
+    'listening_post': ('rtl_fm',),
+})
+
+# Tools required per mode when dependencies.py is unavailable
+_FALLBACK_TOOL_CHECKS = MappingProxyType({
+    'pager': ('rtl_fm', 'multimon-ng'),
+    'sensor': ('rtl_433',),
+    'adsb': ('dump1090',),
+    'ais': ('AIS-catcher',),
+    'acars': ('acarsdec',),
+    'aprs': ('rtl_fm', 'direwolf'),
+    'wifi': ('airmon-ng', 'airodump-ng'),
+    'bluetooth': ('bluetoothctl',),
+    'dsc': ('rtl_fm',),
+    'rtlamr': ('rtlamr',),
+    'satellite': (),
+    'listening_post': ('rtl_fm',),
+    'tscm': ('rtl_fm',),
+})
+
+# Any one of these is enough for ADS-B
+_ADSB_CANDIDATES = ('dump1090', 'dump1090-fa', 'readsb')
+
+# SBS (BaseStation) MSG transmission type -> (minimum field count, fields),
+# each field being (aircraft key, index, kind). Kinds: 's' stripped text,
+# 'i' integer, 'r' raw text, 'p' lat/lon pair at index and index + 1.
+_SBS_FIELDS = MappingProxyType({
+    '1': (11, (('callsign', 10, 's'),)),
+    '3': (16, (('altitude', 11, 'i'), ('position', 14, 'p'))),
+    '4': (17, (('speed', 12, 'i'), ('heading', 13, 'i'), ('vertical_rate', 16, 'i'))),
+    '5': (12, (('callsign', 10, 's'), ('altitude', 11, 'i'))),
+    '6': (18, (('squawk', 17, 'r'),)),
+})
+# Fields past the last one any message type reads are never split out
+_SBS_MAX_SPLIT = max(index for _, fields in _SBS_FIELDS.values() for _, index, _ in fields) + 1
+
+
 class ModeManager:
     """
     Manages mode state using Intercept's existing infrastructure.
@@ -346,25 +880,68 @@ class ModeManager:
 
     def __init__(self):
         self.running_modes: dict[str, dict] = {}
-        self.data_snapshots: dict[str, list] = {}
-        self.locks: dict[str, threading.Lock] = {}
-        self._capabilities: dict | None = None
+        # Recent records per mode; bounded deques for streaming modes, see _record_snapshot()
+        self.data_snapshots: dict[str, collections.deque | list] = {}
+        # Modes with a start/stop in progress -> (action, owner thread ident);
+        # see _claim_mode()
+        self._mode_busy: dict[str, tuple[str, int]] = {}
+        # SDR device index -> SDR mode holding it (running or starting); the
+        # single source of truth for device occupancy, see get_sdr_in_use()
+        self.running_sdr_modes: dict[int, str] = {}
+        # Capability section name -> (monotonic time, value); see detect_capabilities()
+        self._caps_parts: dict[str, tuple[float, Any]] = {}
+        # (monotonic time, {'wifi_interfaces': [...], 'bt_adapters': [...]})
+        # from the last interface probe; see _detect_interfaces()
+        self._iface_cache: tuple[float, dict[str, list]] | None = None
+        # One lock per capability section, so concurrent requests that find a
+        # section stale wait for a single detection instead of each running it
+        self._caps_locks = {section: threading.Lock() for section in self.CAPABILITY_SECTIONS}
         # Process tracking per mode
         self.processes: dict[str, subprocess.Popen] = {}
         self.output_threads: dict[str, threading.Thread] = {}
         self.stop_events: dict[str, threading.Event] = {}
-        # Data queues for each mode (for real-time collection)
-        self.data_queues: dict[str, queue.Queue] = {}
+        # Data queues for each mode (for real-time collection); bounded
+        # deques, so appends drop the oldest item instead of blocking
+        self.data_queues: dict[str, collections.deque] = {}
         # WiFi-specific state
-        self.wifi_networks: dict[str, dict] = {}
-        self.wifi_clients: dict[str, dict] = {}
+        self.wifi_networks: dict[str, dict] = _VersionedDict()
+        self.wifi_clients: dict[str, dict] = _VersionedDict()
+        self.wifi_monitor_interface: str | None = None
+        self._wifi_scanner_instance = None
         # ADS-B specific state
-        self.adsb_aircraft: dict[str, dict] = {}
+        self.adsb_aircraft: dict[str, dict] = _VersionedDict()
         # Bluetooth specific state
-        self.bluetooth_devices: dict[str, dict] = {}
-        # Lazy-loaded Intercept utilities
+        self.bluetooth_devices: dict[str, dict] = _VersionedDict()
+        self._bluetooth_scanner_instance = None
+        self._bluetooth_device_callback = None
+        # AIS / APRS specific state
+        self.ais_vessels: dict[str, dict] = _VersionedDict()
+        self.aprs_stations: dict[str, dict] = _VersionedDict()
+        # DSC messages (the mode's snapshot deque while running)
+        self.dsc_messages: collections.deque | list = []
+        # TSCM specific state
+        self.tscm_baseline: dict = {}
+        self.tscm_anomalies: collections.deque[dict] = collections.deque(maxlen=self.TSCM_ANOMALY_LIMIT)
+        self.tscm_rf_signals: list[dict] = []
+        self.tscm_wifi_clients: dict[str, dict] = _VersionedDict()
+        self._tscm_reported_wifi: set[str] = set()
+        self._tscm_reported_bt: set[str] = set()
+        self._tscm_detector = None
+        self._tscm_correlation = None
+        # Listening post specific state
+        # The mode's snapshot deque while running
+        self.listening_post_activity: collections.deque | list = []
+        self.listening_post_current_freq: float = 0
+        self.listening_post_freqs_scanned: int = 0
+        # Lazy-loaded Intercept utilities (_MISSING once an import has failed)
         self._sdr_factory = None
         self._dependencies = None
+        # Resolved tool paths (None = not found), see _get_tool_path()
+        self._tool_cache: dict[str, str | None] = {}
+        # Resolved ADS-B decoder path, see _find_dump1090()
+        self._dump1090_path: str | None | object = _MISSING
+        # acarsdec command-line style per binary path, see _detect_acarsdec_fork()
+        self._acarsdec_forks: dict[str, str] = {}
 
     def _get_sdr_factory(self):
         """Lazy-load SDRFactory from Intercept's utils."""
@@ -374,7 +951,8 @@ class ModeManager:
                 self._sdr_factory = SDRFactory
             except ImportError:
                 logger.warning("SDRFactory not available - SDR features disabled")
-        return self._sdr_factory
+                self._sdr_factory = _MISSING
+        return None if self._sdr_factory is _MISSING else self._sdr_factory
 
     def _get_dependencies(self):
         """Lazy-load dependencies module from Intercept's utils."""
@@ -384,99 +962,173 @@ class ModeManager:
                 self._dependencies = dependencies
             except ImportError:
                 logger.warning("Dependencies module not available")
-        return self._dependencies
+                self._dependencies = _MISSING
+        return None if self._dependencies is _MISSING else self._dependencies
 
     def _check_tool(self, tool_name: str) -> bool:
         """Check if a tool is available using Intercept's dependency checker."""
-        deps = self._get_dependencies()
-        if deps and hasattr(deps, 'check_tool'):
-            return deps.check_tool(tool_name)
-        # Fallback to simple which check
-        return shutil.which(tool_name) is not None
+        return self._get_tool_path(tool_name) is not None
 
     def _get_tool_path(self, tool_name: str) -> str | None:
-        """Get tool path using Intercept's dependency module."""
+        """
+        Get tool path using Intercept's dependency module.
+
+        Lookups walk PATH, so each result (including "not found") is cached
+        until invalidate_tool_cache() is called.
+        """
+        try:
+            return self._tool_cache[tool_name]
+        except KeyError:
+            pass
         deps = self._get_dependencies()
         if deps and hasattr(deps, 'get_tool_path'):
-            return deps.get_tool_path(tool_name)
-        return shutil.which(tool_name)
+            path = deps.get_tool_path(tool_name)
+        else:
+            # Fallback to simple which check
+            path = shutil.which(tool_name)
+        self._tool_cache[tool_name] = path
+        return path
+
+    def _find_any_tool(self, tool_names) -> str | None:
+        """
+        Return the path of the first available tool out of several candidates.
+
+        A candidate already known to be installed answers without any lookup;
+        otherwise candidates are looked up in order, stopping at the first hit.
+        """
+        cache = self._tool_cache
+        for name in tool_names:
+            path = cache.get(name)
+            if path:
+                return path
+        for name in tool_names:
+            if name not in cache:
+                path = self._get_tool_path(name)
+                if path:
+                    return path
+        return None
 
-    def detect_capabilities(self) -> dict:
-        """Detect available tools and hardware using Intercept's utilities."""
-        if self._capabilities is not None:
-            return self._capabilities
+    def invalidate_tool_cache(self, tool_name: str | None = None):
+        """Forget a cached tool lookup, or all of them, e.g. after installing tools."""
+        if tool_name is None:
+            self._tool_cache.clear()
+        else:
+            self._tool_cache.pop(tool_name, None)
+        self._dump1090_path = _MISSING
+        self._acarsdec_forks.clear()
+
+    # Capability sections, and how long each stays cached (None = until invalidated).
+    # Interfaces have their own cache, see _detect_interfaces().
+    CAPABILITY_SECTIONS = frozenset({'modes', 'interfaces', 'sdr'})
+    _CAPS_TTL = {'modes': None, 'sdr': 30.0}
+
+    def detect_capabilities(self, sections: set[str] | frozenset[str] | None = None) -> dict:
+        """
+        Detect available tools and hardware using Intercept's utilities.
+
+        Pass sections (a subset of CAPABILITY_SECTIONS) to build only part of
+        the result; each section is cached on its own, so e.g. checking mode
+        availability never triggers an SDR scan.
+        """
+        if sections is None:
+            sections = self.CAPABILITY_SECTIONS
 
         capabilities = {
-            'modes': {},
-            'devices': [],
-            'interfaces': {
-                'wifi_interfaces': [],
-                'bt_adapters': [],
-                'sdr_devices': [],
-            },
             'agent_version': AGENT_VERSION,
             'gps': gps_manager.is_running,
             'gps_position': gps_manager.position,
-            'tool_details': {},  # Detailed tool status
         }
 
-        # Detect interfaces using Intercept's TSCM device detection
-        self._detect_interfaces(capabilities)
+        if 'modes' in sections:
+            capabilities['modes'], capabilities['tool_details'] = self._cached_caps_part('modes', self._detect_modes)
+
+        if 'sdr' in sections:
+            capabilities['devices'] = self._cached_caps_part('sdr', self._detect_sdr_devices)
+
+        if 'interfaces' in sections:
+            capabilities['interfaces'] = {
+                'wifi_interfaces': [],
+                'bt_adapters': [],
+            }
+            # Detect interfaces using Intercept's TSCM device detection
+            self._detect_interfaces(capabilities)
+            if 'sdr' in sections:
+                capabilities['interfaces']['sdr_devices'] = capabilities['devices']
+
+        return capabilities
+
+    def _cached_caps_part(self, section: str, detect):
+        """Return a cached capability section, calling detect() when missing or stale."""
+        ttl = self._CAPS_TTL[section]
+
+        def is_stale(entry):
+            return entry is None or (ttl is not None and time.monotonic() - entry[0] >= ttl)
+
+        entry = self._caps_parts.get(section)
+        if is_stale(entry):
+            with self._caps_locks[section]:
+                # Another thread may have refreshed it while we waited
+                entry = self._caps_parts.get(section)
+                if is_stale(entry):
+                    entry = self._caps_parts[section] = (time.monotonic(), detect())
+        return entry[1]
+
+    def invalidate_capabilities(self, section: str | None = None):
+        """Drop one cached capability section, or all of them."""
+        if section is None:
+            self._caps_parts.clear()
+            self.bust_iface_cache()
+        elif section == 'interfaces':
+            self.bust_iface_cache()
+        else:
+            self._caps_parts.pop(section, None)
+
+    def _detect_modes(self) -> tuple[dict[str, bool], dict[str, dict]]:
+        """Work out which modes are available, plus per-mode tool details."""
+        capabilities = {
+            'modes': {},
+            'tool_details': {},  # Detailed tool status
+        }
+        modes = capabilities['modes']
+        tool_details = capabilities['tool_details']
 
         # Use Intercept's comprehensive dependency checking if available
-        if HAS_DEPENDENCIES_MODULE:
+        deps = self._get_dependencies()
+        if deps is not None:
             try:
-                dep_status = check_all_dependencies()
+                dep_status = deps.check_all_dependencies()
+                is_enabled = config.is_mode_enabled
                 # Map dependency status to mode availability
-                mode_mapping = {
-                    'pager': 'pager',
-                    'sensor': 'sensor',
-                    'aircraft': 'adsb',
-                    'ais': 'ais',
-                    'acars': 'acars',
-                    'aprs': 'aprs',
-                    'wifi': 'wifi',
-                    'bluetooth': 'bluetooth',
-                    'tscm': 'tscm',
-                    'satellite': 'satellite',
-                }
-                for dep_mode, cap_mode in mode_mapping.items():
-                    if dep_mode in dep_status:
-                        mode_info = dep_status[dep_mode]
-                        # Check if mode is enabled in config
-                        if not config.modes_enabled.get(cap_mode, True):
-                            capabilities['modes'][cap_mode] = False
-                        else:
-                            capabilities['modes'][cap_mode] = mode_info['ready']
-                        # Store detailed tool info
-                        capabilities['tool_details'][cap_mode] = {
-                            'name': mode_info['name'],
-                            'ready': mode_info['ready'],
-                            'missing_required': mode_info['missing_required'],
-                            'tools': mode_info['tools'],
-                        }
+                for dep_mode, cap_mode in _DEP_MODE_MAPPING.items():
+                    mode_info = dep_status.get(dep_mode)
+                    if mode_info is None:
+                        continue
+                    ready = mode_info['ready']
+                    # Check if mode is enabled in config
+                    modes[cap_mode] = ready if is_enabled(cap_mode) else False
+                    # Store detailed tool info
+                    tool_details[cap_mode] = {
+                        'name': mode_info['name'],
+                        'ready': ready,
+                        'missing_required': mode_info['missing_required'],
+                        'tools': mode_info['tools'],
+                    }
                 # Handle modes not in dependencies.py
-                extra_modes = ['dsc', 'rtlamr', 'listening_post']
-                extra_tools = {
-                    'dsc': ['rtl_fm'],
-                    'rtlamr': ['rtlamr'],
-                    'listening_post': ['rtl_fm'],
-                }
-                for mode in extra_modes:
-                    if not config.modes_enabled.get(mode, True):
-                        capabilities['modes'][mode] = False
+                for mode, tools in _EXTRA_MODE_TOOLS.items():
+                    if not is_enabled(mode):
+                        modes[mode] = False
                     else:
-                        tools = extra_tools.get(mode, [])
-                        capabilities['modes'][mode] = all(
-                            check_tool(tool) for tool in tools
-                        ) if tools else True
+                        modes[mode] = all(self._check_tool(tool) for tool in tools)
             except Exception as e:
                 logger.warning(f"Dependency check failed, using fallback: {e}")
                 self._detect_capabilities_fallback(capabilities)
         else:
             self._detect_capabilities_fallback(capabilities)
 
-        # Use Intercept's SDR detection
+        return capabilities['modes'], capabilities['tool_details']
+
+    def _detect_sdr_devices(self) -> list[dict]:
+        """List attached SDR devices."""
         sdr_factory = self._get_sdr_factory()
         if sdr_factory:
             try:
@@ -490,41 +1142,69 @@ class ModeManager:
                         display_name = f'{sdr.name} (SN: {sdr.serial[-8:]})'
                     sdr_dict['display_name'] = display_name
                     sdr_list.append(sdr_dict)
-                capabilities['devices'] = sdr_list
-                capabilities['interfaces']['sdr_devices'] = sdr_list
+                return sdr_list
             except Exception as e:
                 logger.warning(f"SDR device detection failed: {e}")
+        return []
 
-        self._capabilities = capabilities
-        return capabilities
+    # Seconds a WiFi/Bluetooth interface probe stays valid; each probe shells
+    # out to several tools and the results rarely change
+    _IFACE_TTL = 30.0
 
-    def _detect_interfaces(self, capabilities: dict):
-        """Detect WiFi interfaces and Bluetooth adapters."""
-        import platform
+    def bust_iface_cache(self):
+        """Forget cached interfaces, e.g. after monitor mode changes them."""
+        self._iface_cache = None
 
-        interfaces = capabilities.get('interfaces', {})
+    def _detect_interfaces(self, capabilities: dict):
+        """Detect WiFi interfaces and Bluetooth adapters, reusing a recent probe."""
+        cached = self._iface_cache
+        if cached is None or time.monotonic() - cached[0] >= self._IFACE_TTL:
+            with self._caps_locks['interfaces']:
+                # Another thread may have probed while we waited
+                cached = self._iface_cache
+                if cached is None or time.monotonic() - cached[0] >= self._IFACE_TTL:
+                    found = {'wifi_interfaces': [], 'bt_adapters': []}
+                    self._probe_interfaces(found)
+                    cached = self._iface_cache = (time.monotonic(), found)
+
+        # Hand out copies so callers can't mutate the cached entries
+        interfaces = capabilities['interfaces']
+        for key, entries in cached[1].items():
+            interfaces[key] = [dict(entry) for entry in entries]
+
+    def _probe_interfaces(self, interfaces: dict):
+        """
+        Probe WiFi interfaces and Bluetooth adapters with the platform's tools.
 
-        # Detect WiFi interfaces
-        if platform.system() == 'Darwin':  # macOS
+        The two probes are independent, so the Bluetooth one runs in a worker
+        thread while WiFi is probed here; the total is the slower of the two.
+        """
+        import concurrent.futures
+
+        system = platform.system()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            bt_future = executor.submit(self._probe_bt_adapters, system)
+            interfaces['wifi_interfaces'].extend(self._probe_wifi_interfaces(system))
+            interfaces['bt_adapters'].extend(bt_future.result())
+
+    @staticmethod
+    def _probe_wifi_interfaces(system: str) -> list[dict]:
+        """List WiFi interfaces."""
+        found = []
+        if system == 'Darwin':  # macOS
             try:
                 result = subprocess.run(
                     ['networksetup', '-listallhardwareports'],
                     capture_output=True, text=True, timeout=5
                 )
-                lines = result.stdout.split('\n')
-                for i, line in enumerate(lines):
-                    if 'Wi-Fi' in line or 'AirPort' in line:
-                        port_name = line.replace('Hardware Port:', '').strip()
-                        for j in range(i + 1, min(i + 3, len(lines))):
-                            if 'Device:' in lines[j]:
-                                device = lines[j].split('Device:')[1].strip()
-                                interfaces['wifi_interfaces'].append({
-                                    'name': device,
-                                    'display_name': f'{port_name} ({device})',
-                                    'type': 'internal',
-                                    'monitor_capable': False
-                                })
-                                break
+                for match in _NETWORKSETUP_WIFI_RE.finditer(result.stdout):
+                    port_name, device = match.group(1).strip(), match.group(2)
+                    found.append({
+                        'name': device,
+                        'display_name': f'{port_name} ({device})',
+                        'type': 'internal',
+                        'monitor_capable': False
+                    })
             except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.SubprocessError):
                 pass
         else:  # Linux
@@ -533,20 +1213,14 @@ class ModeManager:
                     ['iw', 'dev'],
                     capture_output=True, text=True, timeout=5
                 )
-                current_iface = None
-                for line in result.stdout.split('\n'):
-                    line = line.strip()
-                    if line.startswith('Interface'):
-                        current_iface = line.split()[1]
-                    elif current_iface and 'type' in line:
-                        iface_type = line.split()[-1]
-                        interfaces['wifi_interfaces'].append({
-                            'name': current_iface,
-                            'display_name': f'Wireless ({current_iface}) - {iface_type}',
-                            'type': iface_type,
-                            'monitor_capable': True
-                        })
-                        current_iface = None
+                for match in _IW_DEV_RE.finditer(result.stdout):
+                    current_iface, iface_type = match.groups()
+                    found.append({
+                        'name': current_iface,
+                        'display_name': f'Wireless ({current_iface}) - {iface_type}',
+                        'type': iface_type,
+                        'monitor_capable': True
+                    })
             except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.SubprocessError):
                 # Fall back to iwconfig
                 try:
@@ -554,39 +1228,38 @@ class ModeManager:
                         ['iwconfig'],
                         capture_output=True, text=True, timeout=5
                     )
-                    for line in result.stdout.split('\n'):
-                        if 'IEEE 802.11' in line:
-                            iface = line.split()[0]
-                            interfaces['wifi_interfaces'].append({
-                                'name': iface,
-                                'display_name': f'Wireless ({iface})',
-                                'type': 'managed',
-                                'monitor_capable': True
-                            })
+                    for match in _IWCONFIG_RE.finditer(result.stdout):
+                        iface = match.group(1)
+                        found.append({
+                            'name': iface,
+                            'display_name': f'Wireless ({iface})',
+                            'type': 'managed',
+                            'monitor_capable': True
+                        })
                 except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.SubprocessError):
                     pass
+        return found
 
-        # Detect Bluetooth adapters
-        if platform.system() == 'Linux':
+    @staticmethod
+    def _probe_bt_adapters(system: str) -> list[dict]:
+        """List Bluetooth adapters."""
+        found = []
+        if system == 'Linux':
             try:
                 result = subprocess.run(
                     ['hciconfig'],
                     capture_output=True, text=True, timeout=5
                 )
-                blocks = re.split(r'(?=^hci\d+:)', result.stdout, flags=re.MULTILINE)
-                for block in blocks:
-                    if block.strip():
-                        first_line = block.split('\n')[0]
-                        match = re.match(r'(hci\d+):', first_line)
-                        if match:
-                            iface_name = match.group(1)
-                            is_up = 'UP RUNNING' in block or '\tUP ' in block
-                            interfaces['bt_adapters'].append({
-                                'name': iface_name,
-                                'display_name': f'Bluetooth Adapter ({iface_name})',
-                                'type': 'hci',
-                                'status': 'up' if is_up else 'down'
-                            })
+                for match in _HCI_BLOCK_RE.finditer(result.stdout):
+                    iface_name = match.group(1)
+                    block = match.group(0)
+                    is_up = 'UP RUNNING' in block or '\tUP ' in block
+                    found.append({
+                        'name': iface_name,
+                        'display_name': f'Bluetooth Adapter ({iface_name})',
+                        'type': 'hci',
+                        'status': 'up' if is_up else 'down'
+                    })
             except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.SubprocessError):
                 # Try bluetoothctl as fallback
                 try:
@@ -600,7 +1273,7 @@ class ModeManager:
                             if len(parts) >= 3:
                                 addr = parts[1]
                                 name = ' '.join(parts[2:]) if len(parts) > 2 else 'Bluetooth'
-                                interfaces['bt_adapters'].append({
+                                found.append({
                                     'name': addr,
                                     'display_name': f'{name} ({addr[-8:]})',
                                     'type': 'controller',
@@ -608,7 +1281,7 @@ class ModeManager:
                                 })
                 except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.SubprocessError):
                     pass
-        elif platform.system() == 'Darwin':
+        elif system == 'Darwin':
             try:
                 result = subprocess.run(
                     ['system_profiler', 'SPBluetoothDataType'],
@@ -620,55 +1293,35 @@ class ModeManager:
                     if 'Address:' in line:
                         bt_addr = line.split('Address:')[1].strip()
                         break
-                interfaces['bt_adapters'].append({
+                found.append({
                     'name': 'default',
                     'display_name': f'{bt_name}' + (f' ({bt_addr[-8:]})' if bt_addr else ''),
                     'type': 'macos',
                     'status': 'available'
                 })
             except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.SubprocessError):
-                interfaces['bt_adapters'].append({
+                found.append({
                     'name': 'default',
                     'display_name': 'Built-in Bluetooth',
                     'type': 'macos',
                     'status': 'available'
                 })
+        return found
 
     def _detect_capabilities_fallback(self, capabilities: dict):
         """Fallback capability detection when dependencies module unavailable."""
-        tool_checks = {
-            'pager': ['rtl_fm', 'multimon-ng'],
-            'sensor': ['rtl_433'],
-            'adsb': ['dump1090'],
-            'ais': ['AIS-catcher'],
-            'acars': ['acarsdec'],
-            'aprs': ['rtl_fm', 'direwolf'],
-            'wifi': ['airmon-ng', 'airodump-ng'],
-            'bluetooth': ['bluetoothctl'],
-            'dsc': ['rtl_fm'],
-            'rtlamr': ['rtlamr'],
-            'satellite': [],
-            'listening_post': ['rtl_fm'],
-            'tscm': ['rtl_fm'],
-        }
+        # Look each tool up once, however many modes need it
+        needed = {tool for mode, tools in _FALLBACK_TOOL_CHECKS.items() if mode != 'adsb' for tool in tools}
+        available = {tool for tool in needed if self._check_tool(tool)}
 
-        for mode, tools in tool_checks.items():
-            if not config.modes_enabled.get(mode, True):
+        for mode, tools in _FALLBACK_TOOL_CHECKS.items():
+            if not config.is_mode_enabled(mode):
                 capabilities['modes'][mode] = False
-                continue
-            if not tools:
-                capabilities['modes'][mode] = True
-                continue
-            if mode == 'adsb':
-                capabilities['modes'][mode] = (
-                    self._check_tool('dump1090') or
-                    self._check_tool('dump1090-fa') or
-                    self._check_tool('readsb')
-                )
+            elif mode == 'adsb':
+                # Any one decoder will do
+                capabilities['modes'][mode] = self._find_any_tool(_ADSB_CANDIDATES) is not None
             else:
-                capabilities['modes'][mode] = all(
-                    self._check_tool(tool) for tool in tools
-                )
+                capabilities['modes'][mode] = available.issuperset(tools)
 
     def get_status(self) -> dict:
         """Get overall agent status."""
@@ -684,6 +1337,7 @@ class ModeManager:
         status = {
             'running_modes': list(self.running_modes.keys()),
             'running_modes_detail': running_modes_detail,  # Include device info per mode
+            'sdr_in_use': {str(device): mode for device, mode in self.running_sdr_modes.items()},
             'uptime': time.time() - _start_time,
             'push_enabled': config.push_enabled,
             'push_connected': push_client is not None and push_client.running,
@@ -695,84 +1349,129 @@ class ModeManager:
             status['gps_position'] = gps_pos
         return status
 
+    # Records kept per mode in data_snapshots (pager messages arrive in bursts)
+    SNAPSHOT_LIMIT = 100
+    SNAPSHOT_LIMITS = {'pager': 200, 'listening_post': 500}
+    # Most recent TSCM anomalies kept
+    TSCM_ANOMALY_LIMIT = 100
+
+    def _record_snapshot(self, mode: str, record: dict):
+        """Append a record to the mode's snapshot deque, dropping the oldest when full."""
+        snapshots = self.data_snapshots.get(mode)
+        if snapshots is not None:
+            snapshots.append(record)
+
     # Modes that use RTL-SDR devices
-    SDR_MODES = {'adsb', 'sensor', 'pager', 'ais', 'acars', 'dsc', 'rtlamr', 'listening_post'}
+    SDR_MODES = frozenset({'adsb', 'sensor', 'pager', 'ais', 'acars', 'dsc', 'rtlamr', 'listening_post'})
+
+    @staticmethod
+    def _sdr_device(params: dict) -> int:
+        """SDR device index from mode params, normalized to int (default 0)."""
+        try:
+            return int(params.get('device', 0))
+        except (ValueError, TypeError):
+            return 0
 
     def get_sdr_in_use(self, device: int = 0) -> str | None:
         """Check if an SDR device is in use by another mode.
 
         Returns the mode name using the device, or None if available.
         """
-        for mode, info in self.running_modes.items():
-            if mode in self.SDR_MODES:
-                mode_device = info.get('params', {}).get('device', 0)
-                # Normalize to int for comparison
-                try:
-                    mode_device = int(mode_device)
-                except (ValueError, TypeError):
-                    mode_device = 0
-                if mode_device == device:
-                    return mode
-        return None
+        return self.running_sdr_modes.get(device)
+
+    @staticmethod
+    def _sdr_conflict(device: int, in_use_by: str) -> dict:
+        return {
+            'status': 'error',
+            'message': f'SDR device {device} is in use by {in_use_by}. Stop {in_use_by} first or use a different device.'
+        }
 
     def start_mode(self, mode: str, params: dict) -> dict:
         """Start a mode with given parameters."""
         if mode in self.running_modes:
             return {'status': 'error', 'message': f'{mode} already running'}
 
-        caps = self.detect_capabilities()
+        caps = self.detect_capabilities(sections={'modes'})
         if not caps['modes'].get(mode, False):
             return {'status': 'error', 'message': f'{mode} not available (missing tools)'}
 
         # Check SDR device conflicts for SDR-based modes
-        if mode in self.SDR_MODES:
-            device = params.get('device', 0)
-            try:
-                device = int(device)
-            except (ValueError, TypeError):
-                device = 0
+        device = self._sdr_device(params) if mode in self.SDR_MODES else None
+        if device is not None:
             in_use_by = self.get_sdr_in_use(device)
             if in_use_by:
-                return {
-                    'status': 'error',
-                    'message': f'SDR device {device} is in use by {in_use_by}. Stop {in_use_by} first or use a different device.'
-                }
+                return self._sdr_conflict(device, in_use_by)
 
-        # Initialize lock if needed
-        if mode not in self.locks:
-            self.locks[mode] = threading.Lock()
-
-        with self.locks[mode]:
-            try:
-                # Mode-specific start logic
-                result = self._start_mode_internal(mode, params)
-                if result.get('status') == 'started':
-                    self.running_modes[mode] = {
-                        'started_at': datetime.now(timezone.utc).isoformat(),
-                        'params': params,
-                    }
-                return result
-            except Exception as e:
-                logger.exception(f"Error starting {mode}")
-                return {'status': 'error', 'message': str(e)}
+        if not self._claim_mode(mode, 'starting'):
+            return {'status': 'error', 'message': f'{mode} is already being started or stopped'}
+        reserved = False
+        try:
+            # Another start may have finished between the checks above and the claim
+            if mode in self.running_modes:
+                return {'status': 'error', 'message': f'{mode} already running'}
+            if device is not None:
+                # Reserve the device atomically, so two modes racing for it can't both start
+                in_use_by = self.running_sdr_modes.setdefault(device, mode)
+                if in_use_by != mode:
+                    return self._sdr_conflict(device, in_use_by)
+                reserved = True
+            # Mode-specific start logic
+            result = self._start_mode_internal(mode, params)
+            if mode in ('wifi', 'bluetooth'):
+                self.bust_iface_cache()
+            if result.get('status') == 'started':
+                self.running_modes[mode] = {
+                    'started_at': _utc_now_iso(),
+                    'params': params,
+                }
+                reserved = False  # Held until stop_mode()
+            return result
+        except Exception as e:
+            logger.exception(f"Error starting {mode}")
+            return {'status': 'error', 'message': str(e)}
+        finally:
+            if reserved:
+                self.running_sdr_modes.pop(device, None)
+            self._release_mode(mode)
 
     def stop_mode(self, mode: str) -> dict:
         """Stop a running mode."""
         if mode not in self.running_modes:
             return {'status': 'not_running'}
 
-        if mode not in self.locks:
-            self.locks[mode] = threading.Lock()
+        if not self._claim_mode(mode, 'stopping'):
+            return {'status': 'error', 'message': f'{mode} is already being started or stopped'}
+        try:
+            if mode not in self.running_modes:
+                return {'status': 'not_running'}
+            result = self._stop_mode_internal(mode)
+            if mode in ('wifi', 'bluetooth'):
+                self.bust_iface_cache()
+            info = self.running_modes.pop(mode, None)
+            if info is not None and mode in self.SDR_MODES:
+                device = self._sdr_device(info.get('params', {}))
+                if self.running_sdr_modes.get(device) == mode:
+                    del self.running_sdr_modes[device]
+            return result
+        except Exception as e:
+            logger.exception(f"Error stopping {mode}")
+            return {'status': 'error', 'message': str(e)}
+        finally:
+            self._release_mode(mode)
 
-        with self.locks[mode]:
-            try:
-                result = self._stop_mode_internal(mode)
-                if mode in self.running_modes:
-                    del self.running_modes[mode]
-                return result
-            except Exception as e:
-                logger.exception(f"Error stopping {mode}")
-                return {'status': 'error', 'message': str(e)}
+    def _claim_mode(self, mode: str, action: str) -> bool:
+        """
+        Mark a mode as busy with a start or stop; False if one is in progress.
+
+        dict.setdefault is atomic under the GIL and the claim tuple is built
+        per call, so exactly one caller sees its own claim stored.
+        """
+        claim = (action, threading.get_ident())
+        return self._mode_busy.setdefault(mode, claim) is claim
+
+    def _release_mode(self, mode: str):
+        """Clear the claim taken by _claim_mode()."""
+        self._mode_busy.pop(mode, None)
 
     def get_mode_status(self, mode: str) -> dict:
         """Get status of a specific mode."""
@@ -792,9 +1491,9 @@ class ModeManager:
             elif mode == 'sensor':
                 info['reading_count'] = len(self.data_snapshots.get(mode, []))
             elif mode == 'ais':
-                info['vessel_count'] = len(getattr(self, 'ais_vessels', {}))
+                info['vessel_count'] = len(self.ais_vessels)
             elif mode == 'aprs':
-                info['station_count'] = len(getattr(self, 'aprs_stations', {}))
+                info['station_count'] = len(self.aprs_stations)
             elif mode == 'pager':
                 info['message_count'] = len(self.data_snapshots.get(mode, []))
             elif mode == 'acars':
@@ -802,21 +1501,26 @@ class ModeManager:
             elif mode == 'rtlamr':
                 info['reading_count'] = len(self.data_snapshots.get(mode, []))
             elif mode == 'tscm':
-                info['anomaly_count'] = len(getattr(self, 'tscm_anomalies', []))
+                info['anomaly_count'] = len(self.tscm_anomalies)
             elif mode == 'satellite':
                 info['pass_count'] = len(self.data_snapshots.get(mode, []))
             elif mode == 'listening_post':
-                info['signal_count'] = len(getattr(self, 'listening_post_activity', []))
-                info['current_freq'] = getattr(self, 'listening_post_current_freq', 0)
-                info['freqs_scanned'] = getattr(self, 'listening_post_freqs_scanned', 0)
+                info['signal_count'] = len(self.listening_post_activity)
+                info['current_freq'] = self.listening_post_current_freq
+                info['freqs_scanned'] = self.listening_post_freqs_scanned
             return info
         return {'running': False}
 
     def get_mode_data(self, mode: str) -> dict:
-        """Get current data snapshot for a mode."""
+        """
+        Get current data snapshot for a mode.
+
+        Tracked-object lists are cached per collection until it changes, so
+        the returned data shares them and must not be modified.
+        """
         data = {
             'mode': mode,
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': _utc_now_iso(),
         }
 
         # Add GPS position
@@ -826,50 +1530,50 @@ class ModeManager:
 
         # Mode-specific data
         if mode == 'adsb':
-            data['data'] = list(self.adsb_aircraft.values())
+            data['data'] = self.adsb_aircraft.values_list()
         elif mode == 'wifi':
             data['data'] = {
-                'networks': list(self.wifi_networks.values()),
-                'clients': list(self.wifi_clients.values()),
+                'networks': self.wifi_networks.values_list(),
+                'clients': self.wifi_clients.values_list(),
             }
         elif mode == 'bluetooth':
-            data['data'] = list(self.bluetooth_devices.values())
+            data['data'] = self.bluetooth_devices.values_list()
         elif mode == 'ais':
-            data['data'] = list(getattr(self, 'ais_vessels', {}).values())
+            data['data'] = self.ais_vessels.values_list()
         elif mode == 'aprs':
-            data['data'] = list(getattr(self, 'aprs_stations', {}).values())
+            data['data'] = self.aprs_stations.values_list()
         elif mode == 'tscm':
             data['data'] = {
-                'anomalies': getattr(self, 'tscm_anomalies', []),
-                'baseline': getattr(self, 'tscm_baseline', {}),
-                'wifi_devices': list(self.wifi_networks.values()),
-                'wifi_clients': list(getattr(self, 'tscm_wifi_clients', {}).values()),
-                'bt_devices': list(self.bluetooth_devices.values()),
-                'rf_signals': getattr(self, 'tscm_rf_signals', []),
+                'anomalies': list(self.tscm_anomalies),
+                'baseline': self.tscm_baseline,
+                'wifi_devices': self.wifi_networks.values_list(),
+                'wifi_clients': self.tscm_wifi_clients.values_list(),
+                'bt_devices': self.bluetooth_devices.values_list(),
+                'rf_signals': self.tscm_rf_signals,
             }
         elif mode == 'listening_post':
             data['data'] = {
-                'activity': getattr(self, 'listening_post_activity', []),
-                'current_freq': getattr(self, 'listening_post_current_freq', 0),
-                'freqs_scanned': getattr(self, 'listening_post_freqs_scanned', 0),
-                'signal_count': len(getattr(self, 'listening_post_activity', [])),
+                'activity': list(self.listening_post_activity),
+                'current_freq': self.listening_post_current_freq,
+                'freqs_scanned': self.listening_post_freqs_scanned,
+                'signal_count': len(self.listening_post_activity),
             }
         elif mode == 'pager':
             # Return recent pager messages
-            messages = self.data_snapshots.get(mode, [])
+            messages = self.data_snapshots.get(mode, ())
             data['data'] = {
-                'messages': messages[-50:] if len(messages) > 50 else messages,
+                'messages': list(itertools.islice(messages, max(0, len(messages) - 50), None)),
                 'total_count': len(messages),
             }
         elif mode == 'dsc':
             # Return DSC messages
-            messages = getattr(self, 'dsc_messages', [])
+            messages = self.dsc_messages
             data['data'] = {
-                'messages': messages[-50:] if len(messages) > 50 else messages,
+                'messages': list(itertools.islice(messages, max(0, len(messages) - 50), None)),
                 'total_count': len(messages),
             }
         else:
-            data['data'] = self.data_snapshots.get(mode, [])
+            data['data'] = list(self.data_snapshots.get(mode, ()))
 
         return data
 
@@ -972,7 +1676,7 @@ class ModeManager:
                         }
 
                     self.wifi_monitor_interface = monitor_iface
-                    self._capabilities = None  # Invalidate cache so interfaces refresh
+                    self.bust_iface_cache()  # Interfaces changed
                     logger.info(f"Monitor mode enabled on {monitor_iface}")
                     return {'status': 'success', 'monitor_interface': monitor_iface}
 
@@ -986,7 +1690,7 @@ class ModeManager:
                     subprocess.run([iw_path, interface, 'set', 'monitor', 'control'], capture_output=True)
                     subprocess.run(['ip', 'link', 'set', interface, 'up'], capture_output=True)
                     self.wifi_monitor_interface = interface
-                    self._capabilities = None  # Invalidate cache
+                    self.bust_iface_cache()  # Interfaces changed
                     return {'status': 'success', 'monitor_interface': interface}
                 except Exception as e:
                     return {'status': 'error', 'message': str(e)}
@@ -994,13 +1698,13 @@ class ModeManager:
                 return {'status': 'error', 'message': 'No monitor mode tools available (airmon-ng or iw)'}
 
         else:  # stop
-            current_iface = getattr(self, 'wifi_monitor_interface', None) or interface
+            current_iface = self.wifi_monitor_interface or interface
             if airmon_path:
                 try:
                     subprocess.run([airmon_path, 'stop', current_iface],
                                   capture_output=True, text=True, timeout=15)
                     self.wifi_monitor_interface = None
-                    self._capabilities = None  # Invalidate cache
+                    self.bust_iface_cache()  # Interfaces changed
                     return {'status': 'success', 'message': 'Monitor mode disabled'}
                 except Exception as e:
                     return {'status': 'error', 'message': str(e)}
@@ -1010,7 +1714,7 @@ class ModeManager:
                     subprocess.run([iw_path, current_iface, 'set', 'type', 'managed'], capture_output=True)
                     subprocess.run(['ip', 'link', 'set', current_iface, 'up'], capture_output=True)
                     self.wifi_monitor_interface = None
-                    self._capabilities = None  # Invalidate cache
+                    self.bust_iface_cache()  # Interfaces changed
                     return {'status': 'success', 'message': 'Monitor mode disabled'}
                 except Exception as e:
                     return {'status': 'error', 'message': str(e)}
@@ -1021,35 +1725,45 @@ class ModeManager:
     # Mode-specific implementations
     # =========================================================================
 
+    # Mode -> name of the method that starts it
+    MODE_HANDLERS = {
+        'sensor': '_start_sensor',
+        'adsb': '_start_adsb',
+        'wifi': '_start_wifi',
+        'bluetooth': '_start_bluetooth',
+        'pager': '_start_pager',
+        'ais': '_start_ais',
+        'acars': '_start_acars',
+        'aprs': '_start_aprs',
+        'rtlamr': '_start_rtlamr',
+        'dsc': '_start_dsc',
+        'tscm': '_start_tscm',
+        'satellite': '_start_satellite',
+        'listening_post': '_start_listening_post',
+    }
+
+    # Mode -> name of the method that clears its state once stopped
+    STOP_CLEANUPS = {
+        'adsb': '_cleanup_adsb',
+        'wifi': '_cleanup_wifi',
+        'bluetooth': '_cleanup_bluetooth',
+        'tscm': '_cleanup_tscm',
+        'dsc': '_cleanup_dsc',
+    }
+
     def _start_mode_internal(self, mode: str, params: dict) -> dict:
         """Internal mode start - dispatches to mode-specific handlers."""
         logger.info(f"Starting mode {mode} with params: {params}")
 
         # Initialize data structures
-        self.data_snapshots[mode] = []
-        self.data_queues[mode] = queue.Queue(maxsize=500)
+        self.data_snapshots[mode] = collections.deque(maxlen=self.SNAPSHOT_LIMITS.get(mode, self.SNAPSHOT_LIMIT))
+        self.data_queues[mode] = collections.deque(maxlen=500)
         self.stop_events[mode] = threading.Event()
 
         # Dispatch to mode-specific handler
-        handlers = {
-            'sensor': self._start_sensor,
-            'adsb': self._start_adsb,
-            'wifi': self._start_wifi,
-            'bluetooth': self._start_bluetooth,
-            'pager': self._start_pager,
-            'ais': self._start_ais,
-            'acars': self._start_acars,
-            'aprs': self._start_aprs,
-            'rtlamr': self._start_rtlamr,
-            'dsc': self._start_dsc,
-            'tscm': self._start_tscm,
-            'satellite': self._start_satellite,
-            'listening_post': self._start_listening_post,
-        }
-
-        handler = handlers.get(mode)
-        if handler:
-            return handler(params)
+        handler_name = self.MODE_HANDLERS.get(mode)
+        if handler_name:
+            return getattr(self, handler_name)(params)
 
         # Unknown mode
         logger.warning(f"Unknown mode: {mode}")
@@ -1063,24 +1777,12 @@ class ModeManager:
         if mode in self.stop_events:
             self.stop_events[mode].set()
 
-        # Terminate process if running
-        if mode in self.processes:
-            proc = self.processes[mode]
-            try:
-                if proc and proc.poll() is None:
-                    proc.terminate()
-                    try:
-                        proc.wait(timeout=2)
-                    except subprocess.TimeoutExpired:
-                        proc.kill()
-                        try:
-                            proc.wait(timeout=1)
-                        except Exception:
-                            pass
-            except (OSError, ProcessLookupError) as e:
-                # Process already dead or inaccessible
-                logger.debug(f"Process cleanup for {mode}: {e}")
-            del self.processes[mode]
+        # Terminate the mode's process and any helper process it feeds from
+        procs = [self.processes.pop(mode, None)]
+        aux_name = self.AUX_PROCESSES.get(mode)
+        if aux_name:
+            procs.append(self.processes.pop(aux_name, None))
+        self._terminate_processes(mode, procs)
 
         # Wait for output thread (short timeout since stop event is set)
         if mode in self.output_threads:
@@ -1098,75 +1800,93 @@ class ModeManager:
             del self.data_snapshots[mode]
 
         # Mode-specific cleanup
-        if mode == 'adsb':
-            self.adsb_aircraft.clear()
-        elif mode == 'wifi':
-            self.wifi_networks.clear()
-            self.wifi_clients.clear()
-        elif mode == 'bluetooth':
-            self.bluetooth_devices.clear()
-        elif mode == 'tscm':
-            # Clean up TSCM sub-threads
-            for sub_thread_name in ['tscm_wifi', 'tscm_bt', 'tscm_rf']:
-                if sub_thread_name in self.output_threads:
-                    thread = self.output_threads[sub_thread_name]
-                    if thread and thread.is_alive():
-                        thread.join(timeout=2)
-                    del self.output_threads[sub_thread_name]
-            # Clear TSCM data
-            self.tscm_anomalies = []
-            self.tscm_baseline = {}
-            self.tscm_rf_signals = []
-            self.tscm_wifi_clients = {}
-            # Clear reported threat tracking sets
-            if hasattr(self, '_tscm_reported_wifi'):
-                self._tscm_reported_wifi.clear()
-            if hasattr(self, '_tscm_reported_bt'):
-                self._tscm_reported_bt.clear()
-        elif mode == 'dsc':
-            # Clear DSC data
-            if hasattr(self, 'dsc_messages'):
-                self.dsc_messages = []
-        elif mode == 'pager':
-            # Pager uses two processes: multimon-ng (pager) and rtl_fm (pager_rtl)
-            # Kill the rtl_fm process as well
-            if 'pager_rtl' in self.processes:
-                rtl_proc = self.processes['pager_rtl']
-                if rtl_proc and rtl_proc.poll() is None:
-                    rtl_proc.terminate()
-                    try:
-                        rtl_proc.wait(timeout=3)
-                    except subprocess.TimeoutExpired:
-                        rtl_proc.kill()
-                del self.processes['pager_rtl']
-            # Clear pager data
-            if hasattr(self, 'pager_messages'):
-                self.pager_messages = []
-        elif mode == 'aprs':
-            # APRS uses two processes: decoder (aprs) and rtl_fm (aprs_rtl)
-            if 'aprs_rtl' in self.processes:
-                rtl_proc = self.processes['aprs_rtl']
-                if rtl_proc and rtl_proc.poll() is None:
-                    rtl_proc.terminate()
-                    try:
-                        rtl_proc.wait(timeout=3)
-                    except subprocess.TimeoutExpired:
-                        rtl_proc.kill()
-                del self.processes['aprs_rtl']
-        elif mode == 'rtlamr':
-            # RTLAMR uses two processes: rtlamr and rtl_tcp (rtlamr_tcp)
-            if 'rtlamr_tcp' in self.processes:
-                tcp_proc = self.processes['rtlamr_tcp']
-                if tcp_proc and tcp_proc.poll() is None:
-                    tcp_proc.terminate()
-                    try:
-                        tcp_proc.wait(timeout=3)
-                    except subprocess.TimeoutExpired:
-                        tcp_proc.kill()
-                del self.processes['rtlamr_tcp']
+        cleanup_name = self.STOP_CLEANUPS.get(mode)
+        if cleanup_name:
+            getattr(self, cleanup_name)()
 
         return {'status': 'stopped', 'mode': mode}
 
+    def _cleanup_adsb(self):
+        self.adsb_aircraft.clear()
+
+    def _cleanup_wifi(self):
+        self.wifi_networks.clear()
+        self.wifi_clients.clear()
+
+    def _cleanup_bluetooth(self):
+        scanner = self._bluetooth_scanner_instance
+        try:
+            if scanner:
+                # Unregister first so a late update can't repopulate the cleared devices
+                if self._bluetooth_device_callback:
+                    scanner.remove_device_callback(self._bluetooth_device_callback)
+                scanner.stop_scan()
+        except Exception as e:
+            logger.error(f"Error stopping Bluetooth scanner: {e}")
+        finally:
+            self._bluetooth_scanner_instance = None
+            self._bluetooth_device_callback = None
+            self.bluetooth_devices.clear()
+
+    def _cleanup_tscm(self):
+        # Clean up TSCM sub-threads
+        for sub_thread_name in ['tscm_wifi', 'tscm_bt', 'tscm_rf']:
+            if sub_thread_name in self.output_threads:
+                thread = self.output_threads[sub_thread_name]
+                if thread and thread.is_alive():
+                    thread.join(timeout=2)
+                del self.output_threads[sub_thread_name]
+        # Clear TSCM data
+        self.tscm_anomalies.clear()
+        self.tscm_baseline = {}
+        self.tscm_rf_signals = []
+        self.tscm_wifi_clients = _VersionedDict()
+        # Clear reported threat tracking sets
+        self._tscm_reported_wifi.clear()
+        self._tscm_reported_bt.clear()
+
+    def _cleanup_dsc(self):
+        # Clear DSC data
+        self.dsc_messages = []
+
+    # Helper processes started alongside a mode's main process
+    AUX_PROCESSES = {
+        'pager': 'pager_rtl',  # multimon-ng (pager) reads from rtl_fm (pager_rtl)
+        'aprs': 'aprs_rtl',  # decoder (aprs) reads from rtl_fm (aprs_rtl)
+        'rtlamr': 'rtlamr_tcp',  # rtlamr reads from rtl_tcp (rtlamr_tcp)
+    }
+
+    @staticmethod
+    def _terminate_processes(mode: str, procs: list, timeout: float = 2.0):
+        """
+        Terminate processes together, killing any still alive after timeout.
+
+        All are signalled first and then waited on against one shared
+        deadline, so stopping takes as long as the slowest, not the sum.
+        """
+        live = []
+        for proc in procs:
+            try:
+                if proc and proc.poll() is None:
+                    proc.terminate()
+                    live.append(proc)
+            except (OSError, ProcessLookupError) as e:
+                # Process already dead or inaccessible
+                logger.debug(f"Process cleanup for {mode}: {e}")
+
+        deadline = time.monotonic() + timeout
+        for proc in live:
+            try:
+                proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                try:
+                    proc.kill()
+                    proc.wait(timeout=1)
+                except Exception:
+                    pass
+            except (OSError, ProcessLookupError) as e:
+                logger.debug(f"Process cleanup for {mode}: {e}")
+
     # -------------------------------------------------------------------------
     # SENSOR MODE (rtl_433) - Uses Intercept's SDR abstraction
     # -------------------------------------------------------------------------
@@ -1207,10 +1927,12 @@ class ModeManager:
             cmd = self._build_sensor_command_fallback(freq, gain, device, ppm)
 
         try:
+            # Unbuffered pipes: the reader pulls from stdout's fd in large chunks itself
             proc = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
+                bufsize=0,
             )
             self.processes['sensor'] = proc
 
@@ -1261,35 +1983,29 @@ class ModeManager:
         stop_event = self.stop_events.get(mode)
 
         try:
-            for line in iter(proc.stdout.readline, b''):
+            for line in _iter_lines(proc.stdout):
                 if stop_event and stop_event.is_set():
                     break
 
-                line = line.decode('utf-8', errors='replace').strip()
                 if not line:
                     continue
 
                 try:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                     data['type'] = 'sensor'
-                    data['received_at'] = datetime.now(timezone.utc).isoformat()
+                    data['received_at'] = _utc_now_iso()
 
                     # Add GPS if available
                     gps_pos = gps_manager.position
                     if gps_pos:
                         data['agent_gps'] = gps_pos
 
-                    # Store in snapshot (keep last 100)
-                    snapshots = self.data_snapshots.get(mode, [])
-                    snapshots.append(data)
-                    if len(snapshots) > 100:
-                        snapshots = snapshots[-100:]
-                    self.data_snapshots[mode] = snapshots
+                    self._record_snapshot(mode, data)
 
-                    logger.debug(f"Sensor data: {data.get('model', 'Unknown')}")
+                    logger.debug("Sensor data: %s", data.get('model', 'Unknown'))
 
-                except json.JSONDecodeError:
-                    pass  # Not JSON, ignore
+                except ValueError:
+                    pass  # Not JSON (or not UTF-8), ignore
 
         except (OSError, ValueError) as e:
             # Bad file descriptor or closed file - process was terminated
@@ -1321,16 +2037,9 @@ class ModeManager:
             return self._start_adsb_sbs_connection(remote_sbs_host, remote_sbs_port)
 
         # Check if dump1090 already running on port 30003
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1.0)
-            result = sock.connect_ex(('localhost', 30003))
-            sock.close()
-            if result == 0:
-                logger.info("dump1090 already running, connecting to SBS port")
-                return self._start_adsb_sbs_connection('localhost', 30003)
-        except Exception:
-            pass
+        if self._port_open('localhost', 30003, timeout=1.0):
+            logger.info("dump1090 already running, connecting to SBS port")
+            return self._start_adsb_sbs_connection('localhost', 30003)
 
         # Try using Intercept's SDR abstraction for building the command
         sdr_factory = self._get_sdr_factory()
@@ -1377,8 +2086,12 @@ class ModeManager:
             )
             self.processes['adsb'] = proc
 
-            # Wait for dump1090 to start
-            time.sleep(2)
+            # Wait for dump1090 to open its SBS port (or exit), for up to 2 seconds
+            deadline = time.monotonic() + 2.0
+            while proc.poll() is None and time.monotonic() < deadline:
+                if self._port_open('localhost', 30003, timeout=0.1):
+                    break
+                time.sleep(0.05)
 
             if proc.poll() is not None:
                 stderr = proc.stderr.read().decode('utf-8', errors='ignore')
@@ -1392,13 +2105,34 @@ class ModeManager:
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
 
+    @staticmethod
+    def _port_open(host: str, port: int, timeout: float) -> bool:
+        """Whether a TCP connection to host:port succeeds within timeout."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            return sock.connect_ex((host, port)) == 0
+        except OSError:
+            return False
+        finally:
+            sock.close()
+
     def _find_dump1090(self) -> str | None:
-        """Find dump1090 binary using Intercept's dependency module or fallback."""
+        """
+        Find dump1090 binary using Intercept's dependency module or fallback.
+
+        The result is cached along with other tool lookups, until
+        invalidate_tool_cache() is called.
+        """
+        if self._dump1090_path is _MISSING:
+            self._dump1090_path = self._locate_dump1090()
+        return self._dump1090_path
+
+    def _locate_dump1090(self) -> str | None:
         # Try Intercept's tool path finder first
-        for name in ['dump1090', 'dump1090-fa', 'dump1090-mutability', 'readsb']:
-            path = self._get_tool_path(name)
-            if path:
-                return path
+        path = self._find_any_tool(('dump1090', 'dump1090-fa', 'dump1090-mutability', 'readsb'))
+        if path:
+            return path
 
         # Fallback: check common installation paths
         common_paths = [
@@ -1446,22 +2180,44 @@ class ModeManager:
                 logger.info(f"Connected to SBS at {host}:{port}")
                 retry_count = 0
 
-                buffer = ""
-                sock.settimeout(1.0)
-
-                while not (stop_event and stop_event.is_set()):
-                    try:
-                        data = sock.recv(4096).decode('utf-8', errors='ignore')
-                        if not data:
-                            break
-                        buffer += data
-
-                        while '\n' in buffer:
-                            line, buffer = buffer.split('\n', 1)
-                            self._parse_sbs_line(line.strip())
-
-                    except socket.timeout:
-                        continue
+                buffer = bytearray()
+                # Wait for data with a selector rather than a socket timeout, so
+                # idle seconds don't each raise and catch socket.timeout
+                sock.setblocking(False)
+                connected = True
+
+                with selectors.DefaultSelector() as selector:
+                    selector.register(sock, selectors.EVENT_READ)
+                    while connected and not (stop_event and stop_event.is_set()):
+                        if not selector.select(1.0):
+                            continue
+
+                        # Drain everything that has arrived
+                        while True:
+                            try:
+                                data = sock.recv(65536)
+                            except BlockingIOError:
+                                break
+                            if not data:
+                                connected = False
+                                break
+                            buffer += data
+
+                        # Parse every complete line, then drop them from the buffer in one go;
+                        # lines from one read share a GPS fix and timestamp
+                        gps_pos = gps_manager.position
+                        seen_at = _utc_now_iso()
+                        start = 0
+                        while True:
+                            end = buffer.find(b'\n', start)
+                            if end == -1:
+                                break
+                            self._parse_sbs_line(
+                                buffer[start:end].decode('utf-8', errors='ignore').strip(), gps_pos, seen_at
+                            )
+                            start = end + 1
+                        if start:
+                            del buffer[:start]
 
                 sock.close()
 
@@ -1475,13 +2231,19 @@ class ModeManager:
 
         logger.info("ADS-B SBS reader stopped")
 
-    def _parse_sbs_line(self, line: str):
-        """Parse SBS format line and update aircraft dict."""
-        if not line:
+    def _parse_sbs_line(self, line: str, gps_pos: dict | None = _MISSING, seen_at: str | None = None):
+        """
+        Parse SBS format line and update aircraft dict.
+
+        Readers handling a batch of lines pass the GPS position and timestamp
+        to use; otherwise the current ones are looked up.
+        """
+        # dump1090 also emits SEL/ID/AIR/STA lines; reject them before splitting
+        if not line.startswith('MSG,'):
             return
 
-        parts = line.split(',')
-        if len(parts) < 11 or parts[0] != 'MSG':
+        parts = line.split(',', _SBS_MAX_SPLIT)
+        if len(parts) < 11:
             return
 
         msg_type = parts[1]
@@ -1490,48 +2252,37 @@ class ModeManager:
             return
 
         aircraft = self.adsb_aircraft.get(icao) or {'icao': icao}
-        aircraft['last_seen'] = datetime.now(timezone.utc).isoformat()
+        aircraft['last_seen'] = seen_at or _utc_now_iso()
 
         # Add GPS
-        gps_pos = gps_manager.position
+        if gps_pos is _MISSING:
+            gps_pos = gps_manager.position
         if gps_pos:
             aircraft['agent_gps'] = gps_pos
 
-        try:
-            if msg_type == '1' and len(parts) > 10:
-                callsign = parts[10].strip()
-                if callsign:
-                    aircraft['callsign'] = callsign
-
-            elif msg_type == '3' and len(parts) > 15:
-                if parts[11]:
-                    aircraft['altitude'] = int(float(parts[11]))
-                if parts[14] and parts[15]:
-                    aircraft['lat'] = float(parts[14])
-                    aircraft['lon'] = float(parts[15])
-
-            elif msg_type == '4' and len(parts) > 16:
-                if parts[12]:
-                    aircraft['speed'] = int(float(parts[12]))
-                if parts[13]:
-                    aircraft['heading'] = int(float(parts[13]))
-                if parts[16]:
-                    aircraft['vertical_rate'] = int(float(parts[16]))
-
-            elif msg_type == '5' and len(parts) > 11:
-                if parts[10]:
-                    callsign = parts[10].strip()
-                    if callsign:
-                        aircraft['callsign'] = callsign
-                if parts[11]:
-                    aircraft['altitude'] = int(float(parts[11]))
-
-            elif msg_type == '6' and len(parts) > 17:
-                if parts[17]:
-                    aircraft['squawk'] = parts[17]
-
-        except (ValueError, IndexError):
-            pass
+        spec = _SBS_FIELDS.get(msg_type)
+        if spec is not None and len(parts) >= spec[0]:
+            try:
+                for key, index, kind in spec[1]:
+                    value = parts[index]
+                    if not value:
+                        continue
+                    if kind == 'i':
+                        # Usually plain digits; only go through float for decimals
+                        aircraft[key] = int(value) if '.' not in value else int(float(value))
+                    elif kind == 's':
+                        value = value.strip()
+                        if value:
+                            aircraft[key] = value
+                    elif kind == 'p':
+                        lon = parts[index + 1]
+                        if lon:
+                            aircraft['lat'] = float(value)
+                            aircraft['lon'] = float(lon)
+                    else:
+                        aircraft[key] = value
+            except ValueError:
+                pass
 
         self.adsb_aircraft[icao] = aircraft
 
@@ -1618,34 +2369,64 @@ class ModeManager:
         """Sync WiFi scanner data to agent's data structures."""
         mode = 'wifi'
         stop_event = self.stop_events.get(mode)
+        # BSSID / client MAC -> last_seen of the copy already synced
+        synced_aps: dict[str, Any] = {}
+        synced_clients: dict[str, Any] = {}
 
         while not (stop_event and stop_event.is_set()):
             try:
-                gps_position = gps_manager.position
-
-                # Sync access points
-                for ap in scanner.access_points:
-                    net = ap.to_dict()
-                    if gps_position:
-                        net['agent_gps'] = gps_position
-                    self.wifi_networks[ap.bssid.upper()] = net
-
-                # Sync clients
-                for client in scanner.clients:
-                    client_data = client.to_dict()
-                    if gps_position:
-                        client_data['agent_gps'] = gps_position
-                    self.wifi_clients[client.mac.upper()] = client_data
-
+                self._sync_wifi_scanner(scanner, synced_aps, synced_clients)
                 time.sleep(2)
             except Exception as e:
                 logger.debug(f"WiFi sync error: {e}")
                 time.sleep(2)
 
         # Stop scanner when done
-        if hasattr(self, '_wifi_scanner_instance') and self._wifi_scanner_instance:
+        if self._wifi_scanner_instance:
             self._wifi_scanner_instance.stop_deep_scan()
 
+    def _sync_wifi_scanner(self, scanner, synced_aps: dict, synced_clients: dict):
+        """
+        Copy access points and clients seen since the last sync into the agent's dicts.
+
+        The scanner bumps last_seen on every observation, but not when it counts
+        a new client for an AP or changes the baseline, so those are part of
+        the change key too. Unchanged entries are not serialized again; only
+        their time-derived fields are refreshed in place.
+        """
+        gps_position = gps_manager.position
+
+        # Sync access points
+        for ap in scanner.access_points:
+            bssid = ap.bssid.upper()
+            key = (ap.last_seen, ap.client_count, ap.in_baseline)
+            net = self.wifi_networks.get(bssid)
+            if net is not None and synced_aps.get(bssid) == key:
+                net['age_seconds'] = round(ap.age_seconds, 1)
+                heuristics = net.get('heuristics')
+                if heuristics is not None:
+                    heuristics['is_new'] = ap.is_new
+                    heuristics['is_persistent'] = ap.is_persistent
+                continue
+            net = ap.to_dict()
+            if gps_position:
+                net['agent_gps'] = gps_position
+            self.wifi_networks[bssid] = net
+            synced_aps[bssid] = key
+
+        # Sync clients
+        for client in scanner.clients:
+            mac = client.mac.upper()
+            client_data = self.wifi_clients.get(mac)
+            if client_data is not None and synced_clients.get(mac) == client.last_seen:
+                client_data['age_seconds'] = round(client.age_seconds, 1)
+                continue
+            client_data = client.to_dict()
+            if gps_position:
+                client_data['agent_gps'] = gps_position
+            self.wifi_clients[mac] = client_data
+            synced_clients[mac] = client.last_seen
+
     def _start_wifi_fallback(
         self,
         interface: str | None,
@@ -1764,63 +2545,189 @@ class ModeManager:
             return {'status': 'error', 'message': str(e)}
 
     def _wifi_quick_scan_fallback(self, interface: str | None) -> dict:
-        """Fallback quick scan using nmcli directly."""
-        nmcli_path = shutil.which('nmcli')
-        if not nmcli_path:
-            return {'status': 'error', 'message': 'nmcli not found. Install NetworkManager.'}
+        """Fallback quick scan via NetworkManager, over D-Bus when possible, else nmcli."""
+        rows = self._nm_dbus_wifi_scan(interface)
+        if rows is not None:
+            warning = 'Using fallback NetworkManager D-Bus scanner'
+        else:
+            nmcli_path = shutil.which('nmcli')
+            if not nmcli_path:
+                return {'status': 'error', 'message': 'nmcli not found. Install NetworkManager.'}
+            try:
+                rows = self._nmcli_wifi_scan(nmcli_path, interface)
+            except subprocess.TimeoutExpired:
+                return {'status': 'error', 'message': 'nmcli scan timed out'}
+            except Exception as e:
+                return {'status': 'error', 'message': str(e)}
+            if isinstance(rows, str):
+                return {'status': 'error', 'message': f'nmcli failed: {rows}'}
+            warning = 'Using fallback nmcli scanner'
+
+        networks = []
+        gps_position = gps_manager.position
+        for bssid, essid, channel, signal, security in rows:
+            net = {
+                'bssid': bssid,
+                'essid': essid,
+                'channel': channel,
+                'signal': signal,
+                'rssi_current': signal - 100 if signal else -100,  # Convert % to dBm approx
+                'security': security,
+            }
+            if gps_position:
+                net['agent_gps'] = gps_position
+            networks.append(net)
 
-        try:
-            # Trigger rescan
-            subprocess.run(
-                [nmcli_path, 'device', 'wifi', 'rescan'],
-                capture_output=True,
-                timeout=5
-            )
+        return {
+            'status': 'success',
+            'scan_type': 'quick',
+            'access_points': networks,
+            'networks': networks,
+            'network_count': len(networks),
+            'warnings': [warning],
+            'gps_enabled': gps_manager.is_running,
+            'agent_gps': gps_position
+        }
 
-            # Get results
-            cmd = [nmcli_path, '-t', '-f', 'BSSID,SSID,CHAN,SIGNAL,SECURITY', 'device', 'wifi', 'list']
-            if interface:
-                cmd.extend(['ifname', interface])
+    @staticmethod
+    def _nmcli_wifi_scan(nmcli_path: str, interface: str | None) -> list[tuple] | str:
+        """
+        Rescan and list access points with nmcli.
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
+        Returns (bssid, essid, channel, signal %, security) rows, or nmcli's
+        error output if listing failed.
+        """
+        # Trigger rescan
+        subprocess.run(
+            [nmcli_path, 'device', 'wifi', 'rescan'],
+            capture_output=True,
+            timeout=5
+        )
 
-            if result.returncode != 0:
-                return {'status': 'error', 'message': f'nmcli failed: {result.stderr}'}
+        # Get results
+        cmd = [nmcli_path, '-t', '-f', 'BSSID,SSID,CHAN,SIGNAL,SECURITY', 'device', 'wifi', 'list']
+        if interface:
+            cmd.extend(['ifname', interface])
 
-            networks = []
-            gps_position = gps_manager.position
-            for line in result.stdout.strip().split('\n'):
-                if not line.strip():
-                    continue
-                parts = line.split(':')
-                if len(parts) >= 5:
-                    net = {
-                        'bssid': parts[0],
-                        'essid': parts[1],
-                        'channel': int(parts[2]) if parts[2].isdigit() else 0,
-                        'signal': int(parts[3]) if parts[3].isdigit() else 0,
-                        'rssi_current': int(parts[3]) - 100 if parts[3].isdigit() else -100,  # Convert % to dBm approx
-                        'security': parts[4],
-                    }
-                    if gps_position:
-                        net['agent_gps'] = gps_position
-                    networks.append(net)
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
+        if result.returncode != 0:
+            return result.stderr
 
-            return {
-                'status': 'success',
-                'scan_type': 'quick',
-                'access_points': networks,
-                'networks': networks,
-                'network_count': len(networks),
-                'warnings': ['Using fallback nmcli scanner'],
-                'gps_enabled': gps_manager.is_running,
-                'agent_gps': gps_position
-            }
+        rows = []
+        for line in result.stdout.strip().split('\n'):
+            if not line.strip():
+                continue
+            parts = line.split(':')
+            if len(parts) >= 5:
+                rows.append((
+                    parts[0],
+                    parts[1],
+                    int(parts[2]) if parts[2].isdigit() else 0,
+                    int(parts[3]) if parts[3].isdigit() else 0,
+                    parts[4],
+                ))
+        return rows
+
+    # NetworkManager D-Bus API, used by the quick-scan fallback
+    _NM_SERVICE = 'org.freedesktop.NetworkManager'
+    _NM_PATH = '/org/freedesktop/NetworkManager'
+    _DBUS_PROPERTIES = 'org.freedesktop.DBus.Properties'
+    _NM_DEVICE_TYPE_WIFI = 2
+
+    def _nm_dbus_wifi_scan(self, interface: str | None) -> list[tuple] | None:
+        """
+        Rescan and list access points through NetworkManager's D-Bus API.
+
+        Returns the same rows as _nmcli_wifi_scan() without spawning any
+        processes, or None if dbus-python or NetworkManager is unavailable
+        or the scan fails, so the caller falls back to nmcli.
+        """
+        try:
+            import dbus
+        except ImportError:
+            return None
 
-        except subprocess.TimeoutExpired:
-            return {'status': 'error', 'message': 'nmcli scan timed out'}
+        nm = self._NM_SERVICE
+        try:
+            bus = dbus.SystemBus()
+            manager = bus.get_object(nm, self._NM_PATH)
+            wireless_devices = []
+            for device_path in manager.GetDevices(dbus_interface=nm):
+                device = bus.get_object(nm, device_path)
+                props = dbus.Interface(device, self._DBUS_PROPERTIES)
+                if props.Get(f'{nm}.Device', 'DeviceType') != self._NM_DEVICE_TYPE_WIFI:
+                    continue
+                if interface and props.Get(f'{nm}.Device', 'Interface') != interface:
+                    continue
+                wireless_devices.append((device, props))
+            if not wireless_devices:
+                # No (matching) Wi-Fi device: let nmcli run and report the unknown interface
+                return None
+
+            # Request a rescan on each device, then wait (like nmcli rescan) for it to finish
+            pending = []
+            for device, props in wireless_devices:
+                last_scan = props.Get(f'{nm}.Device.Wireless', 'LastScan')
+                try:
+                    device.RequestScan({}, dbus_interface=f'{nm}.Device.Wireless')
+                    pending.append((props, last_scan))
+                except dbus.exceptions.DBusException:
+                    pass  # Scan already running or rate limited - use current results
+            deadline = time.monotonic() + 5.0
+            while pending and time.monotonic() < deadline:
+                time.sleep(0.1)
+                pending = [
+                    (props, last_scan) for props, last_scan in pending
+                    if props.Get(f'{nm}.Device.Wireless', 'LastScan') == last_scan
+                ]
+
+            rows = []
+            for device, _ in wireless_devices:
+                for ap_path in device.GetAllAccessPoints(dbus_interface=f'{nm}.Device.Wireless'):
+                    ap = bus.get_object(nm, ap_path).GetAll(
+                        f'{nm}.AccessPoint', dbus_interface=self._DBUS_PROPERTIES
+                    )
+                    rows.append((
+                        str(ap['HwAddress']),
+                        bytes(ap['Ssid']).decode('utf-8', errors='replace'),
+                        self._wifi_channel(int(ap['Frequency'])),
+                        int(ap['Strength']),
+                        self._nm_security(int(ap['Flags']), int(ap['WpaFlags']), int(ap['RsnFlags'])),
+                    ))
+            return rows
         except Exception as e:
-            return {'status': 'error', 'message': str(e)}
+            # D-Bus errors or unexpected AP properties: let nmcli handle the scan
+            logger.debug(f"NetworkManager D-Bus scan unavailable: {e}")
+            return None
+
+    @staticmethod
+    def _wifi_channel(frequency_mhz: int) -> int:
+        """WiFi channel number for a centre frequency in MHz (0 if unknown)."""
+        if frequency_mhz == 2484:
+            return 14
+        if 2412 <= frequency_mhz <= 2472:
+            return (frequency_mhz - 2407) // 5
+        if 5150 <= frequency_mhz <= 5895:
+            return (frequency_mhz - 5000) // 5
+        if 5955 <= frequency_mhz <= 7115:
+            return (frequency_mhz - 5950) // 5
+        return 0
+
+    @staticmethod
+    def _nm_security(flags: int, wpa_flags: int, rsn_flags: int) -> str:
+        """Security summary in nmcli's format from NetworkManager AP flags."""
+        security = []
+        if flags & 0x1 and not wpa_flags and not rsn_flags:  # Privacy without WPA: WEP
+            security.append('WEP')
+        if wpa_flags:
+            security.append('WPA1')
+        if rsn_flags & 0x300:  # PSK or 802.1X key management
+            security.append('WPA2')
+        if rsn_flags & 0x400:  # SAE
+            security.append('WPA3')
+        if (wpa_flags | rsn_flags) & 0x200:
+            security.append('802.1X')
+        return ' '.join(security)
 
     def _wifi_csv_reader(self, csv_path: str):
         """Periodically parse airodump-ng CSV and GPS output."""
@@ -1828,16 +2735,21 @@ class ModeManager:
         stop_event = self.stop_events.get(mode)
         csv_file = csv_path + '-01.csv'
         gps_file = csv_path + '-01.gps'
+        # (mtime, size) of the CSV and GPS files as last parsed; airodump-ng
+        # rewrites them whole, so unchanged stats mean nothing new to read
+        last_stats = None
 
         while not (stop_event and stop_event.is_set()):
-            if os.path.exists(csv_file):
+            stats = (self._file_stat(csv_file), self._file_stat(gps_file))
+            if stats[0] is not None and stats != last_stats:
                 try:
                     # Parse GPS file for accurate coordinates (if available)
-                    gps_data = self._parse_airodump_gps(gps_file) if os.path.exists(gps_file) else None
+                    gps_data = self._parse_airodump_gps(gps_file) if stats[1] is not None else None
 
                     networks, clients = self._parse_airodump_csv(csv_file, gps_data)
-                    self.wifi_networks = networks
-                    self.wifi_clients = clients
+                    self.wifi_networks = _VersionedDict(networks)
+                    self.wifi_clients = _VersionedDict(clients)
+                    last_stats = stats
                 except Exception as e:
                     logger.error(f"CSV parse error: {e}")
 
@@ -1845,6 +2757,18 @@ class ModeManager:
 
         logger.info("WiFi CSV reader stopped")
 
+    @staticmethod
+    def _file_stat(path: str) -> tuple[int, int] | None:
+        """(mtime in ns, size) of a file, or None if it doesn't exist."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    # Bytes read from the end of airodump's .gps file; each point is ~100 bytes
+    GPS_TAIL_BYTES = 4096
+
     def _parse_airodump_gps(self, gps_path: str) -> dict | None:
         """
         Parse airodump-ng GPS file for accurate coordinates.
@@ -1857,20 +2781,22 @@ class ModeManager:
         ...
         </gps-run>
 
-        Returns the most recent GPS point.
+        Returns the most recent GPS point. The file grows for the whole
+        capture, so only its tail is read to find the last point.
         """
         try:
-            import xml.etree.ElementTree as ET
-            tree = ET.parse(gps_path)
-            root = tree.getroot()
+            with open(gps_path, 'rb') as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - self.GPS_TAIL_BYTES))
+                tail = f.read()
 
-            # Get the last (most recent) GPS point
-            gps_points = root.findall('.//gps-point')
+            # Get the last (most recent) complete GPS point
+            gps_points = _GPS_POINT_RE.findall(tail)
             if gps_points:
-                last_point = gps_points[-1]
-                lat = last_point.get('lat')
-                lon = last_point.get('lon')
-                alt = last_point.get('alt')
+                attrs = {k.decode(): v.decode('latin-1') for k, v in _XML_ATTR_RE.findall(gps_points[-1])}
+                lat = attrs.get('lat')
+                lon = attrs.get('lon')
+                alt = attrs.get('alt')
 
                 if lat and lon:
                     return {
@@ -1888,6 +2814,8 @@ class ModeManager:
         """Parse airodump-ng CSV file using Intercept's existing parser."""
         networks = {}
         clients = {}
+        # One timestamp for the whole file - every row was seen by the same scan
+        now = _utc_now_iso()
 
         try:
             # Use Intercept's robust airodump parser (handles edge cases, proper CSV parsing)
@@ -1909,7 +2837,7 @@ class ModeManager:
                     'beacon_count': obs.beacon_count,
                     'data_count': obs.data_count,
                     'band': obs.band,
-                    'last_seen': datetime.now(timezone.utc).isoformat(),
+                    'last_seen': now,
                 }
 
             # Convert client dicts (already in dict format from parser)
@@ -1922,7 +2850,7 @@ class ModeManager:
                         'bssid': client.get('bssid'),
                         'probes': ','.join(client.get('probed_essids', [])),
                         'packets': client.get('packets', 0),
-                        'last_seen': datetime.now(timezone.utc).isoformat(),
+                        'last_seen': now,
                     }
 
             logger.debug(f"Parsed {len(networks)} networks, {len(clients)} clients")
@@ -1931,36 +2859,44 @@ class ModeManager:
             logger.warning("Intercept WiFi parser not available, using fallback")
             # Fallback: simple parsing if running standalone
             try:
+                import csv
+
+                def to_int(value):
+                    value = value.strip()
+                    return int(value) if value.lstrip('-').isdigit() else None
+
                 with open(csv_path, 'r', errors='replace') as f:
-                    content = f.read()
-                for section in content.split('\n\n'):
-                    lines = section.strip().split('\n')
-                    if not lines:
-                        continue
-                    header = lines[0]
-                    if 'BSSID' in header and 'ESSID' in header:
-                        for line in lines[1:]:
-                            parts = [p.strip() for p in line.split(',')]
-                            if len(parts) >= 14 and ':' in parts[0]:
-                                networks[parts[0]] = {
-                                    'bssid': parts[0],
-                                    'channel': int(parts[3]) if parts[3].lstrip('-').isdigit() else None,
-                                    'signal': int(parts[8]) if parts[8].lstrip('-').isdigit() else None,
-                                    'security': parts[5],
-                                    'essid': parts[13] or 'Hidden',
-                                    'last_seen': datetime.now(timezone.utc).isoformat(),
-                                }
-                    elif 'Station MAC' in header:
-                        for line in lines[1:]:
-                            parts = [p.strip() for p in line.split(',')]
-                            if len(parts) >= 6 and ':' in parts[0]:
-                                clients[parts[0]] = {
-                                    'mac': parts[0],
-                                    'signal': int(parts[3]) if parts[3].lstrip('-').isdigit() else None,
-                                    'bssid': parts[5] if ':' in parts[5] else None,
-                                    'probes': parts[6] if len(parts) > 6 else '',
-                                    'last_seen': datetime.now(timezone.utc).isoformat(),
-                                }
+                    # Fields are ", "-separated; the access point section comes
+                    # first, then the station section, each under its own header
+                    section = None
+                    for row in csv.reader(f, skipinitialspace=True):
+                        if not row:
+                            continue
+                        first = row[0].strip()
+                        if first == 'BSSID':
+                            section = 'networks' if 'ESSID' in row else None
+                        elif first == 'Station MAC':
+                            section = 'clients'
+                        elif ':' not in first:
+                            continue
+                        elif section == 'networks' and len(row) >= 14:
+                            networks[first] = {
+                                'bssid': first,
+                                'channel': to_int(row[3]),
+                                'signal': to_int(row[8]),
+                                'security': row[5].strip(),
+                                'essid': row[13].strip() or 'Hidden',
+                                'last_seen': now,
+                            }
+                        elif section == 'clients' and len(row) >= 6:
+                            bssid = row[5].strip()
+                            clients[first] = {
+                                'mac': first,
+                                'signal': to_int(row[3]),
+                                'bssid': bssid if ':' in bssid else None,
+                                'probes': row[6].strip() if len(row) > 6 else '',
+                                'last_seen': now,
+                            }
             except Exception as e:
                 logger.error(f"Fallback CSV parse error: {e}")
 
@@ -2010,7 +2946,12 @@ class ModeManager:
             self._bluetooth_scanner_instance = scanner
 
             # Set callback for device updates
+            stop_event = self.stop_events.get('bluetooth')
+
             def on_device_updated(device):
+                # Updates already in flight when the mode stops are dropped
+                if stop_event and stop_event.is_set():
+                    return
                 # Convert to agent's format and store
                 self.bluetooth_devices[device.address.upper()] = {
                     'mac': device.address.upper(),
@@ -2023,18 +2964,10 @@ class ModeManager:
                 }
 
             scanner.add_device_callback(on_device_updated)
+            self._bluetooth_device_callback = on_device_updated
 
-            # Start scanning
+            # Start scanning; the scanner's own threads drive the callback, so no sync thread is needed
             if scanner.start_scan(mode=mode_param, duration_s=duration):
-                # Start thread to sync device data
-                thread = threading.Thread(
-                    target=self._bluetooth_data_sync,
-                    args=(scanner,),
-                    daemon=True
-                )
-                thread.start()
-                self.output_threads['bluetooth'] = thread
-
                 return {
                     'status': 'started',
                     'mode': 'bluetooth',
@@ -2052,33 +2985,6 @@ class ModeManager:
             logger.error(f"Bluetooth scanner error: {e}")
             return {'status': 'error', 'message': str(e)}
 
-    def _bluetooth_data_sync(self, scanner):
-        """Sync Bluetooth scanner data to agent's data structures."""
-        mode = 'bluetooth'
-        stop_event = self.stop_events.get(mode)
-
-        while not (stop_event and stop_event.is_set()):
-            try:
-                # Get devices from scanner
-                devices = scanner.get_devices()
-                for device in devices:
-                    self.bluetooth_devices[device.address.upper()] = {
-                        'mac': device.address.upper(),
-                        'name': device.name,
-                        'rssi': device.rssi_current,
-                        'protocol': device.protocol,
-                        'last_seen': device.last_seen.isoformat() if device.last_seen else None,
-                        'agent_gps': gps_manager.position
-                    }
-                time.sleep(1)
-            except Exception as e:
-                logger.debug(f"Bluetooth sync error: {e}")
-                time.sleep(1)
-
-        # Stop scanner when done
-        if hasattr(self, '_bluetooth_scanner_instance') and self._bluetooth_scanner_instance:
-            self._bluetooth_scanner_instance.stop_scan()
-
     def _start_bluetooth_fallback(self, adapter: str) -> dict:
         """Fallback Bluetooth scanning using bluetoothctl directly."""
         if not shutil.which('bluetoothctl'):
@@ -2117,17 +3023,12 @@ class ModeManager:
             proc.stdin.write(b'scan on\n')
             proc.stdin.flush()
 
-            while not (stop_event and stop_event.is_set()):
-                line = proc.stdout.readline()
-                if not line:
-                    break
-
-                line = line.decode('utf-8', errors='replace').strip()
+            # Wake on output, or every 0.5s to check stop_event, instead of sleeping per line
+            for raw in _iter_lines(proc.stdout, stop_event=stop_event):
+                line = raw.decode('utf-8', errors='replace').strip()
                 if 'Device' in line:
                     self._parse_bluetooth_line(line)
 
-                time.sleep(0.1)
-
             proc.stdin.write(b'scan off\n')
             proc.stdin.write(b'exit\n')
             proc.stdin.flush()
@@ -2140,16 +3041,14 @@ class ModeManager:
 
     def _parse_bluetooth_line(self, line: str):
         """Parse bluetoothctl output line."""
-        import re
-
         # Match device address (MAC)
-        mac_match = re.search(r'([0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5})', line)
+        mac_match = _MAC_RE.search(line)
         if not mac_match:
             return
 
         mac = mac_match.group(1).upper()
         device = self.bluetooth_devices.get(mac) or {'mac': mac}
-        device['last_seen'] = datetime.now(timezone.utc).isoformat()
+        device['last_seen'] = _utc_now_iso()
 
         # Extract name
         if '[NEW]' in line or '[CHG]' in line and 'Name:' not in line:
@@ -2161,7 +3060,7 @@ class ModeManager:
                     device['name'] = name
 
         # Extract RSSI
-        rssi_match = re.search(r'RSSI:\s*(-?\d+)', line)
+        rssi_match = _RSSI_RE.search(line)
         if rssi_match:
             device['rssi'] = int(rssi_match.group(1))
 
@@ -2229,6 +3128,7 @@ class ModeManager:
                 stdin=rtl_fm_proc.stdout,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
+                bufsize=0,
             )
             rtl_fm_proc.stdout.close()  # Allow SIGPIPE
 
@@ -2273,7 +3173,7 @@ class ModeManager:
         stop_event = self.stop_events.get(mode)
 
         try:
-            for line in iter(proc.stdout.readline, b''):
+            for line in _iter_lines(proc.stdout, stop_event=stop_event):
                 if stop_event and stop_event.is_set():
                     break
 
@@ -2283,19 +3183,15 @@ class ModeManager:
 
                 parsed = self._parse_pager_message(line)
                 if parsed:
-                    parsed['received_at'] = datetime.now(timezone.utc).isoformat()
+                    parsed['received_at'] = _utc_now_iso()
 
                     gps_pos = gps_manager.position
                     if gps_pos:
                         parsed['agent_gps'] = gps_pos
 
-                    snapshots = self.data_snapshots.get(mode, [])
-                    snapshots.append(parsed)
-                    if len(snapshots) > 200:
-                        snapshots = snapshots[-200:]
-                    self.data_snapshots[mode] = snapshots
+                    self._record_snapshot(mode, parsed)
 
-                    logger.debug(f"Pager: {parsed.get('protocol')} addr={parsed.get('address')}")
+                    logger.debug("Pager: %s addr=%s", parsed.get('protocol'), parsed.get('address'))
 
         except (OSError, ValueError) as e:
             # Bad file descriptor or closed file - process was terminated
@@ -2329,12 +3225,8 @@ class ModeManager:
             return None
         except ImportError:
             # Fallback to inline parsing if import fails
-            import re
             # POCSAG with message
-            match = re.match(
-                r'(POCSAG\d+):\s*Address:\s*(\d+)\s+Function:\s*(\d+)\s+(Alpha|Numeric):\s*(.*)',
-                line
-            )
+            match = _POCSAG_MSG_RE.match(line)
             if match:
                 return {
                     'type': 'pager',
@@ -2346,10 +3238,7 @@ class ModeManager:
                 }
 
             # POCSAG address only (tone)
-            match = re.match(
-                r'(POCSAG\d+):\s*Address:\s*(\d+)\s+Function:\s*(\d+)\s*$',
-                line
-            )
+            match = _POCSAG_TONE_RE.match(line)
             if match:
                 return {
                     'type': 'pager',
@@ -2361,7 +3250,7 @@ class ModeManager:
                 }
 
             # FLEX format
-            match = re.match(r'FLEX[:\|]\s*(.+)', line)
+            match = _FLEX_RE.match(line)
             if match:
                 return {
                     'type': 'pager',
@@ -2389,9 +3278,6 @@ class ModeManager:
         if not ais_catcher:
             return {'status': 'error', 'message': 'AIS-catcher not found. Install from https://github.com/jvde-github/AIS-catcher'}
 
-        # Initialize vessel dict
-        if not hasattr(self, 'ais_vessels'):
-            self.ais_vessels = {}
         self.ais_vessels.clear()
 
         # Build command - output JSON on TCP port 1234
@@ -2460,10 +3346,6 @@ class ModeManager:
         stop_event = self.stop_events.get(mode)
         retry_count = 0
 
-        # Initialize vessel dict
-        if not hasattr(self, 'ais_vessels'):
-            self.ais_vessels = {}
-
         while not (stop_event and stop_event.is_set()):
             try:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -2472,22 +3354,39 @@ class ModeManager:
                 logger.info(f"Connected to AIS-catcher on port {port}")
                 retry_count = 0
 
-                buffer = ""
-                sock.settimeout(1.0)
-
-                while not (stop_event and stop_event.is_set()):
-                    try:
-                        data = sock.recv(4096).decode('utf-8', errors='ignore')
-                        if not data:
-                            break
-                        buffer += data
-
-                        while '\n' in buffer:
-                            line, buffer = buffer.split('\n', 1)
-                            self._parse_ais_json(line.strip())
+                buffer = bytearray()
+                # Wait with a selector (as the SBS reader does) so stop_event is
+                # rechecked every second even while the channel is quiet
+                sock.setblocking(False)
+                connected = True
+
+                with selectors.DefaultSelector() as selector:
+                    selector.register(sock, selectors.EVENT_READ)
+                    while connected and not (stop_event and stop_event.is_set()):
+                        if not selector.select(1.0):
+                            continue
+
+                        # Drain everything that has arrived
+                        while True:
+                            try:
+                                data = sock.recv(65536)
+                            except BlockingIOError:
+                                break
+                            if not data:
+                                connected = False
+                                break
+                            buffer += data
 
-                    except socket.timeout:
-                        continue
+                        # Parse every complete line, then drop them from the buffer in one go
+                        start = 0
+                        while True:
+                            end = buffer.find(b'\n', start)
+                            if end == -1:
+                                break
+                            self._parse_ais_json(bytes(buffer[start:end]).strip())
+                            start = end + 1
+                        if start:
+                            del buffer[:start]
 
                 sock.close()
 
@@ -2500,14 +3399,14 @@ class ModeManager:
 
         logger.info("AIS TCP reader stopped")
 
-    def _parse_ais_json(self, line: str):
+    def _parse_ais_json(self, line: bytes | str):
         """Parse AIS-catcher JSON output."""
         if not line:
             return
 
         try:
-            msg = json.loads(line)
-        except json.JSONDecodeError:
+            msg = _json_loads(line)
+        except ValueError:
             return
 
         mmsi = msg.get('mmsi')
@@ -2516,7 +3415,7 @@ class ModeManager:
 
         mmsi = str(mmsi)
         vessel = self.ais_vessels.get(mmsi) or {'mmsi': mmsi}
-        vessel['last_seen'] = datetime.now(timezone.utc).isoformat()
+        vessel['last_seen'] = _utc_now_iso()
 
         # Position
         lat = msg.get('latitude') or msg.get('lat')
@@ -2530,29 +3429,39 @@ class ModeManager:
             except (ValueError, TypeError):
                 pass
 
-        # Speed and course
-        for field, max_val in [('speed', 102.3), ('course', 360)]:
-            if field in msg:
-                try:
-                    val = float(msg[field])
-                    if val < max_val:
-                        vessel[field] = round(val, 1)
-                except (ValueError, TypeError):
-                    pass
+        # Speed (102.3 kn = not available) and course (360 = not available)
+        speed = msg.get('speed')
+        if speed is not None:
+            try:
+                speed = float(speed)
+                if speed < 102.3:
+                    vessel['speed'] = round(speed, 1)
+            except (ValueError, TypeError):
+                pass
 
-        if 'heading' in msg:
+        course = msg.get('course')
+        if course is not None:
             try:
-                heading = int(msg['heading'])
+                course = float(course)
+                if course < 360:
+                    vessel['course'] = round(course, 1)
+            except (ValueError, TypeError):
+                pass
+
+        heading = msg.get('heading')
+        if heading is not None:
+            try:
+                heading = int(heading)
                 if heading < 360:
                     vessel['heading'] = heading
             except (ValueError, TypeError):
                 pass
 
         # Static data
-        for field in ['name', 'callsign', 'destination', 'shiptype', 'ship_type']:
-            if field in msg and msg[field]:
-                key = 'ship_type' if field == 'shiptype' else field
-                vessel[key] = str(msg[field]).strip()
+        for field, key in _AIS_STATIC_FIELDS:
+            value = msg.get(field)
+            if value:
+                vessel[key] = str(value).strip()
 
         gps_pos = gps_manager.position
         if gps_pos:
@@ -2567,11 +3476,21 @@ class ModeManager:
     def _detect_acarsdec_fork(self, acarsdec_path: str) -> str:
         """Detect which acarsdec fork is installed.
 
+        Running acarsdec to read its banner takes a subprocess, so the answer
+        is cached per path until invalidate_tool_cache() is called.
+
         Returns:
             '--output' for f00b4r0 fork (DragonOS)
             '-j' for TLeconte v4+
             '-o' for TLeconte v3.x
         """
+        fork = self._acarsdec_forks.get(acarsdec_path)
+        if fork is None:
+            fork = self._acarsdec_forks[acarsdec_path] = self._probe_acarsdec_fork(acarsdec_path)
+        return fork
+
+    @staticmethod
+    def _probe_acarsdec_fork(acarsdec_path: str) -> str:
         try:
             result = subprocess.run(
                 [acarsdec_path],
@@ -2586,8 +3505,7 @@ class ModeManager:
                 return '--output'
 
             # Parse version for TLeconte
-            import re
-            version_match = re.search(r'acarsdec[^\d]*v?(\d+)\.(\d+)', output, re.IGNORECASE)
+            version_match = _ACARSDEC_VER_RE.search(output)
             if version_match:
                 major = int(version_match.group(1))
                 return '-j' if major >= 4 else '-o'
@@ -2631,6 +3549,7 @@ class ModeManager:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
+                bufsize=0,
             )
             self.processes['acars'] = proc
 
@@ -2668,33 +3587,29 @@ class ModeManager:
         stop_event = self.stop_events.get(mode)
 
         try:
-            for line in iter(proc.stdout.readline, b''):
+            for line in _iter_lines(proc.stdout, stop_event=stop_event):
                 if stop_event and stop_event.is_set():
                     break
 
-                line = line.decode('utf-8', errors='replace').strip()
+                line = line.strip()
                 if not line:
                     continue
 
                 try:
-                    msg = json.loads(line)
+                    msg = _json_loads(line)
                     msg['type'] = 'acars'
-                    msg['received_at'] = datetime.now(timezone.utc).isoformat()
+                    msg['received_at'] = _utc_now_iso()
 
                     gps_pos = gps_manager.position
                     if gps_pos:
                         msg['agent_gps'] = gps_pos
 
-                    snapshots = self.data_snapshots.get(mode, [])
-                    snapshots.append(msg)
-                    if len(snapshots) > 100:
-                        snapshots = snapshots[-100:]
-                    self.data_snapshots[mode] = snapshots
+                    self._record_snapshot(mode, msg)
 
-                    logger.debug(f"ACARS: {msg.get('tail', 'Unknown')}")
+                    logger.debug("ACARS: %s", msg.get('tail', 'Unknown'))
 
-                except json.JSONDecodeError:
-                    pass
+                except ValueError:
+                    pass  # Not JSON (or not UTF-8), ignore
 
         except (OSError, ValueError) as e:
             logger.debug(f"ACARS reader stopped: {e}")
@@ -2729,9 +3644,6 @@ class ModeManager:
         if not decoder_path:
             return {'status': 'error', 'message': 'direwolf or multimon-ng not found'}
 
-        # Initialize state
-        if not hasattr(self, 'aprs_stations'):
-            self.aprs_stations = {}
         self.aprs_stations.clear()
 
         # Build rtl_fm command for APRS (22050 Hz for AFSK 1200 baud)
@@ -2773,6 +3685,7 @@ class ModeManager:
                 stdin=rtl_fm_proc.stdout,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
+                bufsize=0,
             )
             rtl_fm_proc.stdout.close()
 
@@ -2813,7 +3726,7 @@ class ModeManager:
         stop_event = self.stop_events.get(mode)
 
         try:
-            for line in iter(proc.stdout.readline, b''):
+            for line in _iter_lines(proc.stdout, stop_event=stop_event):
                 if stop_event and stop_event.is_set():
                     break
 
@@ -2823,7 +3736,7 @@ class ModeManager:
 
                 parsed = self._parse_aprs_packet(line)
                 if parsed:
-                    parsed['received_at'] = datetime.now(timezone.utc).isoformat()
+                    parsed['received_at'] = _utc_now_iso()
 
                     gps_pos = gps_manager.position
                     if gps_pos:
@@ -2833,13 +3746,9 @@ class ModeManager:
                     if callsign:
                         self.aprs_stations[callsign] = parsed
 
-                    snapshots = self.data_snapshots.get(mode, [])
-                    snapshots.append(parsed)
-                    if len(snapshots) > 100:
-                        snapshots = snapshots[-100:]
-                    self.data_snapshots[mode] = snapshots
+                    self._record_snapshot(mode, parsed)
 
-                    logger.debug(f"APRS: {callsign}")
+                    logger.debug("APRS: %s", callsign)
 
         except (OSError, ValueError) as e:
             logger.debug(f"APRS reader stopped: {e}")
@@ -2862,7 +3771,7 @@ class ModeManager:
 
     def _parse_aprs_packet(self, line: str) -> dict | None:
         """Parse APRS packet from direwolf or multimon-ng."""
-        match = re.match(r'([A-Z0-9-]+)>([^:]+):(.+)', line)
+        match = _APRS_PACKET_RE.match(line)
         if not match:
             return None
 
@@ -2878,7 +3787,7 @@ class ModeManager:
         }
 
         # Try to extract position
-        pos_match = re.search(r'[!=/@](\d{4}\.\d{2})([NS])[/\\](\d{5}\.\d{2})([EW])', data)
+        pos_match = _APRS_POSITION_RE.search(data)
         if pos_match:
             lat = float(pos_match.group(1)[:2]) + float(pos_match.group(1)[2:]) / 60
             if pos_match.group(2) == 'S':
@@ -2949,6 +3858,7 @@ class ModeManager:
                 rtlamr_cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
+                bufsize=0,
             )
             self.processes['rtlamr'] = rtlamr_proc
 
@@ -2977,33 +3887,29 @@ class ModeManager:
         stop_event = self.stop_events.get(mode)
 
         try:
-            for line in iter(proc.stdout.readline, b''):
+            for line in _iter_lines(proc.stdout, stop_event=stop_event):
                 if stop_event and stop_event.is_set():
                     break
 
-                line = line.decode('utf-8', errors='replace').strip()
+                line = line.strip()
                 if not line:
                     continue
 
                 try:
-                    msg = json.loads(line)
+                    msg = _json_loads(line)
                     msg['type'] = 'rtlamr'
-                    msg['received_at'] = datetime.now(timezone.utc).isoformat()
+                    msg['received_at'] = _utc_now_iso()
 
                     gps_pos = gps_manager.position
                     if gps_pos:
                         msg['agent_gps'] = gps_pos
 
-                    snapshots = self.data_snapshots.get(mode, [])
-                    snapshots.append(msg)
-                    if len(snapshots) > 100:
-                        snapshots = snapshots[-100:]
-                    self.data_snapshots[mode] = snapshots
+                    self._record_snapshot(mode, msg)
 
-                    logger.debug(f"RTLAMR: meter {msg.get('Message', {}).get('ID', 'Unknown')}")
+                    logger.debug("RTLAMR: meter %s", msg.get('Message', {}).get('ID', 'Unknown'))
 
-                except json.JSONDecodeError:
-                    pass
+                except ValueError:
+                    pass  # Not JSON (or not UTF-8), ignore
 
         except (OSError, ValueError) as e:
             logger.debug(f"RTLAMR reader stopped: {e}")
@@ -3039,9 +3945,8 @@ class ModeManager:
         if not rtl_fm_path:
             return {'status': 'error', 'message': 'rtl_fm not found'}
 
-        # Initialize DSC messages list
-        if not hasattr(self, 'dsc_messages'):
-            self.dsc_messages = []
+        # DSC messages are kept in the mode's snapshot deque
+        self.dsc_messages = self.data_snapshots['dsc']
 
         # Build rtl_fm command for DSC (48kHz sample rate)
         rtl_fm_cmd = [
@@ -3110,7 +4015,7 @@ class ModeManager:
                     break
 
                 for message in decoder.process_audio(audio_data):
-                    message['received_at'] = datetime.now(timezone.utc).isoformat()
+                    message['received_at'] = _utc_now_iso()
 
                     gps_pos = gps_manager.position
                     if gps_pos:
@@ -3118,10 +4023,6 @@ class ModeManager:
 
                     # Store message
                     self.dsc_messages.append(message)
-                    if len(self.dsc_messages) > 100:
-                        self.dsc_messages = self.dsc_messages[-100:]
-
-                    self.data_snapshots[mode] = self.dsc_messages.copy()
                     logger.info(f"DSC message: {message.get('category')} from {message.get('source_mmsi')}")
 
         except ImportError:
@@ -3143,15 +4044,7 @@ class ModeManager:
 
     def _start_tscm(self, params: dict) -> dict:
         """Start TSCM scanning - uses existing Intercept scanning functions."""
-        # Initialize state
-        if not hasattr(self, 'tscm_baseline'):
-            self.tscm_baseline = {}
-        if not hasattr(self, 'tscm_anomalies'):
-            self.tscm_anomalies = []
-        if not hasattr(self, 'tscm_rf_signals'):
-            self.tscm_rf_signals = []
-        if not hasattr(self, 'tscm_wifi_clients'):
-            self.tscm_wifi_clients = {}
+        # Reset state
         self.tscm_anomalies.clear()
         self.tscm_wifi_clients.clear()
 
@@ -3222,17 +4115,17 @@ class ModeManager:
 
         # Load baseline if specified (same as local mode)
         baseline = None
-        if baseline_id and HAS_BASELINE_DB and get_tscm_baseline:
-            baseline = get_tscm_baseline(baseline_id)
+        if baseline_id and _lazy_import('HAS_BASELINE_DB'):
+            baseline = _lazy_import('get_tscm_baseline')(baseline_id)
             if baseline:
                 logger.info(f"TSCM loaded baseline '{baseline.get('name')}' (ID: {baseline_id})")
             else:
                 logger.warning(f"TSCM baseline ID {baseline_id} not found")
 
         # Initialize detector and correlation engine (same as local mode)
-        if HAS_TSCM_MODULES and ThreatDetector:
-            self._tscm_detector = ThreatDetector(baseline=baseline)
-            self._tscm_correlation = CorrelationEngine() if CorrelationEngine else None
+        if _lazy_import('HAS_TSCM_MODULES'):
+            self._tscm_detector = _lazy_import('ThreatDetector')(baseline=baseline)
+            self._tscm_correlation = _lazy_import('CorrelationEngine')()
             if baseline:
                 logger.info("TSCM detector initialized with baseline - will detect 'new_device' threats")
             else:
@@ -3282,8 +4175,6 @@ class ModeManager:
                                     threat = self._tscm_detector.analyze_wifi_device(enriched)
                                     if threat:
                                         self.tscm_anomalies.append(threat)
-                                        if len(self.tscm_anomalies) > 100:
-                                            self.tscm_anomalies = self.tscm_anomalies[-100:]
                                         print(f"[TSCM] WiFi threat: {threat.get('threat_type')} - {threat.get('name')}", flush=True)
 
                                     classification = self._tscm_detector.classify_wifi_device(enriched)
@@ -3372,8 +4263,6 @@ class ModeManager:
                                     threat = self._tscm_detector.analyze_bt_device(enriched)
                                     if threat:
                                         self.tscm_anomalies.append(threat)
-                                        if len(self.tscm_anomalies) > 100:
-                                            self.tscm_anomalies = self.tscm_anomalies[-100:]
                                         logger.info(f"TSCM BT threat: {threat.get('threat_type')} - {threat.get('name')}")
 
                                     classification = self._tscm_detector.classify_bt_device(enriched)
@@ -3416,7 +4305,7 @@ class ModeManager:
                             is_threat = False
 
                             # Use detector to analyze for threats (same as local mode)
-                            if hasattr(self, '_tscm_detector') and self._tscm_detector:
+                            if self._tscm_detector:
                                 threat = self._tscm_detector.analyze_rf_signal(signal)
                                 if threat:
                                     rf_threats.append(threat)
@@ -3426,7 +4315,7 @@ class ModeManager:
                                 analyzed['reasons'] = classification.get('reasons', [])
 
                             # Use correlation engine for scoring (same as local mode)
-                            if hasattr(self, '_tscm_correlation') and self._tscm_correlation:
+                            if self._tscm_correlation:
                                 profile = self._tscm_correlation.analyze_rf_signal(signal)
                                 analyzed['classification'] = profile.risk_level.value
                                 analyzed['score'] = profile.total_score
@@ -3444,8 +4333,6 @@ class ModeManager:
                         # Add RF threats to anomalies list
                         if rf_threats:
                             self.tscm_anomalies.extend(rf_threats)
-                            if len(self.tscm_anomalies) > 100:
-                                self.tscm_anomalies = self.tscm_anomalies[-100:]
                             for threat in rf_threats:
                                 logger.info(f"TSCM RF threat: {threat.get('threat_type')} - {threat.get('identifier')}")
 
@@ -3605,10 +4492,8 @@ class ModeManager:
                     pass
             return {'status': 'error', 'message': f'SDR check failed: {str(e)}'}
 
-        # Initialize state
-        if not hasattr(self, 'listening_post_activity'):
-            self.listening_post_activity = []
-        self.listening_post_activity.clear()
+        # Signal activity is kept in the mode's snapshot deque
+        self.listening_post_activity = self.data_snapshots['listening_post']
         self.listening_post_current_freq = float(start_freq)
 
         thread = threading.Thread(
@@ -3715,7 +4600,7 @@ class ModeManager:
                         'type': 'signal_found',
                         'frequency': current_freq,
                         'modulation': modulation,
-                        'detected_at': datetime.now(timezone.utc).isoformat()
+                        'detected_at': _utc_now_iso()
                     }
 
                     gps_pos = gps_manager.position
@@ -3723,10 +4608,6 @@ class ModeManager:
                         event['agent_gps'] = gps_pos
 
                     self.listening_post_activity.append(event)
-                    if len(self.listening_post_activity) > 500:
-                        self.listening_post_activity = self.listening_post_activity[-500:]
-
-                    self.data_snapshots[mode] = self.listening_post_activity.copy()
                     logger.info(f"Listening post: signal at {current_freq} MHz")
 
             except Exception as e:
@@ -3897,7 +4778,7 @@ class InterceptAgentHandler(BaseHTTPRequestHandler):
         elif path.startswith('/') and path.count('/') == 2:
             # /{mode}/status or /{mode}/data
             parts = path.split('/')
-            mode = parts[1]
+            mode = _MODE_NAMES.get(parts[1], parts[1])
             action = parts[2]
 
             if action == 'status':
@@ -3925,6 +4806,8 @@ class InterceptAgentHandler(BaseHTTPRequestHandler):
                 config.push_enabled = bool(body['push_enabled'])
             if 'push_interval' in body:
                 config.push_interval = int(body['push_interval'])
+            if push_client:
+                push_client.reload()
             self._send_json({'status': 'updated', 'config': config.to_dict()})
 
         elif path == '/wifi/monitor':
@@ -3936,7 +4819,7 @@ class InterceptAgentHandler(BaseHTTPRequestHandler):
         elif path.startswith('/') and path.count('/') == 2:
             # /{mode}/start or /{mode}/stop
             parts = path.split('/')
-            mode = parts[1]
+            mode = _MODE_NAMES.get(parts[1], parts[1])
             action = parts[2]
 
             if action == 'start':
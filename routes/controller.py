@@ -24,7 +24,7 @@ from flask import Blueprint, jsonify, request, Response
 
 from utils.database import (
     create_agent, get_agent, get_agent_by_name, list_agents,
-    update_agent, delete_agent, store_push_payload, get_recent_payloads
+    update_agent, delete_agent, store_push_payload, store_push_payloads, get_recent_payloads
 )
 from utils.agent_client import (
     AgentClient, AgentHTTPError, AgentConnectionError, create_client_from_agent
@@ -43,6 +43,8 @@ controller_bp = Blueprint('controller', __name__, url_prefix='/controller')
 _agent_stream_subscribers: set[queue.Queue] = set()
 _agent_stream_subscribers_lock = threading.Lock()
 _AGENT_STREAM_CLIENT_QUEUE_SIZE = 500
+# Most payloads accepted in one /api/ingest/batch request (agents send up to 50)
+_MAX_PUSH_BATCH_ITEMS = 500
 
 
 def _broadcast_agent_data(payload: dict) -> None:
@@ -597,6 +599,43 @@ def proxy_wifi_monitor(agent_id: int):
 # Push Data Ingestion
 # =============================================================================
 
+def _authenticate_push_agent(agent_name: str | None) -> tuple[dict | None, tuple[Response, int] | None]:
+    """
+    Resolve and authenticate the agent behind a push request.
+
+    Returns:
+        (agent, None) on success, or (None, error_response) to return as-is
+    """
+    if not agent_name:
+        return None, (jsonify({'status': 'error', 'message': 'agent_name required'}), 400)
+
+    agent = get_agent_by_name(agent_name)
+    if not agent:
+        return None, (jsonify({'status': 'error', 'message': 'Unknown agent'}), 401)
+
+    # Validate API key if configured
+    if agent.get('api_key'):
+        provided_key = request.headers.get('X-API-Key', '')
+        if provided_key != agent['api_key']:
+            logger.warning(f"Invalid API key from agent {agent_name}")
+            return None, (jsonify({'status': 'error', 'message': 'Invalid API key'}), 401)
+
+    return agent, None
+
+
+def _broadcast_pushed_item(agent: dict, agent_name: str, item: dict) -> None:
+    """Emit one ingested payload to the SSE stream."""
+    _broadcast_agent_data({
+        'type': 'agent_data',
+        'agent_id': agent['id'],
+        'agent_name': agent_name,
+        'scan_type': item.get('scan_type'),
+        'interface': item.get('interface'),
+        'payload': item.get('payload'),
+        'received_at': item.get('received_at') or datetime.now(timezone.utc).isoformat()
+    })
+
+
 @controller_bp.route('/api/ingest', methods=['POST'])
 def ingest_push_data():
     """
@@ -619,20 +658,9 @@ def ingest_push_data():
         return jsonify({'status': 'error', 'message': 'No data provided'}), 400
 
     agent_name = data.get('agent_name')
-    if not agent_name:
-        return jsonify({'status': 'error', 'message': 'agent_name required'}), 400
-
-    # Find agent
-    agent = get_agent_by_name(agent_name)
-    if not agent:
-        return jsonify({'status': 'error', 'message': 'Unknown agent'}), 401
-
-    # Validate API key if configured
-    if agent.get('api_key'):
-        provided_key = request.headers.get('X-API-Key', '')
-        if provided_key != agent['api_key']:
-            logger.warning(f"Invalid API key from agent {agent_name}")
-            return jsonify({'status': 'error', 'message': 'Invalid API key'}), 401
+    agent, error = _authenticate_push_agent(agent_name)
+    if error:
+        return error
 
     # Store payload
     try:
@@ -645,15 +673,7 @@ def ingest_push_data():
         )
 
         # Emit to SSE stream (fanout to all connected clients)
-        _broadcast_agent_data({
-            'type': 'agent_data',
-            'agent_id': agent['id'],
-            'agent_name': agent_name,
-            'scan_type': data.get('scan_type'),
-            'interface': data.get('interface'),
-            'payload': data.get('payload'),
-            'received_at': data.get('received_at') or datetime.now(timezone.utc).isoformat()
-        })
+        _broadcast_pushed_item(agent, agent_name, data)
 
         return jsonify({
             'status': 'accepted',
@@ -665,6 +685,58 @@ def ingest_push_data():
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 
+@controller_bp.route('/api/ingest/batch', methods=['POST'])
+def ingest_push_batch():
+    """
+    Receive several pushed payloads from one agent in a single request.
+
+    Expected JSON body:
+    {
+        "agent_name": "sensor-node-1",
+        "items": [
+            {"scan_type": "adsb", "interface": "rtlsdr0", "payload": {...},
+             "received_at": "2024-01-15T10:30:00Z"},
+            ...
+        ]
+    }
+
+    Expected header:
+        X-API-Key: shared-secret (if agent has api_key configured)
+    """
+    data = request.json
+    if not data:
+        return jsonify({'status': 'error', 'message': 'No data provided'}), 400
+
+    items = data.get('items')
+    if not isinstance(items, list) or not items or not all(isinstance(item, dict) for item in items):
+        return jsonify({'status': 'error', 'message': 'items must be a non-empty list of objects'}), 400
+    if len(items) > _MAX_PUSH_BATCH_ITEMS:
+        return jsonify({
+            'status': 'error',
+            'message': f'Too many items in batch (max {_MAX_PUSH_BATCH_ITEMS})'
+        }), 413
+
+    agent_name = data.get('agent_name')
+    agent, error = _authenticate_push_agent(agent_name)
+    if error:
+        return error
+
+    try:
+        payload_ids = store_push_payloads(agent['id'], items)
+
+        for item in items:
+            _broadcast_pushed_item(agent, agent_name, item)
+
+        return jsonify({
+            'status': 'accepted',
+            'payload_ids': payload_ids
+        }), 202
+
+    except Exception as e:
+        logger.exception("Failed to store push payload batch")
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+
 @controller_bp.route('/api/payloads', methods=['GET'])
 def get_payloads():
     """Get recent push payloads."""
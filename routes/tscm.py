@@ -7,6 +7,7 @@ threat detection, and reporting.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import queue
@@ -2388,11 +2389,18 @@ def update_threat(threat_id: int):
 # Preset Endpoints
 # =============================================================================
 
+# The preset listing is static, so serialize it once and let clients
+# revalidate with If-None-Match
+_PRESETS_BODY = json.dumps({'status': 'success', 'presets': get_all_sweep_presets()})
+_PRESETS_ETAG = hashlib.blake2b(_PRESETS_BODY.encode('utf-8'), digest_size=8).hexdigest()
+
+
 @tscm_bp.route('/presets')
 def list_presets():
     """List available sweep presets."""
-    presets = get_all_sweep_presets()
-    return jsonify({'status': 'success', 'presets': presets})
+    response = Response(_PRESETS_BODY, mimetype='application/json')
+    response.set_etag(_PRESETS_ETAG)
+    return response.make_conditional(request)
 
 
 @tscm_bp.route('/presets/<preset_name>')
@@ -11,6 +11,7 @@ Tests cover:
 import json
 import os
 import pytest
+import threading
 import tempfile
 from unittest.mock import Mock, patch, MagicMock
 
@@ -22,7 +23,7 @@ from utils.agent_client import (
 )
 from utils.database import (
     init_db, get_db_path, create_agent, get_agent, get_agent_by_name,
-    list_agents, update_agent, delete_agent, store_push_payload,
+    list_agents, update_agent, delete_agent, store_push_payload, store_push_payloads,
     get_recent_payloads, cleanup_old_payloads
 )
 
@@ -43,6 +44,7 @@ class TestAgentConfig:
         assert config.allow_cors is False
         assert config.push_enabled is False
         assert config.push_interval == 5
+        assert config.push_queue_size == 8192
         assert config.controller_url == ''
         assert 'adsb' in config.modes_enabled
         assert 'wifi' in config.modes_enabled
@@ -64,6 +66,7 @@ url = http://192.168.1.100:5050
 api_key = secret123
 push_enabled = true
 push_interval = 10
+push_queue_size = 1024
 
 [modes]
 pager = false
@@ -88,12 +91,88 @@ bluetooth = false
             assert config.controller_api_key == 'secret123'
             assert config.push_enabled is True
             assert config.push_interval == 10
+            assert config.push_queue_size == 1024
             assert config.modes_enabled['pager'] is False
             assert config.modes_enabled['adsb'] is True
             assert config.modes_enabled['bluetooth'] is False
         finally:
             os.unlink(config_path)
 
+    def test_load_from_file_comments_and_booleans(self):
+        """AgentConfig should skip comments and accept ConfigParser boolean spellings."""
+        from intercept_agent import AgentConfig
+
+        config_content = """
+# Intercept agent
+[agent]
+; inline section comment
+Port: 8030
+allow_cors = yes
+
+[modes]
+pager = off
+sensor = 1
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.cfg', delete=False) as f:
+            f.write(config_content)
+            config_path = f.name
+
+        try:
+            config = AgentConfig()
+            assert config.load_from_file(config_path) is True
+            assert config.port == 8030
+            assert config.allow_cors is True
+            assert config.modes_enabled['pager'] is False
+            assert config.modes_enabled['sensor'] is True
+        finally:
+            os.unlink(config_path)
+
+    def test_parse_ini_splits_at_first_delimiter(self):
+        """_parse_ini should split at the first of '=' and ':' like ConfigParser."""
+        import configparser
+        from intercept_agent import _parse_ini
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.cfg', delete=False) as f:
+            f.write("[agent]\nname: a=b\nurl = http://host:5050\n")
+            config_path = f.name
+
+        try:
+            parser = configparser.ConfigParser(interpolation=None)
+            parser.read(config_path)
+            assert _parse_ini(config_path) == {'agent': dict(parser['agent'])}
+            assert _parse_ini(config_path)['agent'] == {'name': 'a=b', 'url': 'http://host:5050'}
+        finally:
+            os.unlink(config_path)
+
+    def test_load_from_file_rejects_non_positive_queue_size(self):
+        """A push_queue_size below 1 should be ignored in favour of the default."""
+        from intercept_agent import AgentConfig
+
+        for size in ('0', '-5'):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.cfg', delete=False) as f:
+                f.write(f"[controller]\npush_queue_size = {size}\n")
+                config_path = f.name
+
+            try:
+                config = AgentConfig()
+                assert config.load_from_file(config_path) is True
+                assert config.push_queue_size == 8192
+            finally:
+                os.unlink(config_path)
+
+    def test_load_from_file_invalid_boolean(self):
+        """AgentConfig should reject unparseable values."""
+        from intercept_agent import AgentConfig
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.cfg', delete=False) as f:
+            f.write("[controller]\npush_enabled = maybe\n")
+            config_path = f.name
+
+        try:
+            assert AgentConfig().load_from_file(config_path) is False
+        finally:
+            os.unlink(config_path)
+
     def test_load_from_file_missing(self):
         """AgentConfig should handle missing file gracefully."""
         from intercept_agent import AgentConfig
@@ -115,6 +194,21 @@ bluetooth = false
         assert 'modes_enabled' in d
         assert isinstance(d['modes_enabled'], dict)
 
+    def test_mode_enabled_flags(self):
+        """AgentConfig should toggle individual modes and allow unknown ones."""
+        from intercept_agent import AgentConfig
+        config = AgentConfig()
+
+        config.set_mode_enabled('wifi', False)
+
+        assert config.is_mode_enabled('wifi') is False
+        assert config.is_mode_enabled('adsb') is True
+        assert config.is_mode_enabled('not_a_mode') is True
+        assert config.modes_enabled['wifi'] is False
+
+        config.set_mode_enabled('wifi', True)
+        assert config.is_mode_enabled('wifi') is True
+
 
 # =============================================================================
 # AgentClient Tests
@@ -512,6 +606,20 @@ class TestDatabasePayloads:
 
         assert payload_id > 0
 
+    def test_store_push_payloads_batch(self):
+        """store_push_payloads should insert every item in order."""
+        agent_id = create_agent(name='sensor-1', base_url='http://localhost:8020')
+
+        payload_ids = store_push_payloads(agent_id, [
+            {'scan_type': 'adsb', 'payload': {'aircraft': []}, 'interface': 'rtlsdr0'},
+            {'scan_type': 'wifi', 'payload': {'networks': []}},
+        ])
+
+        assert len(payload_ids) == 2
+        assert payload_ids[0] < payload_ids[1]
+        scan_types = {p['scan_type'] for p in get_recent_payloads(agent_id=agent_id)}
+        assert scan_types == {'adsb', 'wifi'}
+
     def test_get_recent_payloads(self):
         """get_recent_payloads should return stored payloads."""
         agent_id = create_agent(name='sensor-1', base_url='http://localhost:8020')
@@ -622,7 +730,7 @@ class TestGPSManager:
         from intercept_agent import GPSManager
         gps = GPSManager()
         assert gps.position is None
-        assert gps._running is False
+        assert gps.is_running is False
 
     def test_gps_manager_position_format(self):
         """GPSManager position should have correct format when set."""
@@ -639,10 +747,320 @@ class TestGPSManager:
             heading = 180.0
             fix_quality = 2
 
-        gps._position = MockPosition()
+        gps._on_position_update(MockPosition())
         pos = gps.position
 
         assert pos is not None
         assert pos['lat'] == 40.7128
         assert pos['lon'] == -74.0060
         assert pos['altitude'] == 10.5
+
+        # Callers share one snapshot until the next fix replaces it
+        assert gps.position is pos
+        gps._on_position_update(MockPosition())
+        assert gps.position is not pos
+
+
+# =============================================================================
+# Controller Push Client Tests
+# =============================================================================
+
+class TestControllerPushClient:
+    """Tests for the agent's controller push client."""
+
+    @staticmethod
+    def _make_client(**settings):
+        from intercept_agent import AgentConfig, ControllerPushClient
+        cfg = AgentConfig()
+        cfg.name = 'test-agent'
+        cfg.controller_url = 'http://controller.local:5050'
+        cfg.push_enabled = True
+        for key, value in settings.items():
+            setattr(cfg, key, value)
+        return ControllerPushClient(cfg)
+
+    def test_enqueue_skipped_when_push_disabled(self):
+        """enqueue should be a no-op while pushing is disabled."""
+        client = self._make_client()
+        client.cfg.push_enabled = False
+        client.reload()
+        client.enqueue('wifi', {'networks': []})
+        assert not client.queue
+
+        client.cfg.push_enabled = True
+        client.reload()
+        client.enqueue('wifi', {'networks': []})
+        assert len(client.queue) == 1
+
+    def test_reload_switches_config(self):
+        """reload() should pick up a new config's agent name."""
+        from intercept_agent import AgentConfig
+        client = self._make_client()
+        cfg = AgentConfig()
+        cfg.name = 'renamed-agent'
+        cfg.controller_url = client.cfg.controller_url
+        cfg.push_enabled = True
+
+        client.reload(cfg)
+        client.enqueue('wifi', {'networks': []})
+
+        assert client.cfg is cfg
+        assert client.queue[0].agent_name == 'renamed-agent'
+
+    def test_enqueue_full_queue_evicts_oldest(self):
+        """A full push queue should keep the newest payloads."""
+        client = self._make_client(push_queue_size=200)
+        for i in range(client.queue.maxlen + 5):
+            client.enqueue('wifi', {'seq': i})
+
+        assert len(client.queue) == client.queue.maxlen
+        assert json.loads(client.queue[0].body)['payload']['seq'] == 5
+
+    def test_queue_size_from_config(self):
+        """The push queue should be sized by push_queue_size."""
+        assert self._make_client().queue.maxlen == 8192
+        assert self._make_client(push_queue_size=16).queue.maxlen == 16
+
+    def test_queue_full_warning_is_throttled(self):
+        """Sustained drops should log one warning per interval, not one per payload."""
+        client = self._make_client(push_queue_size=2)
+        with patch('intercept_agent.logger') as mock_logger:
+            for i in range(10):
+                client.enqueue('wifi', {'seq': i})
+
+        assert mock_logger.warning.call_count == 1
+        assert client._dropped == 7
+
+    def test_enqueue_drops_unserializable_payload(self):
+        """Payloads are serialized on enqueue; ones that cannot be are dropped."""
+        client = self._make_client()
+        client.enqueue('wifi', {'device': object()})
+        assert not client.queue
+
+    def test_next_batch_drains_queue(self):
+        """Queued payloads should be drained into a single batch."""
+        client = self._make_client()
+        for i in range(5):
+            client.enqueue('wifi', {'seq': i})
+
+        batch = client._next_batch()
+
+        assert [json.loads(item.body)['payload']['seq'] for item in batch] == [0, 1, 2, 3, 4]
+        assert not client.queue
+
+    def test_running_follows_thread_state(self):
+        """running should reflect the thread's liveness and stop request."""
+        client = self._make_client()
+        assert client.running is False
+
+        with patch.object(client, 'is_alive', return_value=True):
+            assert client.running is True
+            client.stop()
+            assert client.running is False
+
+    def test_stop_wakes_idle_wait(self):
+        """stop() should release a push thread blocked on an empty queue."""
+        client = self._make_client()
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(client._next_batch()))
+        waiter.start()
+
+        client.stop()
+        waiter.join(timeout=2)
+
+        assert not waiter.is_alive()
+        assert result == [None]
+
+    def test_push_sends_one_batch_request(self):
+        """A batch should be posted once to the batch ingest endpoint."""
+        client = self._make_client()
+        client.enqueue('wifi', {'seq': 0})
+        client.enqueue('bluetooth', {'seq': 1})
+        session = MagicMock()
+        session.post.return_value = Mock(status_code=202)
+
+        client._push(session, client._next_batch())
+
+        session.post.assert_called_once()
+        url = session.post.call_args[0][0]
+        body = json.loads(session.post.call_args[1]['data'])
+        assert url == 'http://controller.local:5050/controller/api/ingest/batch'
+        assert body['agent_name'] == 'test-agent'
+        assert [item['scan_type'] for item in body['items']] == ['wifi', 'bluetooth']
+
+    def test_push_sends_api_key_header(self):
+        """The configured API key should be sent with every push."""
+        client = self._make_client(controller_api_key='secret123')
+        client.enqueue('wifi', {'seq': 0})
+        session = MagicMock()
+        session.post.return_value = Mock(status_code=202)
+
+        client._push(session, client._next_batch())
+
+        headers = session.post.call_args[1]['headers']
+        assert headers == {'Content-Type': 'application/json', 'X-API-Key': 'secret123'}
+
+    def test_push_falls_back_for_old_controllers(self):
+        """A 404 from the batch endpoint should switch to per-item pushes."""
+        client = self._make_client()
+        client.enqueue('wifi', {'seq': 0})
+        client.enqueue('wifi', {'seq': 1})
+        session = MagicMock()
+        session.post.side_effect = [Mock(status_code=404), Mock(status_code=202), Mock(status_code=202)]
+
+        client._push(session, client._next_batch())
+
+        urls = [call[0][0] for call in session.post.call_args_list]
+        assert urls[1:] == ['http://controller.local:5050/controller/api/ingest'] * 2
+        assert client._batch_supported is False
+
+    def test_session_retries_in_adapter(self):
+        """Retries should be handled by the session's urllib3 adapter."""
+        client = self._make_client()
+        session = client._make_session()
+
+        retry = session.get_adapter(client.cfg.controller_url).max_retries
+        assert retry.total == client.MAX_RETRIES
+        assert 503 in retry.status_forcelist
+        assert 'POST' in retry.allowed_methods
+        session.close()
+
+    def test_reload_remounts_session_for_new_controller(self):
+        """Changing controller_url should rebuild the session so retries cover the new URL."""
+        import threading
+        client = self._make_client()
+        posted = threading.Event()
+        sessions = []
+
+        def make_session(controller_url=None):
+            session = MagicMock()
+            session.post.side_effect = lambda *args, **kwargs: (posted.set(), Mock(status_code=202))[1]
+            sessions.append((controller_url, session))
+            return session
+
+        with patch.object(client, '_make_session', side_effect=make_session):
+            client.start()
+            try:
+                client.enqueue('wifi', {'networks': []})
+                assert posted.wait(2)
+                posted.clear()
+
+                client.cfg.controller_url = 'http://other.local:5050'
+                client.reload()
+                client.enqueue('wifi', {'networks': []})
+                assert posted.wait(2)
+            finally:
+                client.stop()
+                client.join(timeout=2)
+
+        assert [url for url, _ in sessions] == ['http://controller.local:5050', 'http://other.local:5050']
+        sessions[0][1].close.assert_called_once()
+        assert sessions[1][1].post.call_args[0][0].startswith('http://other.local:5050/')
+
+    def test_failed_push_is_dropped(self):
+        """A batch that still fails after retries should be dropped and recycled."""
+        client = self._make_client()
+        client.enqueue('wifi', {'networks': []})
+        batch = client._next_batch()
+        item = batch[0]
+        session = MagicMock()
+        session.post.return_value = Mock(status_code=503)
+
+        client._send(session, batch)
+
+        session.post.assert_called_once()
+        assert not client.queue
+        assert item.body is None
+        assert item in client._pool
+
+    def test_sent_items_are_recycled(self):
+        """Items should return to the pool once pushed."""
+        client = self._make_client()
+        client.enqueue('wifi', {'seq': 0})
+        assert len(client._pool) == client.POOL_SIZE - 1
+        session = MagicMock()
+        session.post.return_value = Mock(status_code=202)
+
+        client._send(session, client._next_batch())
+
+        assert len(client._pool) == client.POOL_SIZE
+
+
+# =============================================================================
+# Agent JSON Helper Tests
+# =============================================================================
+
+class TestAgentJson:
+    """Tests for the agent's JSON helpers."""
+
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_json_round_trip(self, has_orjson):
+        """_json_dumps/_json_loads should round-trip with or without orjson."""
+        import intercept_agent
+        if has_orjson and not intercept_agent.HAS_ORJSON:
+            pytest.skip('orjson not installed')
+
+        data = {'icao': 'ABC123', 'altitude': 35000, 'lat': 51.5, 'tags': ['a', None, True]}
+        with patch.object(intercept_agent, 'HAS_ORJSON', has_orjson):
+            encoded = intercept_agent._json_dumps(data)
+            assert isinstance(encoded, bytes)
+            assert intercept_agent._json_loads(encoded) == data
+
+    def test_json_dumps_matches_json_for_edge_cases(self):
+        """_json_dumps should accept what json.dumps accepts."""
+        from intercept_agent import _json_dumps
+
+        data = {1: 'int key', 'big': 2 ** 70}
+        assert json.loads(_json_dumps(data)) == json.loads(json.dumps(data))
+
+    def test_utc_now_iso_reused_within_tick(self):
+        """_utc_now_iso should reuse one string within the cache window."""
+        from datetime import datetime
+        from intercept_agent import _utc_now_iso
+
+        first = _utc_now_iso()
+        assert _utc_now_iso() is first
+        assert datetime.fromisoformat(first).utcoffset().total_seconds() == 0
+
+    def test_format_utc_iso_matches_isoformat(self):
+        """_format_utc_iso should match datetime.isoformat() in UTC."""
+        from datetime import datetime, timezone
+        from intercept_agent import _format_utc_iso
+
+        for time_ns in (1_700_000_000_123_456_789, 1_700_000_000_999_999_000, 1_700_000_001_000_001_000):
+            expected = datetime.fromtimestamp(time_ns // 1000 / 1_000_000, timezone.utc).isoformat()
+            assert _format_utc_iso(time_ns) == expected
+
+    def test_iter_lines_splits_chunks(self):
+        """_iter_lines should rejoin lines split across reads and drop line endings."""
+        import os
+        from intercept_agent import _iter_lines
+
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, 'rb') as reader:
+            with os.fdopen(write_fd, 'wb') as writer:
+                writer.write(b'{"a": 1}\r\n{"b"')
+                writer.flush()
+                writer.write(b': 2}\n\ntail')
+            assert list(_iter_lines(reader, chunk_size=4)) == [b'{"a": 1}', b'{"b": 2}', b'', b'tail']
+
+    def test_iter_lines_stops_on_event_while_idle(self):
+        """_iter_lines should end once stop_event is set even if the pipe stays quiet."""
+        import os
+        import threading
+        import time
+        from intercept_agent import _iter_lines
+
+        read_fd, write_fd = os.pipe()
+        stop_event = threading.Event()
+        try:
+            with os.fdopen(read_fd, 'rb') as reader:
+                os.write(write_fd, b'first\n')
+                lines = _iter_lines(reader, stop_event=stop_event, poll_interval=0.05)
+                assert next(lines) == b'first'
+                threading.Timer(0.1, stop_event.set).start()
+                started = time.monotonic()
+                assert list(lines) == []
+                assert time.monotonic() - started < 1
+        finally:
+            os.close(write_fd)
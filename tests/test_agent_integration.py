@@ -241,6 +241,16 @@ class TestSBSParsing:
         assert aircraft['heading'] == 180
         assert aircraft['vertical_rate'] == 1500
 
+    def test_parse_decimal_fields(self, agent):
+        """Integer fields sent with decimals should still parse; half a position is ignored."""
+        agent._parse_sbs_line(
+            'MSG,3,1,1,A1B2C3,1,2024/01/15,10:30:01.000,2024/01/15,10:30:01.000,,35000.0,,,40.7128,,,,0,0,0,0'
+        )
+
+        aircraft = agent.adsb_aircraft['A1B2C3']
+        assert aircraft['altitude'] == 35000
+        assert 'lat' not in aircraft and 'lon' not in aircraft
+
     def test_parse_msg6_squawk(self, agent):
         """MSG,6 should extract squawk code."""
         agent._parse_sbs_line(SBS_SAMPLES[0])
@@ -262,6 +272,48 @@ class TestSBSParsing:
         assert 'D4E5F6' in agent.adsb_aircraft
         assert agent.adsb_aircraft['D4E5F6']['callsign'] == 'DAL456'
 
+    def test_sbs_reader_joins_split_lines(self, agent):
+        """The SBS reader should reassemble lines split across socket reads."""
+        import socket
+        import threading
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        stream = (SBS_SAMPLES[0] + '\r\n' + SBS_SAMPLES[1] + '\n').encode()
+
+        def serve():
+            conn, _ = server.accept()
+            conn.sendall(stream[:30])
+            time.sleep(0.05)
+            conn.sendall(stream[30:])
+            time.sleep(1)
+            conn.close()
+
+        threading.Thread(target=serve, daemon=True).start()
+        stop_event = agent.stop_events['adsb'] = threading.Event()
+        parsed = []
+
+        def record(line, gps_pos, seen_at):
+            parsed.append(line)
+            if len(parsed) == 2:
+                stop_event.set()
+
+        agent._parse_sbs_line = record
+        agent._adsb_sbs_reader('127.0.0.1', server.getsockname()[1])
+        server.close()
+
+        assert parsed == SBS_SAMPLES[:2]
+
+    def test_parse_uses_batch_gps_and_timestamp(self, agent):
+        """A reader's per-batch GPS fix and timestamp should be used as given."""
+        gps = {'lat': 51.5, 'lon': -0.1}
+        agent._parse_sbs_line(SBS_SAMPLES[0], gps, '2024-01-15T10:30:00+00:00')
+
+        aircraft = agent.adsb_aircraft['A1B2C3']
+        assert aircraft['agent_gps'] is gps
+        assert aircraft['last_seen'] == '2024-01-15T10:30:00+00:00'
+
     def test_parse_malformed_sbs(self, agent):
         """Should handle malformed SBS lines gracefully."""
         # Too few fields
@@ -277,6 +329,91 @@ class TestSBSParsing:
         assert len(agent.adsb_aircraft) == 0
 
 
+class TestAISParsing:
+    """Tests for AIS-catcher JSON parsing."""
+
+    def test_parse_raw_bytes(self, agent):
+        """AIS JSON should parse straight from socket bytes."""
+        agent._parse_ais_json(b'{"mmsi": 366123456, "lat": 37.8, "lon": -122.4, "speed": 12.34, "name": "TUG "}')
+
+        vessel = agent.ais_vessels.get('366123456')
+        assert vessel is not None
+        assert vessel['lat'] == 37.8
+        assert vessel['speed'] == 12.3
+        assert vessel['name'] == 'TUG'
+
+    def test_parse_malformed_ais(self, agent):
+        """Non-JSON and invalid UTF-8 lines should be ignored."""
+        agent._parse_ais_json(b'not json')
+        agent._parse_ais_json(b'{"mmsi": "\xff"}')
+        agent._parse_ais_json(b'')
+
+        assert len(agent.ais_vessels) == 0
+
+    def test_tcp_reader_joins_split_lines(self, agent):
+        """The AIS-catcher reader should rejoin JSON lines split across TCP segments."""
+        import socket
+        import threading
+        import time
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(('localhost', 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+        stop_event = threading.Event()
+        agent.stop_events['ais'] = stop_event
+
+        def serve():
+            conn, _ = server.accept()
+            conn.sendall(b'{"mmsi": 111, "lat": 1.0, "lon": 2.0}\n{"mm')
+            time.sleep(0.05)
+            conn.sendall(b'si": 222, "lat": 3.0, "lon": 4.0}\n')
+            time.sleep(0.05)
+            stop_event.set()
+            conn.close()
+
+        server_thread = threading.Thread(target=serve, daemon=True)
+        server_thread.start()
+        try:
+            agent._ais_tcp_reader(port)
+        finally:
+            server.close()
+        server_thread.join(timeout=2)
+
+        assert set(agent.ais_vessels) == {'111', '222'}
+
+    def test_tcp_reader_stops_while_channel_idle(self, agent):
+        """Stopping AIS should end the reader even if AIS-catcher keeps the connection open but silent."""
+        import socket
+        import threading
+        import time
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(('localhost', 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+        stop_event = threading.Event()
+        agent.stop_events['ais'] = stop_event
+        connections = []
+
+        def serve():
+            conn, _ = server.accept()
+            connections.append(conn)
+
+        threading.Thread(target=serve, daemon=True).start()
+        reader = threading.Thread(target=agent._ais_tcp_reader, args=(port,), daemon=True)
+        reader.start()
+        try:
+            time.sleep(0.2)
+            stop_event.set()
+            reader.join(timeout=3)
+            assert not reader.is_alive()
+        finally:
+            for conn in connections:
+                conn.close()
+            server.close()
+
+
 class TestAirodumpParsing:
     """Tests for airodump-ng CSV parsing using Intercept's parser."""
 
@@ -331,6 +468,55 @@ class TestAirodumpParsing:
 
         assert len(clients) >= 2
 
+    def test_gps_file_last_point_from_tail(self, agent, tmp_path):
+        """The newest GPS point should be found even in a long, still-open capture."""
+        gps_file = tmp_path / 'capture-01.gps'
+        points = ''.join(
+            f'<gps-point lat="{40 + i / 1000:.3f}" lon="-74.000" alt="10.0" spd="0.0" time="{i}"/>\n'
+            for i in range(500)
+        )
+        # airodump hasn't closed <gps-run> yet, and is mid-way through writing a point
+        gps_file.write_text('<?xml version="1.0"?>\n<gps-run gps-version="1">\n' + points + '<gps-point lat="4')
+
+        gps = agent._parse_airodump_gps(str(gps_file))
+        assert gps == {'lat': 40.499, 'lon': -74.0, 'altitude': 10.0, 'source': 'airodump_gps'}
+
+    def test_fallback_parser_without_intercept(self, agent, temp_csv_file):
+        """The standalone CSV fallback should parse both networks and clients."""
+        from unittest.mock import patch
+
+        with patch.dict(sys.modules, {'utils.wifi.parsers.airodump': None}):
+            networks, clients = agent._parse_airodump_csv(temp_csv_file + '-01.csv', None)
+
+        assert networks['00:11:22:33:44:55']['channel'] == 6
+        assert networks['00:11:22:33:44:55']['essid'] == 'HomeWiFi'
+        assert networks['11:22:33:44:55:66']['security'] == 'WPA3'
+        assert clients['CA:FE:BA:BE:00:01']['signal'] == -60
+        assert clients['CA:FE:BA:BE:00:01']['bssid'] == '00:11:22:33:44:55'
+        assert clients['DE:AD:BE:EF:00:02']['probes'] == 'CoffeeShop'
+
+    def test_csv_reader_skips_unchanged_file(self, agent, temp_csv_file):
+        """The CSV reader should only re-parse after airodump rewrites the file."""
+        import threading
+        from unittest.mock import patch
+
+        stop_event = agent.stop_events['wifi'] = threading.Event()
+        ticks = []
+
+        def tick(seconds):
+            ticks.append(seconds)
+            if len(ticks) == 2:
+                with open(temp_csv_file + '-01.csv', 'a') as f:
+                    f.write('\n')
+            elif len(ticks) == 4:
+                stop_event.set()
+
+        with patch.object(agent, '_parse_airodump_csv', return_value=({}, {})) as mock_parse, \
+                patch('intercept_agent.time.sleep', side_effect=tick):
+            agent._wifi_csv_reader(temp_csv_file)
+
+        assert mock_parse.call_count == 2
+
 
 # =============================================================================
 # Live Tool Tests (Require Hardware)
@@ -564,7 +750,7 @@ class TestGPSIntegration:
             heading = 0.0
             fix_quality = 2
 
-        gps._position = MockPosition()
+        gps._on_position_update(MockPosition())
         pos = gps.position
 
         assert pos is not None
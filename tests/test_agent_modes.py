@@ -120,6 +120,19 @@ class TestModeLifecycle:
             # May fail due to SBS port check, but shouldn't crash
             assert result['status'] in ['started', 'error']
 
+    def test_adsb_start_returns_once_port_opens(self, mode_manager, mock_subprocess, mock_tools):
+        """ADS-B start should stop waiting as soon as dump1090's SBS port accepts connections."""
+        with patch.object(mode_manager, '_get_sdr_factory', return_value=None), \
+                patch.object(mode_manager, '_port_open', side_effect=[False, False, True]), \
+                patch.object(mode_manager, '_start_adsb_sbs_connection',
+                             return_value={'status': 'started'}) as mock_connect:
+            start = time.monotonic()
+            result = mode_manager.start_mode('adsb', {'device': '0'})
+
+        assert result['status'] == 'started'
+        assert time.monotonic() - start < 1.0
+        mock_connect.assert_called_once_with('localhost', 30003)
+
     def test_pager_mode_lifecycle(self, mode_manager, mock_subprocess, mock_tools):
         """Pager mode should start and stop cleanly."""
         mock_popen, mock_proc = mock_subprocess
@@ -249,6 +262,46 @@ class TestSDRConflictDetection:
         assert mode_manager.get_sdr_in_use(0) == 'sensor'
         assert mode_manager.get_sdr_in_use(1) is None
 
+    def test_device_reserved_while_starting(self, mode_manager):
+        """A mode that is still starting should already hold its SDR device."""
+        results = {}
+
+        def start_internal(mode, params):
+            # pager tries the same device while sensor is mid-start
+            results['pager'] = mode_manager.start_mode('pager', {'device': 0})
+            return {'status': 'started'}
+
+        with patch.object(mode_manager, '_detect_modes', return_value=({'sensor': True, 'pager': True}, {})), \
+                patch.object(mode_manager, '_start_mode_internal', side_effect=start_internal):
+            assert mode_manager.start_mode('sensor', {'device': 0})['status'] == 'started'
+
+        assert results['pager']['status'] == 'error'
+        assert 'sensor' in results['pager']['message']
+        assert mode_manager.get_status()['sdr_in_use'] == {'0': 'sensor'}
+
+    def test_failed_start_releases_sdr_device(self, mode_manager):
+        """A start that fails should not keep its SDR device reserved."""
+        with patch.object(mode_manager, '_detect_modes', return_value=({'sensor': True}, {})), \
+                patch.object(mode_manager, '_start_mode_internal', return_value={'status': 'error'}):
+            mode_manager.start_mode('sensor', {'device': 0})
+
+        assert mode_manager.get_sdr_in_use(0) is None
+        assert mode_manager.running_sdr_modes == {}
+
+    def test_stop_releases_sdr_device(self, mode_manager):
+        """Stopping an SDR mode should free its device for other modes."""
+        with patch.object(mode_manager, '_detect_modes', return_value=({'sensor': True, 'pager': True}, {})), \
+                patch.object(mode_manager, '_start_mode_internal', return_value={'status': 'started'}), \
+                patch.object(mode_manager, '_stop_mode_internal', return_value={'status': 'stopped'}):
+            mode_manager.start_mode('sensor', {'device': '1'})
+            assert mode_manager.get_sdr_in_use(1) == 'sensor'
+            assert mode_manager.start_mode('pager', {'device': 1})['status'] == 'error'
+
+            mode_manager.stop_mode('sensor')
+            assert mode_manager.get_sdr_in_use(1) is None
+            assert mode_manager.start_mode('pager', {'device': 1})['status'] == 'started'
+            assert mode_manager.get_sdr_in_use(1) == 'pager'
+
 
 # =============================================================================
 # Process Verification Tests
@@ -316,6 +369,66 @@ class TestDataSnapshots:
         # Mode is running - should indicate running status
         assert result.get('running') is True or 'data' in result or 'status' in result
 
+    def test_mode_data_list_cached_until_changed(self, mode_manager):
+        """Tracked-object lists should be reused until an entry is added or removed."""
+        mode_manager.adsb_aircraft['ABC123'] = {'icao': 'ABC123'}
+        first = mode_manager.get_mode_data('adsb')['data']
+        assert mode_manager.get_mode_data('adsb')['data'] is first
+
+        # In-place updates are visible through the shared entry
+        mode_manager.adsb_aircraft['ABC123']['altitude'] = 35000
+        assert first[0]['altitude'] == 35000
+
+        mode_manager.adsb_aircraft['DEF456'] = {'icao': 'DEF456'}
+        second = mode_manager.get_mode_data('adsb')['data']
+        assert second is not first
+        assert [a['icao'] for a in second] == ['ABC123', 'DEF456']
+
+        del mode_manager.adsb_aircraft['ABC123']
+        assert [a['icao'] for a in mode_manager.get_mode_data('adsb')['data']] == ['DEF456']
+
+    def test_setdefault_only_invalidates_on_insert(self, mode_manager):
+        """setdefault() on an existing key should keep the cached list."""
+        aircraft = mode_manager.adsb_aircraft
+        entry = aircraft.setdefault('ABC123', {'icao': 'ABC123'})
+        first = aircraft.values_list()
+
+        assert aircraft.setdefault('ABC123', {'icao': 'other'}) is entry
+        assert aircraft.values_list() is first
+
+        aircraft.setdefault('DEF456', {'icao': 'DEF456'})
+        assert aircraft.values_list() is not first
+
+    def test_repeat_messages_keep_cached_list(self, mode_manager):
+        """Further SBS messages for a known aircraft should not rebuild the cached list."""
+        mode_manager._parse_sbs_line('MSG,1,1,1,ABC123,1,2024/01/01,12:00:00.000,2024/01/01,12:00:00.000,UAL123,,,,,,,,,,,')
+        first = mode_manager.adsb_aircraft.values_list()
+
+        mode_manager._parse_sbs_line(
+            'MSG,3,1,1,ABC123,1,2024/01/01,12:00:01.000,2024/01/01,12:00:01.000,,35000,,,40.7,-74.0,,,,,,0'
+        )
+        assert mode_manager.adsb_aircraft.values_list() is first
+        assert first[0]['altitude'] == 35000
+
+    def test_pager_snapshots_bounded(self, mode_manager):
+        """Pager snapshots should keep the newest messages and report the last 50."""
+        from collections import deque
+        mode_manager.data_snapshots['pager'] = deque(maxlen=mode_manager.SNAPSHOT_LIMITS['pager'])
+        for i in range(250):
+            mode_manager._record_snapshot('pager', {'seq': i})
+
+        data = mode_manager.get_mode_data('pager')['data']
+        assert data['total_count'] == 200
+        assert [m['seq'] for m in data['messages']] == list(range(200, 250))
+
+    def test_tscm_anomalies_bounded(self, mode_manager):
+        """TSCM anomalies should keep only the newest entries."""
+        mode_manager.tscm_anomalies.extend({'seq': i} for i in range(150))
+
+        anomalies = mode_manager.get_mode_data('tscm')['data']['anomalies']
+        assert isinstance(anomalies, list)
+        assert [a['seq'] for a in anomalies] == list(range(50, 150))
+
     def test_data_queue_limit(self, mode_manager):
         """Data queues should respect max size limits."""
         import queue
@@ -355,6 +468,14 @@ class TestModeStatus:
         detail = status['running_modes_detail']['sensor']
         assert 'device' in detail or 'params' in detail
 
+    def test_mode_state_available_before_start(self, mode_manager):
+        """Mode data should be readable for modes that never started."""
+        assert mode_manager.get_mode_data('ais')['data'] == []
+        assert mode_manager.get_mode_data('aprs')['data'] == []
+        assert mode_manager.get_mode_data('dsc')['data']['messages'] == []
+        tscm = mode_manager.get_mode_data('tscm')['data']
+        assert tscm['anomalies'] == [] and tscm['wifi_clients'] == []
+
 
 # =============================================================================
 # Error Handling Tests
@@ -386,6 +507,18 @@ class TestErrorHandling:
 
         assert result['status'] in ['already_running', 'error']
 
+    def test_start_while_busy_returns_error(self, mode_manager, mock_subprocess, mock_tools):
+        """A start racing another start/stop of the same mode should be refused."""
+        assert mode_manager._claim_mode('sensor', 'stopping') is True
+        assert mode_manager._claim_mode('sensor', 'starting') is False
+
+        result = mode_manager.start_mode('sensor', {'device': '0'})
+        assert result['status'] == 'error'
+        assert 'sensor' not in mode_manager.running_modes
+
+        mode_manager._release_mode('sensor')
+        assert mode_manager._claim_mode('sensor', 'starting') is True
+
     def test_stop_non_running_mode(self, mode_manager):
         """Stopping non-running mode should handle gracefully."""
         result = mode_manager.stop_mode('sensor')
@@ -422,6 +555,147 @@ class TestCleanup:
         assert 'bluetooth' not in mode_manager.output_threads or \
                not mode_manager.output_threads['bluetooth'].is_alive()
 
+    def test_bluetooth_scanner_updates_via_callback(self, mode_manager, mock_tools):
+        """Scanner callbacks feed devices directly; stop halts the scanner."""
+        scanner = MagicMock()
+        scanner.start_scan.return_value = True
+        scanner_module = MagicMock()
+        scanner_module.BluetoothScanner.return_value = scanner
+
+        with patch.dict(sys.modules, {'utils.bluetooth.scanner': scanner_module}):
+            result = mode_manager.start_mode('bluetooth', {'adapter': 'hci0'})
+        assert result['status'] == 'started'
+        assert 'bluetooth' not in mode_manager.output_threads
+
+        callback = scanner.add_device_callback.call_args.args[0]
+        device = Mock(address='aa:bb:cc:dd:ee:ff', rssi_current=-60, protocol='ble',
+                      last_seen=None, first_seen=None)
+        device.name = 'Tag'
+        callback(device)
+        assert mode_manager.bluetooth_devices['AA:BB:CC:DD:EE:FF']['name'] == 'Tag'
+
+        mode_manager.stop_mode('bluetooth')
+        scanner.stop_scan.assert_called_once()
+        scanner.remove_device_callback.assert_called_once_with(callback)
+        assert mode_manager._bluetooth_scanner_instance is None
+
+        # A late update from the stopped scan must not bring devices back
+        callback(device)
+        assert not mode_manager.bluetooth_devices
+
+    def test_bluetooth_stops_when_scanner_stop_fails(self, mode_manager):
+        """A failing scanner stop should be logged, not leave the mode stuck running."""
+        scanner = MagicMock()
+        scanner.stop_scan.side_effect = RuntimeError('adapter gone')
+        mode_manager._bluetooth_scanner_instance = scanner
+        mode_manager.running_modes['bluetooth'] = {'started_at': '', 'params': {}}
+        mode_manager.bluetooth_devices['AA:BB:CC:DD:EE:FF'] = {'mac': 'AA:BB:CC:DD:EE:FF'}
+
+        result = mode_manager.stop_mode('bluetooth')
+
+        assert result['status'] == 'stopped'
+        assert 'bluetooth' not in mode_manager.running_modes
+        assert mode_manager._bluetooth_scanner_instance is None
+        assert not mode_manager.bluetooth_devices
+
+    def test_pager_reader_stops_while_decoder_idle(self, mode_manager):
+        """The pager reader should notice stop promptly even when multimon-ng prints nothing."""
+        from collections import deque
+        read_fd, write_fd = os.pipe()
+        proc = MagicMock()
+        proc.stdout = os.fdopen(read_fd, 'rb', buffering=0)
+        stop_event = threading.Event()
+        mode_manager.stop_events['pager'] = stop_event
+        mode_manager.data_snapshots['pager'] = deque(maxlen=10)
+
+        try:
+            os.write(write_fd, b'POCSAG1200: Address: 1234567  Function: 3  Alpha:   HELLO\n')
+            reader = threading.Thread(target=mode_manager._pager_output_reader, args=(proc,), daemon=True)
+            reader.start()
+            deadline = time.monotonic() + 2
+            while not mode_manager.data_snapshots['pager'] and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            stop_event.set()
+            reader.join(timeout=1.5)
+            assert not reader.is_alive()
+            assert mode_manager.data_snapshots['pager'][0]['address'] == '1234567'
+        finally:
+            os.close(write_fd)
+            proc.stdout.close()
+
+    def test_helper_process_terminated_on_stop(self, mode_manager):
+        """A mode's helper process should be terminated alongside its main process."""
+        main_proc, rtl_proc = MagicMock(), MagicMock()
+        main_proc.poll.return_value = None
+        rtl_proc.poll.return_value = None
+        mode_manager.processes.update({'pager': main_proc, 'pager_rtl': rtl_proc})
+
+        mode_manager._stop_mode_internal('pager')
+
+        main_proc.terminate.assert_called_once()
+        rtl_proc.terminate.assert_called_once()
+        assert 'pager_rtl' not in mode_manager.processes
+
+    def test_terminate_waits_against_shared_deadline(self, mode_manager):
+        """Processes share one wait deadline; stragglers are killed."""
+        import subprocess
+        slow, fast = MagicMock(), MagicMock()
+        slow.poll.return_value = None
+        fast.poll.return_value = None
+        slow.wait.side_effect = [subprocess.TimeoutExpired('slow', 2.0), 0]
+
+        mode_manager._terminate_processes('pager', [slow, fast], timeout=2.0)
+
+        slow.kill.assert_called_once()
+        fast.kill.assert_not_called()
+        assert fast.wait.call_args.kwargs['timeout'] <= 2.0
+
+    def test_handler_tables_resolve(self, mode_manager):
+        """Every start handler and stop cleanup name should be a method."""
+        for name in [*mode_manager.MODE_HANDLERS.values(), *mode_manager.STOP_CLEANUPS.values()]:
+            assert callable(getattr(mode_manager, name))
+
+    def test_wifi_sync_skips_unchanged_entries(self, mode_manager):
+        """Scanner entries should only be re-serialized after they change."""
+        ap = MagicMock(bssid='aa:bb:cc:dd:ee:ff', last_seen=1, client_count=0, in_baseline=False,
+                       age_seconds=0.0, is_new=True, is_persistent=False)
+        ap.to_dict.side_effect = lambda: {
+            'bssid': 'AA:BB:CC:DD:EE:FF', 'client_count': ap.client_count, 'age_seconds': 0.0,
+            'heuristics': {'is_new': ap.is_new, 'is_persistent': ap.is_persistent},
+        }
+        scanner = MagicMock(access_points=[ap], clients=[])
+        synced_aps, synced_clients = {}, {}
+
+        mode_manager._sync_wifi_scanner(scanner, synced_aps, synced_clients)
+        ap.age_seconds, ap.is_new = 12.34, False
+        mode_manager._sync_wifi_scanner(scanner, synced_aps, synced_clients)
+        assert ap.to_dict.call_count == 1
+        net = mode_manager.wifi_networks['AA:BB:CC:DD:EE:FF']
+        # Time-derived fields are still refreshed
+        assert net['age_seconds'] == 12.3
+        assert net['heuristics']['is_new'] is False
+
+        ap.last_seen = 2
+        mode_manager._sync_wifi_scanner(scanner, synced_aps, synced_clients)
+        assert ap.to_dict.call_count == 2
+
+        # A new client is counted without moving the AP's last_seen
+        ap.client_count = 1
+        mode_manager._sync_wifi_scanner(scanner, synced_aps, synced_clients)
+        assert ap.to_dict.call_count == 3
+        assert mode_manager.wifi_networks['AA:BB:CC:DD:EE:FF']['client_count'] == 1
+
+    def test_wifi_state_cleared_on_stop(self, mode_manager):
+        """Stopping wifi should clear its tracked networks and clients."""
+        mode_manager.wifi_networks['aa:bb'] = {'bssid': 'aa:bb'}
+        mode_manager.wifi_clients['cc:dd'] = {'mac': 'cc:dd'}
+
+        mode_manager._stop_mode_internal('wifi')
+
+        assert not mode_manager.wifi_networks
+        assert not mode_manager.wifi_clients
+
 
 # =============================================================================
 # Multi-Mode Tests
@@ -476,6 +750,335 @@ class TestGPSIntegration:
             assert 'gps_enabled' in result
 
 
+# =============================================================================
+# Capability Cache Tests
+# =============================================================================
+
+class TestCapabilityCaches:
+    """Test caching of capability probes."""
+
+    @staticmethod
+    def _empty_caps():
+        return {'interfaces': {'wifi_interfaces': [], 'bt_adapters': [], 'sdr_devices': []}}
+
+    def test_interface_probe_is_cached(self, mode_manager):
+        """Interfaces should be probed once per TTL until the cache is busted."""
+        def probe(found):
+            found['wifi_interfaces'].append({'name': 'wlan0'})
+
+        with patch.object(mode_manager, '_probe_interfaces', side_effect=probe) as mock_probe:
+            first = self._empty_caps()
+            mode_manager._detect_interfaces(first)
+            first['interfaces']['wifi_interfaces'][0]['name'] = 'changed'
+
+            second = self._empty_caps()
+            mode_manager._detect_interfaces(second)
+            assert mock_probe.call_count == 1
+            assert second['interfaces']['wifi_interfaces'] == [{'name': 'wlan0'}]
+
+            mode_manager.bust_iface_cache()
+            mode_manager._detect_interfaces(self._empty_caps())
+            assert mock_probe.call_count == 2
+
+    def test_mode_check_skips_sdr_scan(self, mode_manager):
+        """Requesting only modes should not probe SDRs or interfaces."""
+        with patch.object(mode_manager, '_detect_modes', return_value=({'sensor': True}, {})) as mock_modes, \
+                patch.object(mode_manager, '_detect_sdr_devices') as mock_sdr, \
+                patch.object(mode_manager, '_probe_interfaces') as mock_probe:
+            caps = mode_manager.detect_capabilities(sections={'modes'})
+            mode_manager.detect_capabilities(sections={'modes'})
+
+        assert caps['modes'] == {'sensor': True}
+        assert 'devices' not in caps
+        assert mock_modes.call_count == 1
+        mock_sdr.assert_not_called()
+        mock_probe.assert_not_called()
+
+    def test_concurrent_callers_share_one_detection(self, mode_manager):
+        """Threads racing on a cold cache should run detection once."""
+        def slow_detect():
+            time.sleep(0.1)
+            return {'sensor': True}, {}
+
+        with patch.object(mode_manager, '_detect_modes', side_effect=slow_detect) as mock_modes:
+            threads = [
+                threading.Thread(target=mode_manager.detect_capabilities, kwargs={'sections': {'modes'}})
+                for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_modes.call_count == 1
+
+    def test_full_capabilities_have_all_sections(self, mode_manager):
+        """A full capability query should include every section."""
+        sdr_list = [{'name': 'RTL-SDR'}]
+        with patch.object(mode_manager, '_detect_modes', return_value=({}, {})), \
+                patch.object(mode_manager, '_detect_sdr_devices', return_value=sdr_list), \
+                patch.object(mode_manager, '_probe_interfaces'):
+            caps = mode_manager.detect_capabilities()
+
+        assert caps['devices'] == sdr_list
+        assert caps['interfaces']['sdr_devices'] == sdr_list
+        assert caps['interfaces']['wifi_interfaces'] == []
+        assert {'modes', 'tool_details', 'agent_version', 'gps'} <= set(caps)
+
+    def test_sdr_section_expires(self, mode_manager):
+        """SDR devices should be rescanned once their TTL passes."""
+        with patch.object(mode_manager, '_detect_sdr_devices', return_value=[]) as mock_sdr:
+            mode_manager.detect_capabilities(sections={'sdr'})
+            cached_at, devices = mode_manager._caps_parts['sdr']
+            mode_manager._caps_parts['sdr'] = (cached_at - mode_manager._CAPS_TTL['sdr'], devices)
+            mode_manager.detect_capabilities(sections={'sdr'})
+
+            assert mock_sdr.call_count == 2
+
+            mode_manager.invalidate_capabilities('sdr')
+            mode_manager.detect_capabilities(sections={'sdr'})
+            assert mock_sdr.call_count == 3
+
+    def test_failed_utility_import_is_remembered(self, mode_manager):
+        """A missing utility module should only be imported once."""
+        with patch.dict(sys.modules, {'utils.sdr': None}), \
+                patch('intercept_agent.logger') as mock_logger:
+            assert mode_manager._get_sdr_factory() is None
+            assert mode_manager._get_sdr_factory() is None
+
+        assert mock_logger.warning.call_count == 1
+
+    def test_fallback_checks_each_tool_once(self, mode_manager):
+        """The fallback should look up shared tools once and accept any ADS-B decoder."""
+        tools = {'rtl_fm': '/usr/bin/rtl_fm', 'readsb': '/usr/bin/readsb'}
+        capabilities = {'modes': {}}
+        with patch.object(mode_manager, '_get_dependencies', return_value=None), \
+                patch('shutil.which', side_effect=tools.get) as mock_which:
+            mode_manager._detect_capabilities_fallback(capabilities)
+
+        looked_up = [call.args[0] for call in mock_which.call_args_list]
+        assert looked_up.count('rtl_fm') == 1
+        assert capabilities['modes']['adsb'] is True
+        assert capabilities['modes']['dsc'] is True
+        assert capabilities['modes']['pager'] is False
+        assert capabilities['modes']['satellite'] is True
+
+    def test_any_tool_stops_at_first_hit(self, mode_manager):
+        """Multi-candidate lookups should stop at, and then reuse, the first hit."""
+        tools = {'dump1090-fa': '/usr/bin/dump1090-fa'}
+        with patch.object(mode_manager, '_get_dependencies', return_value=None), \
+                patch('shutil.which', side_effect=tools.get) as mock_which:
+            candidates = ('dump1090', 'dump1090-fa', 'readsb')
+            assert mode_manager._find_any_tool(candidates) == '/usr/bin/dump1090-fa'
+            assert mode_manager._find_any_tool(candidates) == '/usr/bin/dump1090-fa'
+
+        assert [call.args[0] for call in mock_which.call_args_list] == ['dump1090', 'dump1090-fa']
+
+    def test_tool_lookup_is_cached(self, mode_manager):
+        """Tool paths should be resolved once until invalidated."""
+        with patch('shutil.which', return_value='/usr/bin/rtl_433') as mock_which:
+            assert mode_manager._check_tool('rtl_433') is True
+            assert mode_manager._get_tool_path('rtl_433') == '/usr/bin/rtl_433'
+            assert mock_which.call_count == 1
+
+            mode_manager.invalidate_tool_cache('rtl_433')
+            mode_manager._check_tool('rtl_433')
+            assert mock_which.call_count == 2
+
+    def test_dump1090_location_is_cached(self, mode_manager):
+        """The dump1090 search, including common install paths, should run once."""
+        with patch.object(mode_manager, '_locate_dump1090', return_value='/usr/bin/dump1090') as mock_locate:
+            assert mode_manager._find_dump1090() == '/usr/bin/dump1090'
+            assert mode_manager._find_dump1090() == '/usr/bin/dump1090'
+            assert mock_locate.call_count == 1
+
+            mode_manager.invalidate_tool_cache()
+            mode_manager._find_dump1090()
+            assert mock_locate.call_count == 2
+
+    def test_acarsdec_fork_probed_once(self, mode_manager):
+        """acarsdec should only be run once per path to detect its fork."""
+        banner = MagicMock(stdout='', stderr='Acarsdec v3.7 Copyright (c) 2022 Thierry Leconte')
+        with patch('subprocess.run', return_value=banner) as mock_run:
+            assert mode_manager._detect_acarsdec_fork('/usr/bin/acarsdec') == '-o'
+            assert mode_manager._detect_acarsdec_fork('/usr/bin/acarsdec') == '-o'
+            assert mock_run.call_count == 1
+
+            mode_manager.invalidate_tool_cache('acarsdec')
+            mode_manager._detect_acarsdec_fork('/usr/bin/acarsdec')
+            assert mock_run.call_count == 2
+
+    def test_missing_tool_is_cached_until_invalidated(self, mode_manager):
+        """A missing tool should stay missing until the cache is cleared."""
+        with patch('shutil.which', return_value=None):
+            assert mode_manager._check_tool('rtlamr') is False
+        with patch('shutil.which', return_value='/usr/bin/rtlamr'):
+            assert mode_manager._check_tool('rtlamr') is False
+            mode_manager.invalidate_tool_cache()
+            assert mode_manager._check_tool('rtlamr') is True
+
+    def test_interface_cache_expires(self, mode_manager):
+        """A probe older than the TTL should be repeated."""
+        with patch.object(mode_manager, '_probe_interfaces') as mock_probe:
+            mode_manager._detect_interfaces(self._empty_caps())
+            cached_at, found = mode_manager._iface_cache
+            mode_manager._iface_cache = (cached_at - mode_manager._IFACE_TTL, found)
+
+            mode_manager._detect_interfaces(self._empty_caps())
+            assert mock_probe.call_count == 2
+
+
+class TestInterfaceProbe:
+    """Test parsing of interface probe tool output."""
+
+    IW_DEV = (
+        "phy#1\n"
+        "\tInterface wlan1mon\n"
+        "\t\tifindex 5\n"
+        "\t\ttype monitor\n"
+        "phy#0\n"
+        "\tInterface wlan0\n"
+        "\t\tifindex 3\n"
+        "\t\taddr 00:11:22:33:44:55\n"
+        "\t\ttype managed\n"
+        "\t\ttxpower 20.00 dBm\n"
+    )
+
+    NETWORKSETUP = (
+        "Hardware Port: Ethernet\n"
+        "Device: en1\n"
+        "Ethernet Address: aa:bb:cc:dd:ee:ff\n"
+        "\n"
+        "Hardware Port: Wi-Fi\n"
+        "Device: en0\n"
+        "Ethernet Address: 00:11:22:33:44:55\n"
+    )
+
+    @staticmethod
+    def _probe(mode_manager, system, outputs):
+        """Run the probe with canned tool output keyed by command name."""
+        def run(cmd, **kwargs):
+            if cmd[0] not in outputs:
+                raise FileNotFoundError(cmd[0])
+            return Mock(stdout=outputs[cmd[0]])
+
+        found = {'wifi_interfaces': [], 'bt_adapters': []}
+        with patch('intercept_agent.platform.system', return_value=system), \
+                patch('intercept_agent.subprocess.run', side_effect=run):
+            mode_manager._probe_interfaces(found)
+        return found
+
+    def test_iw_dev(self, mode_manager):
+        found = self._probe(mode_manager, 'Linux', {'iw': self.IW_DEV})
+        assert [(i['name'], i['type']) for i in found['wifi_interfaces']] == [
+            ('wlan1mon', 'monitor'), ('wlan0', 'managed'),
+        ]
+
+    def test_iwconfig_fallback(self, mode_manager):
+        output = "wlan0     IEEE 802.11  ESSID:off/any\n          Mode:Managed\nlo        no wireless extensions.\n"
+        found = self._probe(mode_manager, 'Linux', {'iwconfig': output})
+        assert [i['name'] for i in found['wifi_interfaces']] == ['wlan0']
+
+    def test_networksetup(self, mode_manager):
+        found = self._probe(mode_manager, 'Darwin', {'networksetup': self.NETWORKSETUP})
+        assert found['wifi_interfaces'] == [{
+            'name': 'en0',
+            'display_name': 'Wi-Fi (en0)',
+            'type': 'internal',
+            'monitor_capable': False,
+        }]
+
+    def test_wifi_and_bluetooth_probes_overlap(self, mode_manager):
+        """The WiFi and Bluetooth probes should run concurrently."""
+        def slow_run(cmd, **kwargs):
+            time.sleep(0.3)
+            return Mock(stdout='')
+
+        found = {'wifi_interfaces': [], 'bt_adapters': []}
+        start = time.monotonic()
+        with patch('intercept_agent.platform.system', return_value='Linux'), \
+                patch('intercept_agent.subprocess.run', side_effect=slow_run):
+            mode_manager._probe_interfaces(found)
+        assert time.monotonic() - start < 0.55
+
+    def test_hciconfig_blocks(self, mode_manager):
+        output = (
+            "hci1:\tType: Primary  Bus: USB\n"
+            "\tBD Address: 00:11:22:33:44:55  ACL MTU: 1021:8  SCO MTU: 64:1\n"
+            "\tDOWN\n"
+            "\n"
+            "hci0:\tType: Primary  Bus: UART\n"
+            "\tBD Address: AA:BB:CC:DD:EE:FF  ACL MTU: 1021:8  SCO MTU: 64:1\n"
+            "\tUP RUNNING\n"
+        )
+        found = self._probe(mode_manager, 'Linux', {'hciconfig': output})
+        assert [(a['name'], a['status']) for a in found['bt_adapters']] == [('hci1', 'down'), ('hci0', 'up')]
+
+
+class TestWifiQuickScanFallback:
+    """Test the NetworkManager quick-scan fallback."""
+
+    def test_nmcli_used_without_dbus(self, mode_manager):
+        """Without D-Bus access the fallback should parse nmcli's terse output."""
+        listing = Mock(returncode=0, stdout='AABBCCDDEEFF:Home:6:70:WPA2\n', stderr='')
+        with patch.object(mode_manager, '_nm_dbus_wifi_scan', return_value=None), \
+                patch('intercept_agent.shutil.which', return_value='/usr/bin/nmcli'), \
+                patch('intercept_agent.subprocess.run', side_effect=[Mock(), listing]):
+            result = mode_manager._wifi_quick_scan_fallback(None)
+
+        assert result['status'] == 'success'
+        assert result['warnings'] == ['Using fallback nmcli scanner']
+        net = result['networks'][0]
+        assert (net['channel'], net['signal'], net['rssi_current'], net['security']) == (6, 70, -30, 'WPA2')
+
+    def test_dbus_rows_skip_nmcli(self, mode_manager):
+        """Rows from D-Bus should be used without running nmcli."""
+        rows = [('AA:BB:CC:DD:EE:FF', 'Home', 36, 80, 'WPA3')]
+        with patch.object(mode_manager, '_nm_dbus_wifi_scan', return_value=rows), \
+                patch('intercept_agent.subprocess.run') as mock_run:
+            result = mode_manager._wifi_quick_scan_fallback('wlan0')
+
+        mock_run.assert_not_called()
+        assert result['networks'][0]['bssid'] == 'AA:BB:CC:DD:EE:FF'
+        assert result['networks'][0]['channel'] == 36
+
+    def test_dbus_unknown_interface_defers_to_nmcli(self, mode_manager):
+        """An interface NetworkManager doesn't manage should fall back to nmcli, not report 0 networks."""
+        dbus = MagicMock()
+        dbus.exceptions.DBusException = type('DBusException', (Exception,), {})
+        bus = dbus.SystemBus.return_value
+        bus.get_object.return_value.GetDevices.return_value = ['/org/freedesktop/NetworkManager/Devices/3']
+        dbus.Interface.return_value.Get.side_effect = lambda iface, prop: {'DeviceType': 2, 'Interface': 'wlan1'}[prop]
+
+        with patch.dict(sys.modules, {'dbus': dbus}):
+            assert mode_manager._nm_dbus_wifi_scan('wlan0') is None
+
+    def test_dbus_malformed_access_point_defers_to_nmcli(self, mode_manager):
+        """Unexpected AP properties from D-Bus should fall back to nmcli rather than raise."""
+        dbus = MagicMock()
+        dbus.exceptions.DBusException = type('DBusException', (Exception,), {})
+        device = MagicMock()
+        device.GetDevices.return_value = ['/org/freedesktop/NetworkManager/Devices/3']
+        device.GetAllAccessPoints.return_value = ['/org/freedesktop/NetworkManager/AccessPoint/1']
+        device.GetAll.return_value = {'HwAddress': 'AA:BB:CC:DD:EE:FF'}  # no Ssid, Frequency, ...
+        dbus.SystemBus.return_value.get_object.return_value = device
+        dbus.Interface.return_value.Get.side_effect = lambda iface, prop: {
+            'DeviceType': 2, 'Interface': 'wlan0', 'LastScan': 1,
+        }[prop]
+        device.RequestScan.side_effect = dbus.exceptions.DBusException('busy')
+
+        with patch.dict(sys.modules, {'dbus': dbus}):
+            assert mode_manager._nm_dbus_wifi_scan('wlan0') is None
+
+    def test_channel_and_security_mapping(self, mode_manager):
+        assert [mode_manager._wifi_channel(f) for f in (2412, 2484, 5180, 5975, 900)] == [1, 14, 36, 5, 0]
+        assert mode_manager._nm_security(0x1, 0, 0) == 'WEP'
+        assert mode_manager._nm_security(0x1, 0, 0x188) == 'WPA2'
+        assert mode_manager._nm_security(0x1, 0x188, 0x588) == 'WPA1 WPA2 WPA3'
+        assert mode_manager._nm_security(0x1, 0, 0x288) == 'WPA2 802.1X'
+        assert mode_manager._nm_security(0, 0, 0) == ''
+
+
 # =============================================================================
 # Run Tests
 # =============================================================================
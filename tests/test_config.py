@@ -46,3 +46,39 @@ class TestConfigEnvVars:
 
         monkeypatch.delenv('INTERCEPT_PORT', raising=False)
         importlib.reload(config)
+
+
+    def test_log_level_env(self, monkeypatch):
+        """Test that LOG_LEVEL resolves to the numeric logging level."""
+        import importlib
+        import logging
+        import config
+
+        monkeypatch.setenv('INTERCEPT_LOG_LEVEL', 'debug')
+        importlib.reload(config)
+        assert config.LOG_LEVEL == logging.DEBUG
+
+        monkeypatch.setenv('INTERCEPT_LOG_LEVEL', 'verbose')
+        importlib.reload(config)
+        assert config.LOG_LEVEL == logging.WARNING
+
+        monkeypatch.delenv('INTERCEPT_LOG_LEVEL', raising=False)
+        importlib.reload(config)
+
+class TestChangelog:
+    """Tests for the lazily loaded changelog."""
+
+    def test_changelog_loaded_on_access(self):
+        """CHANGELOG resolves from data.changelog and is cached on the module."""
+        import config
+        from data.changelog import CHANGELOG
+
+        assert config.CHANGELOG is CHANGELOG
+        assert config.CHANGELOG[0]['version'] == config.VERSION
+        assert 'CHANGELOG' in vars(config)
+
+    def test_unknown_attribute_raises(self):
+        import config
+
+        with pytest.raises(AttributeError):
+            config.NOT_A_SETTING
@@ -357,6 +357,63 @@ class TestPushIngestion:
         data = json.loads(response.data)
         assert 'Invalid API key' in data['message']
 
+    def test_ingest_batch_success(self, client, sample_agent):
+        """POST /controller/api/ingest/batch should store every payload."""
+        body = {
+            'agent_name': 'test-sensor',
+            'items': [
+                {'scan_type': 'adsb', 'interface': 'rtlsdr0', 'payload': {'aircraft': []}},
+                {'scan_type': 'wifi', 'payload': {'networks': []},
+                 'received_at': '2024-01-15T10:30:00+00:00'},
+            ]
+        }
+
+        response = client.post('/controller/api/ingest/batch',
+            json=body,
+            headers={'X-API-Key': 'test-key'},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 202
+        data = json.loads(response.data)
+        assert data['status'] == 'accepted'
+        assert len(data['payload_ids']) == 2
+
+    def test_ingest_batch_requires_items(self, client, sample_agent):
+        """POST /controller/api/ingest/batch should reject an empty batch."""
+        response = client.post('/controller/api/ingest/batch',
+            json={'agent_name': 'test-sensor', 'items': []},
+            headers={'X-API-Key': 'test-key'},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 400
+
+    def test_ingest_batch_rejects_oversized_batch(self, client, sample_agent):
+        """POST /controller/api/ingest/batch should refuse batches over the item cap."""
+        items = [{'scan_type': 'adsb', 'payload': {}}] * 501
+        with patch('routes.controller.store_push_payloads') as mock_store:
+            response = client.post('/controller/api/ingest/batch',
+                json={'agent_name': 'test-sensor', 'items': items},
+                headers={'X-API-Key': 'test-key'},
+                content_type='application/json'
+            )
+
+        assert response.status_code == 413
+        mock_store.assert_not_called()
+
+    def test_ingest_batch_invalid_api_key(self, client, sample_agent):
+        """POST /controller/api/ingest/batch should reject invalid API key."""
+        response = client.post('/controller/api/ingest/batch',
+            json={'agent_name': 'test-sensor', 'items': [{'scan_type': 'adsb', 'payload': {}}]},
+            headers={'X-API-Key': 'wrong-key'},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 401
+        data = json.loads(response.data)
+        assert 'Invalid API key' in data['message']
+
     def test_ingest_missing_agent_name(self, client):
         """POST /controller/api/ingest should require agent_name."""
         response = client.post('/controller/api/ingest',
@@ -0,0 +1,63 @@
+"""Tests for the TSCM frequency database lookups."""
+
+import pytest
+
+from data.tscm_frequencies import (
+    SURVEILLANCE_FREQUENCIES,
+    SWEEP_PRESETS,
+    get_all_sweep_presets,
+    get_frequency_risk,
+)
+
+
+def _linear_frequency_risk(frequency_mhz):
+    """Reference implementation: first matching range in declaration order."""
+    for ranges in SURVEILLANCE_FREQUENCIES.values():
+        for freq_range in ranges:
+            if freq_range['start'] <= frequency_mhz <= freq_range['end']:
+                return freq_range['risk'], freq_range['name']
+    return 'low', 'Unknown Band'
+
+
+class TestGetFrequencyRisk:
+    """Tests for get_frequency_risk()."""
+
+    @pytest.mark.parametrize('frequency, expected', [
+        (49.5, ('medium', '49 MHz Wireless Mics')),
+        (915.0, ('high', '900 MHz ISM Wireless')),
+        (929.0, ('high', '900 MHz Video TX')),
+        (433.92, ('medium', '433 MHz ISM Band')),
+        (1.0, ('low', 'Unknown Band')),
+        (10000.0, ('low', 'Unknown Band')),
+    ])
+    def test_known_frequencies(self, frequency, expected):
+        assert get_frequency_risk(frequency) == expected
+
+    def test_matches_first_range_on_boundaries(self):
+        """Overlapping ranges resolve to the first declared match, edges inclusive."""
+        edges = {
+            edge
+            for ranges in SURVEILLANCE_FREQUENCIES.values()
+            for freq_range in ranges
+            for edge in (freq_range['start'], freq_range['end'])
+        }
+        for edge in sorted(edges):
+            for frequency in (edge - 0.001, edge, edge + 0.001):
+                assert get_frequency_risk(frequency) == _linear_frequency_risk(frequency)
+
+
+class TestSweepPresets:
+    """Tests for sweep preset lookups."""
+
+    def test_all_presets_summarise_each_preset(self):
+        presets = get_all_sweep_presets()
+        assert set(presets) == set(SWEEP_PRESETS)
+        for name, summary in presets.items():
+            assert summary == {
+                'name': SWEEP_PRESETS[name]['name'],
+                'description': SWEEP_PRESETS[name]['description'],
+                'duration_seconds': SWEEP_PRESETS[name]['duration_seconds'],
+            }
+
+    def test_all_presets_is_built_once(self):
+        assert get_all_sweep_presets() is get_all_sweep_presets()
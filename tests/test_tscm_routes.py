@@ -0,0 +1,40 @@
+"""Tests for TSCM routes."""
+
+from __future__ import annotations
+
+import pytest
+
+from data.tscm_frequencies import SWEEP_PRESETS
+
+
+@pytest.fixture
+def auth_client(client):
+    """Client with logged-in session."""
+    with client.session_transaction() as sess:
+        sess['logged_in'] = True
+    return client
+
+
+class TestPresetRoutes:
+    """Tests for /tscm/presets endpoints."""
+
+    def test_list_presets(self, auth_client):
+        """GET /tscm/presets lists every sweep preset with an ETag."""
+        response = auth_client.get('/tscm/presets')
+        assert response.status_code == 200
+        assert response.headers['ETag']
+        data = response.get_json()
+        assert data['status'] == 'success'
+        assert set(data['presets']) == set(SWEEP_PRESETS)
+
+    def test_list_presets_not_modified(self, auth_client):
+        """GET /tscm/presets answers 304 when the ETag matches."""
+        etag = auth_client.get('/tscm/presets').headers['ETag']
+        response = auth_client.get('/tscm/presets', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_get_preset_unknown(self, auth_client):
+        """GET /tscm/presets/<name> returns 404 for unknown presets."""
+        response = auth_client.get('/tscm/presets/does-not-exist')
+        assert response.status_code == 404
@@ -241,17 +241,22 @@ class AdsbHistoryWriter:
     def _run(self) -> None:
         batch: list[dict] = []
         last_flush = time.time()
-
-        while not self._stop_event.is_set():
-            timeout = max(0.0, ADSB_HISTORY_FLUSH_INTERVAL - (time.time() - last_flush))
+        # Settings are fixed for the life of the writer, bind them once
+        batch_size = ADSB_HISTORY_BATCH_SIZE
+        flush_interval = ADSB_HISTORY_FLUSH_INTERVAL
+        stop_event = self._stop_event
+        get_item = self._queue.get
+
+        while not stop_event.is_set():
+            timeout = max(0.0, flush_interval - (time.time() - last_flush))
             try:
-                item = self._queue.get(timeout=timeout)
+                item = get_item(timeout=timeout)
                 batch.append(item)
             except queue.Empty:
                 pass
 
             now = time.time()
-            if batch and (len(batch) >= ADSB_HISTORY_BATCH_SIZE or now - last_flush >= ADSB_HISTORY_FLUSH_INTERVAL):
+            if batch and (len(batch) >= batch_size or now - last_flush >= flush_interval):
                 if self._flush(batch):
                     batch.clear()
                     last_flush = now
@@ -339,17 +344,22 @@ class AdsbSnapshotWriter:
     def _run(self) -> None:
         batch: list[dict] = []
         last_flush = time.time()
-
-        while not self._stop_event.is_set():
-            timeout = max(0.0, ADSB_HISTORY_FLUSH_INTERVAL - (time.time() - last_flush))
+        # Settings are fixed for the life of the writer, bind them once
+        batch_size = ADSB_HISTORY_BATCH_SIZE
+        flush_interval = ADSB_HISTORY_FLUSH_INTERVAL
+        stop_event = self._stop_event
+        get_item = self._queue.get
+
+        while not stop_event.is_set():
+            timeout = max(0.0, flush_interval - (time.time() - last_flush))
             try:
-                item = self._queue.get(timeout=timeout)
+                item = get_item(timeout=timeout)
                 batch.append(item)
             except queue.Empty:
                 pass
 
             now = time.time()
-            if batch and (len(batch) >= ADSB_HISTORY_BATCH_SIZE or now - last_flush >= ADSB_HISTORY_FLUSH_INTERVAL):
+            if batch and (len(batch) >= batch_size or now - last_flush >= flush_interval):
                 if self._flush(batch):
                     batch.clear()
                     last_flush = now
@@ -2108,6 +2108,33 @@ def delete_agent(agent_id: int) -> bool:
         return cursor.rowcount > 0
 
 
+def _insert_push_payload(conn: sqlite3.Connection, agent_id: int, item: dict) -> int:
+    """Insert one pushed payload (scan_type, interface, payload, received_at) and return its ID."""
+    scan_type = item.get('scan_type', 'unknown')
+    interface = item.get('interface')
+    payload = json.dumps(item.get('payload', {}))
+    received_at = item.get('received_at')
+    if received_at:
+        cursor = conn.execute('''
+            INSERT INTO push_payloads (agent_id, scan_type, interface, payload, received_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (agent_id, scan_type, interface, payload, received_at))
+    else:
+        cursor = conn.execute('''
+            INSERT INTO push_payloads (agent_id, scan_type, interface, payload)
+            VALUES (?, ?, ?, ?)
+        ''', (agent_id, scan_type, interface, payload))
+    return cursor.lastrowid
+
+
+def _touch_agent_last_seen(conn: sqlite3.Connection, agent_id: int) -> None:
+    """Mark an agent as seen now, after it pushed data."""
+    conn.execute(
+        'UPDATE agents SET last_seen = CURRENT_TIMESTAMP WHERE id = ?',
+        (agent_id,)
+    )
+
+
 def store_push_payload(
     agent_id: int,
     scan_type: str,
@@ -2122,24 +2149,34 @@ def store_push_payload(
         The ID of the created payload record
     """
     with get_db() as conn:
-        if received_at:
-            cursor = conn.execute('''
-                INSERT INTO push_payloads (agent_id, scan_type, interface, payload, received_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (agent_id, scan_type, interface, json.dumps(payload), received_at))
-        else:
-            cursor = conn.execute('''
-                INSERT INTO push_payloads (agent_id, scan_type, interface, payload)
-                VALUES (?, ?, ?, ?)
-            ''', (agent_id, scan_type, interface, json.dumps(payload)))
+        payload_id = _insert_push_payload(conn, agent_id, {
+            'scan_type': scan_type,
+            'interface': interface,
+            'payload': payload,
+            'received_at': received_at,
+        })
 
         # Update agent last_seen
-        conn.execute(
-            'UPDATE agents SET last_seen = CURRENT_TIMESTAMP WHERE id = ?',
-            (agent_id,)
-        )
+        _touch_agent_last_seen(conn, agent_id)
 
-        return cursor.lastrowid
+        return payload_id
+
+
+def store_push_payloads(agent_id: int, items: list[dict]) -> list[int]:
+    """
+    Store a batch of push payloads from a remote agent in one transaction.
+
+    Each item may contain scan_type, interface, payload and received_at, as
+    accepted by store_push_payload().
+
+    Returns:
+        The IDs of the created payload records, in input order
+    """
+    with get_db() as conn:
+        payload_ids = [_insert_push_payload(conn, agent_id, item) for item in items]
+        _touch_agent_last_seen(conn, agent_id)
+
+    return payload_ids
 
 
 def get_recent_payloads(